@@ -1,27 +1,56 @@
 from flask import Flask, request, send_file, jsonify
-from docx.api import Document
 import tempfile
 import os
 from flask_cors import CORS
 import re
 import io
 import json
-from docx.shared import Pt
 import string
 import time
 from functools import wraps
+from contextlib import contextmanager
+import errno
 import hashlib
+import hmac
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import queue
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque, namedtuple
 import gc
+import bisect
+import random
+import sys
+import heapq
+import itertools
+import tracemalloc
+
+import_started = time.perf_counter()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# python-docx costs ~50ms to import and only the document paths need it, so it is imported on
+# first use (by warm_up() at the latest) instead of delaying every worker and offline tool.
+def Document(docx=None):
+    from docx.api import Document as open_document
+    return open_document(docx)
+
+def Pt(points):
+    from docx.shared import Pt as points_length
+    return points_length(points)
+
+startup_timings = {}  # Start-up phase -> milliseconds, for /metrics and startup_report.py
+
+@contextmanager
+def startup_phase(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        startup_timings[name] = round((time.perf_counter() - started) * 1000, 2)
+
 app = Flask(__name__)
 CORS(app)
 
@@ -29,17 +58,276 @@ CORS(app)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['REQUEST_TIMEOUT'] = 30  # Back to 30 seconds for reliability
 app.config['MAX_CONCURRENT_REQUESTS'] = 10  # Back to reasonable limit
+app.config['READY_MAX_LOAD'] = 0.8  # /ready fails once this fraction of MAX_CONCURRENT_REQUESTS is in flight
+app.config['CIRCUIT_BREAKER_FAILURE_RATE'] = 0.5  # A stage's breaker opens at this share of failed calls...
+app.config['CIRCUIT_BREAKER_MIN_CALLS'] = 10  # ...over at least this many calls...
+app.config['CIRCUIT_BREAKER_WINDOW'] = 60  # ...in the last this many seconds
+app.config['CIRCUIT_BREAKER_RECOVERY_TIMEOUT'] = 60  # Seconds open before trial calls are let through
+app.config['CIRCUIT_BREAKER_HALF_OPEN_CALLS'] = 3  # Trial calls that must succeed to close again
 app.config['CACHE_TTL'] = 3600  # 1 hour cache TTL
 app.config['START_TIME'] = time.time()  # Track app start time
 app.config['FAST_MODE'] = False  # Disable aggressive fast mode
+app.config['PARAGRAPH_CACHE_MAX_ENTRIES'] = 20000  # Bound the per-paragraph feature cache
+app.config['FUZZY_MATCHING'] = False  # Typo-tolerant keyword matching (opt-in)
+app.config['FUZZY_LOOKUP_BUDGET'] = 200  # Max uncached fuzzy lookups per extraction
+app.config['TAXONOMY_PATH'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'keyword_taxonomy.json')
+# Seconds between taxonomy file checks (0 disables the watcher). gunicorn.conf.py turns it on, so a
+# change reaches every worker, not just the one that served /taxonomy/reload.
+app.config['TAXONOMY_WATCH_INTERVAL'] = float(os.environ.get('TAXONOMY_WATCH_INTERVAL', 0))
+app.config['KEYWORD_IDF_PATH'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'keyword_idf.json')
+app.config['KEYWORD_NEIGHBOURS_PATH'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'keyword_neighbours.json')
+# Compiled taxonomy, rebuilt whenever the taxonomy file or the compiled format changes
+app.config['TAXONOMY_COMPILED_PATH'] = os.environ.get('TAXONOMY_COMPILED_PATH') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'keyword_taxonomy.compiled.json')
+app.config['REQUEST_SUMMARY_LOGGING'] = True  # One structured JSON record per request
+app.config['VERBOSE_TRACE_SAMPLE_RATE'] = 0.0  # Fraction of requests whose DEBUG-level detail is logged at INFO
+# Each worker publishes its metrics here so any worker can answer a scrape for the whole host
+app.config['METRICS_DIR'] = os.environ.get('METRICS_DIR') or os.path.join(tempfile.gettempdir(), f'resume-metrics-{os.getpid()}')
+app.config['METRICS_FLUSH_INTERVAL'] = 1.0  # Seconds between metric snapshots (0 keeps metrics per worker)
+app.config['ADMIN_TOKEN'] = os.environ.get('ADMIN_TOKEN')  # Admin endpoints require it in X-Admin-Token; unset disables them
+app.config['WORKER_TIMEOUT'] = int(os.environ.get('GUNICORN_TIMEOUT', 60))  # gunicorn kills a worker busy for longer
+app.config['PROFILE_MAX_SECONDS'] = app.config['WORKER_TIMEOUT'] * 3 // 4  # A profile must end well before that
+# Opt-in tracemalloc: per-request and per-stage peak allocation plus /debug/memory snapshot diffs.
+# Tracing slows allocation-heavy code noticeably, so it is off unless MEMORY_TRACKING=1.
+app.config['MEMORY_TRACKING'] = os.environ.get('MEMORY_TRACKING') == '1'
+app.config['MEMORY_TRACE_FRAMES'] = 1  # Stack depth kept per allocation (1 is enough for file:line grouping)
+# Opt-in traffic capture for replay_traffic.py: request metadata goes to this JSONL file (unset disables
+# capture). Resume and form text are only kept, anonymized, when TRAFFIC_CAPTURE_PAYLOADS=1.
+app.config['TRAFFIC_CAPTURE_PATH'] = os.environ.get('TRAFFIC_CAPTURE_PATH')
+app.config['TRAFFIC_CAPTURE_PAYLOADS'] = os.environ.get('TRAFFIC_CAPTURE_PAYLOADS') == '1'
+# Keys the pseudonyms and digests; generated once in the gunicorn master so all workers share it
+app.config['TRAFFIC_CAPTURE_SALT'] = (os.environ.get('TRAFFIC_CAPTURE_SALT') or os.urandom(16).hex()).encode()
+app.config['TRAFFIC_CAPTURE_QUEUE_SIZE'] = 1000  # Records waiting for the writer; beyond this they are dropped
+# Young generation collected every 50k net allocations instead of 700: request garbage is mostly
+# freed by reference counting, and fewer collections mean fewer latency spikes
+app.config['GC_THRESHOLDS'] = (50000, 20, 20)
+
+gc.set_threshold(*app.config['GC_THRESHOLDS'])
+if app.config['MEMORY_TRACKING']:
+    tracemalloc.start(app.config['MEMORY_TRACE_FRAMES'])
 
 # Global caches and state
-keyword_cache = {}
-ats_score_cache = {}
+class TTLCache(dict):
+    """Cache dict used through get_cached_result/set_cached_result, with hit/miss/eviction counters"""
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.stats_lock = threading.Lock()  # Request threads share the cache, and += is not atomic
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def count(self, hits=0, misses=0, evictions=0):
+        with self.stats_lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+
+    def stats(self):
+        """(hits, misses, evictions), read together"""
+        with self.stats_lock:
+            return self.hits, self.misses, self.evictions
+
+keyword_cache = TTLCache('keyword')
+ats_score_cache = TTLCache('ats_score')
+paragraph_feature_cache = TTLCache('paragraph')  # Per-paragraph analysis keyed by paragraph content hash
 processing_queue = queue.Queue()
 executor = ThreadPoolExecutor(max_workers=app.config['MAX_CONCURRENT_REQUESTS'])
 active_requests = 0
 request_lock = threading.Lock()
+fuzzy_match_stats = {'lookups': 0, 'hits': 0, 'budget_exhausted': 0}
+fuzzy_stats_lock = threading.Lock()
+
+# --- Request logging and stage timing ---
+# Hot paths log per-paragraph detail through trace(), which costs nothing unless DEBUG is
+# enabled or the request was sampled. Every request ends with one structured summary record.
+request_logger = logging.getLogger(f'{__name__}.requests')
+
+# Per-request instrumentation state. A thread-local rather than flask.g: spans and cache lookups
+# touch it on hot paths, and an attribute lookup through g's context proxy costs ~2µs.
+request_state = threading.local()
+request_threads = set()  # Idents of the threads currently serving a request, for the profiler
+
+@app.before_request
+def start_request_log():
+    request_threads.add(threading.get_ident())
+    request_state.start = time.perf_counter_ns()
+    request_state.stage_timings = {}
+    request_state.cache_hits = 0
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        request_state.memory_base = request_state.memory_peak = tracemalloc.get_traced_memory()[0]
+        request_state.stage_memory = {}
+    else:
+        request_state.stage_memory = None
+    rate = app.config['VERBOSE_TRACE_SAMPLE_RATE']
+    request_state.verbose_trace = rate > 0 and random.random() < rate
+
+@app.teardown_request
+def end_request_log(exc):
+    request_threads.discard(threading.get_ident())
+    request_state.stage_timings = None
+    request_state.stage_memory = None
+    request_state.verbose_trace = False
+
+def trace_enabled():
+    """Whether verbose hot-path detail should be produced at all"""
+    return logger.isEnabledFor(logging.DEBUG) or getattr(request_state, 'verbose_trace', False)
+
+def trace(msg, *args):
+    """Log verbose detail: at DEBUG, or at INFO for sampled requests. Formatting is lazy."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(msg, *args)
+    elif getattr(request_state, 'verbose_trace', False):
+        logger.info(msg, *args)
+
+def fold_memory_peak():
+    """Fold tracemalloc's peak into the request's peak and restart peak tracking; returns traced bytes now.
+    tracemalloc counts the whole process, so with several request threads the figures overlap."""
+    current, peak = tracemalloc.get_traced_memory()
+    if peak > request_state.memory_peak:
+        request_state.memory_peak = peak
+    tracemalloc.reset_peak()
+    return current
+
+def request_memory_peak_kb():
+    """Peak traced allocation of the current request so far, or None when memory tracking is off"""
+    if getattr(request_state, 'stage_memory', None) is None:
+        return None
+    fold_memory_peak()
+    return round((request_state.memory_peak - request_state.memory_base) / 1024, 1)
+
+class Span:
+    """Times one request stage; repeated stages of the same name accumulate (nanoseconds).
+    With memory tracking on, also records the stage's peak allocation above its starting point."""
+    __slots__ = ('name', 'start', 'memory_start')
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0
+        self.memory_start = None
+
+    def __enter__(self):
+        if getattr(request_state, 'stage_memory', None) is not None:
+            self.memory_start = fold_memory_peak()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter_ns() - self.start
+        timings = getattr(request_state, 'stage_timings', None)
+        if timings is not None:  # Outside a request (benchmarks, warm-up) spans are not recorded
+            timings[self.name] = timings.get(self.name, 0) + elapsed
+            if self.memory_start is not None and request_state.stage_memory is not None:
+                peak = tracemalloc.get_traced_memory()[1]
+                fold_memory_peak()
+                stage_memory = request_state.stage_memory
+                stage_memory[self.name] = max(stage_memory.get(self.name, 0), peak - self.memory_start)
+        return False
+
+timed_stage = Span
+
+def stage_timings_ms():
+    """Stage durations of the current request in milliseconds"""
+    return {name: round(ns / 1e6, 2) for name, ns in (getattr(request_state, 'stage_timings', None) or {}).items()}
+
+class LatencyHistogram:
+    """Latency histogram with logarithmic buckets: fixed size, quantiles within one bucket (20%)"""
+    BUCKET_BOUNDS_MS = tuple(0.01 * 1.2 ** i for i in range(90))  # 10µs .. ~130s, then overflow
+    __slots__ = ('counts', 'count', 'total_ms', 'max_ms')
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms):
+        self.counts[bisect.bisect_left(self.BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th observation, capped at the maximum seen"""
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if bucket_count and seen >= rank:
+                bound = self.BUCKET_BOUNDS_MS[index] if index < len(self.BUCKET_BOUNDS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return 0.0
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(self.quantile(0.50), 3),
+            'p95_ms': round(self.quantile(0.95), 3),
+            'p99_ms': round(self.quantile(0.99), 3),
+            'max_ms': round(self.max_ms, 3)
+        }
+
+stage_histograms = {}  # (endpoint rule, stage) -> LatencyHistogram; stage 'total' is the whole request
+request_counts = defaultdict(int)  # (endpoint rule, method, status) -> requests
+memory_peaks = {}  # (endpoint rule, stage) -> largest peak traced allocation seen, in bytes
+stage_histograms_lock = threading.Lock()
+
+def latency_snapshot():
+    """Per-endpoint, per-stage latency percentiles"""
+    with stage_histograms_lock:
+        items = [(key, histogram.snapshot()) for key, histogram in stage_histograms.items()]
+    latency = {}
+    for (endpoint, stage), snapshot in sorted(items):
+        latency.setdefault(endpoint, {})[stage] = snapshot
+    return latency
+
+PROBE_PATHS = frozenset({'/live', '/ready'})  # Probed every second or so: counted, but not logged or captured
+
+@app.after_request
+def log_request_summary(response):
+    now = time.perf_counter_ns()
+    duration_ms = (now - getattr(request_state, 'start', now)) / 1e6
+    timings = getattr(request_state, 'stage_timings', None) or {}
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    observations = [(stage, ns / 1e6) for stage, ns in timings.items()]
+    observations.append(('total', duration_ms))
+    stage_memory = getattr(request_state, 'stage_memory', None)
+    if stage_memory is not None:
+        stage_memory = dict(stage_memory, total=request_memory_peak_kb() * 1024)
+    with stage_histograms_lock:
+        request_counts[(endpoint, request.method, response.status_code)] += 1
+        for stage, ms in observations:
+            histogram = stage_histograms.get((endpoint, stage))
+            if histogram is None:
+                histogram = stage_histograms[(endpoint, stage)] = LatencyHistogram()
+            histogram.observe(ms)
+        for stage, peak in (stage_memory or {}).items():
+            if peak > memory_peaks.get((endpoint, stage), 0):
+                memory_peaks[(endpoint, stage)] = peak
+
+    if timings:
+        response.headers['Server-Timing'] = ', '.join(f'{stage};dur={ns / 1e6:.2f}' for stage, ns in timings.items())
+
+    if app.config['REQUEST_SUMMARY_LOGGING'] and request.path not in PROBE_PATHS and request_logger.isEnabledFor(logging.INFO):
+        summary = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'duration_ms': round(duration_ms, 2),
+            'request_bytes': request.content_length or 0,
+            'stages_ms': stage_timings_ms(),
+            'traced': getattr(request_state, 'verbose_trace', False)
+        }
+        if stage_memory is not None:
+            summary['stages_memory_kb'] = {stage: round(peak / 1024, 1) for stage, peak in stage_memory.items()}
+        request_logger.info('%s', json.dumps(summary, separators=(',', ':')))
+    return response
 
 # Pre-compiled regex patterns for maximum performance
 WORD_BOUNDARY_PATTERN = re.compile(r'\b\w+\b')
@@ -49,109 +337,295 @@ SKILL_PATTERNS = [
     re.compile(r'languages?:\s*([\w\s,;&]+)', re.IGNORECASE),
 ]
 
-# Fast keyword lookup set (pre-computed for speed)
-FAST_KEYWORDS = {
-    'python', 'java', 'javascript', 'react', 'node', 'sql', 'aws', 'docker', 'kubernetes',
-    'html', 'css', 'git', 'mongodb', 'postgresql', 'redis', 'nginx', 'apache',
-    'linux', 'ubuntu', 'centos', 'debian', 'windows', 'macos', 'ios', 'android',
-    'agile', 'scrum', 'kanban', 'devops', 'ci/cd', 'jenkins', 'github', 'gitlab',
-    'azure', 'gcp', 'heroku', 'digitalocean', 'vps', 'vpc', 'ec2', 's3', 'lambda',
-    'typescript', 'vue', 'angular', 'express', 'django', 'flask', 'spring', 'laravel',
-    'php', 'ruby', 'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'julia',
-    'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib',
-    'tableau', 'powerbi', 'excel', 'word', 'powerpoint', 'outlook', 'teams', 'slack',
-    'jira', 'confluence', 'notion', 'figma', 'sketch', 'adobe', 'photoshop', 'illustrator'
-}
+# --- Failure classification ---
+# What a failure means decides how it is handled:
+#   bad_input  the request can never succeed (e.g. not a .docx): 4xx at once, never retried
+#   deadline   the request ran out of time: 408, not retried
+#   transient  I/O that may succeed on a second try (timeouts, dropped connections, EAGAIN, out of
+#              file handles): retried with jitter within the deadline
+#   internal   anything else - our bugs and permanent I/O errors (a missing file, no permission);
+#              retrying would fail the same way
+# Only internal failures count toward circuit breakers: bad input is the caller's fault, and
+# transient trouble is already absorbed by retries.
+class ProcessingError(Exception):
+    """A classified failure, answered with its HTTP status and message"""
+    kind = 'internal'
+    status = 500
+
+class BadInputError(ProcessingError):
+    kind = 'bad_input'
+    status = 400
+
+class DeadlineExceededError(ProcessingError):
+    kind = 'deadline'
+    status = 408
+
+class TransientError(ProcessingError):
+    kind = 'transient'
+    status = 503
+
+class CircuitOpenError(ProcessingError):
+    kind = 'rejected'
+    status = 503
+
+BREAKER_FAILURE_KINDS = frozenset({'internal'})
+TRANSIENT_ERRNOS = frozenset({errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR, errno.EBUSY, errno.ETIMEDOUT,
+                              errno.EMFILE, errno.ENFILE})
+
+def error_kind(error):
+    """Classify an exception: classified errors carry their kind; timeouts, connection errors and
+    OSErrors with a try-again errno are transient; anything else is internal"""
+    if isinstance(error, ProcessingError):
+        return error.kind
+    if isinstance(error, (TimeoutError, ConnectionError, BlockingIOError, InterruptedError)):
+        return 'transient'
+    if isinstance(error, OSError) and error.errno in TRANSIENT_ERRNOS:
+        return 'transient'
+    return 'internal'
+
+def request_deadline():
+    """time.monotonic() deadline of the current request, set by timeout_handler (None outside one)"""
+    return getattr(request_state, 'deadline', None)
+
+def open_resume_document(source):
+    """Parse an uploaded resume. A file python-docx cannot read (not a zip, no document part,
+    malformed XML) is bad input; I/O and memory errors are still ours."""
+    try:
+        return Document(source)
+    except (OSError, MemoryError):
+        raise
+    except Exception as e:
+        trace("Unreadable resume upload: %r", e)
+        raise BadInputError('The uploaded file is not a readable Word document. Please upload a .docx file.') from e
+
+@app.errorhandler(ProcessingError)
+def processing_error_response(error):
+    return jsonify({'error': str(error)}), error.status
 
 # Retry mechanism and circuit breaker
+# One breaker per pipeline stage, so a stage that keeps failing (a python-docx bug on some
+# documents, a full disk at export) fails fast on its own while requests that do not need it
+# carry on. Breakers are shared by every request thread of a worker; all state is under a lock.
 class CircuitBreaker:
-    def __init__(self, failure_threshold=5, recovery_timeout=60):
-        self.failure_threshold = failure_threshold
+    """Opens when at least min_calls calls in the last window_seconds ran and failure_rate of them
+    failed. After recovery_timeout, up to half_open_max_calls trial calls are let through: the breaker
+    closes once that many succeed and reopens on the first failure. clock is a time.monotonic()
+    stand-in, for tests."""
+
+    def __init__(self, name, failure_rate=0.5, min_calls=10, window_seconds=60, recovery_timeout=60, half_open_max_calls=3,
+                 clock=time.monotonic):
+        self.name = name
+        self.clock = clock
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
         self.recovery_timeout = recovery_timeout
-        self.failure_count = 0
-        self.last_failure_time = 0
+        self.half_open_max_calls = half_open_max_calls
+        self.lock = threading.Lock()
         self.state = 'CLOSED'  # CLOSED, OPEN, HALF_OPEN
-    
-    def call(self, func, *args, **kwargs):
-        if self.state == 'OPEN':
-            if time.time() - self.last_failure_time > self.recovery_timeout:
-                self.state = 'HALF_OPEN'
+        self.opened_at = 0.0
+        self.window = deque()  # [second, calls, failures], oldest first
+        self.trials_in_flight = 0
+        self.trial_successes = 0
+        self.transitions = {'OPEN': 0, 'HALF_OPEN': 0, 'CLOSED': 0}  # Entries into each state
+        self.rejections = 0
+
+    def transition(self, state):
+        """Enter state (lock held)"""
+        logger.warning("Circuit breaker %s: %s -> %s", self.name, self.state, state)
+        self.state = state
+        self.transitions[state] += 1
+        self.trials_in_flight = self.trial_successes = 0
+        if state == 'OPEN':
+            self.opened_at = self.clock()
+        elif state == 'CLOSED':
+            self.window.clear()  # Failures from before the outage must not reopen it
+
+    def window_totals(self, now):
+        """(calls, failures) in the rolling window, dropping expired seconds (lock held)"""
+        while self.window and self.window[0][0] <= now - self.window_seconds:
+            self.window.popleft()
+        return sum(bucket[1] for bucket in self.window), sum(bucket[2] for bucket in self.window)
+
+    def acquire(self):
+        """Admit a call or raise CircuitOpenError; returns whether the call is a half-open trial"""
+        with self.lock:
+            if self.state == 'OPEN':
+                if self.clock() - self.opened_at < self.recovery_timeout:
+                    self.rejections += 1
+                    raise CircuitOpenError("Service temporarily unavailable. Please try again in a minute.")
+                self.transition('HALF_OPEN')
+            if self.state == 'HALF_OPEN':
+                if self.trials_in_flight + self.trial_successes >= self.half_open_max_calls:
+                    self.rejections += 1
+                    raise CircuitOpenError("Service temporarily unavailable. Please try again in a minute.")
+                self.trials_in_flight += 1
+                return True
+            return False
+
+    def record(self, error, trial):
+        """Count the outcome of an admitted call (error is None on success)"""
+        if error is not None and error_kind(error) not in BREAKER_FAILURE_KINDS:
+            failed = None  # The caller's fault, out of time or retried: not a sign the stage is broken
+        else:
+            failed = error is not None
+        with self.lock:
+            if trial:
+                self.trials_in_flight -= 1
+                if self.state != 'HALF_OPEN' or failed is None:
+                    return  # Another trial already decided, or this one proved nothing
+                if failed:
+                    self.transition('OPEN')
+                else:
+                    self.trial_successes += 1
+                    if self.trial_successes >= self.half_open_max_calls:
+                        self.transition('CLOSED')
+                return
+            if self.state != 'CLOSED' or failed is None:
+                return  # Calls admitted before the breaker opened say nothing new
+            now = self.clock()
+            second = int(now)
+            if self.window and self.window[-1][0] == second:
+                bucket = self.window[-1]
             else:
-                raise Exception("Circuit breaker is OPEN")
-        
+                bucket = [second, 0, 0]
+                self.window.append(bucket)
+            bucket[1] += 1
+            if failed:
+                bucket[2] += 1
+                calls, failures = self.window_totals(now)
+                if calls >= self.min_calls and failures >= self.failure_rate * calls:
+                    self.transition('OPEN')
+
+    @contextmanager
+    def guard(self):
+        """Run the body as one call through the breaker"""
+        trial = self.acquire()
         try:
-            result = func(*args, **kwargs)
-            if self.state == 'HALF_OPEN':
-                self.state = 'CLOSED'
-                self.failure_count = 0
-            return result
+            yield
         except Exception as e:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-            
-            if self.failure_count >= self.failure_threshold:
-                self.state = 'OPEN'
-            
-            raise e
+            self.record(e, trial)
+            raise
+        self.record(None, trial)
 
-# Global circuit breakers
-optimization_circuit_breaker = CircuitBreaker()
-keyword_circuit_breaker = CircuitBreaker()
+    def call(self, func, *args, **kwargs):
+        with self.guard():
+            return func(*args, **kwargs)
+
+    def allows_requests(self):
+        """Whether a call now could be attempted (an OPEN breaker past its timeout lets trials through)"""
+        with self.lock:
+            return self.state != 'OPEN' or self.clock() - self.opened_at >= self.recovery_timeout
+
+    def snapshot(self):
+        with self.lock:
+            calls, failures = self.window_totals(self.clock())
+            return {
+                'state': self.state,
+                'window_calls': calls,
+                'window_failures': failures,
+                'transitions': dict(self.transitions),
+                'rejections': self.rejections
+            }
+
+# Global circuit breakers, one per guarded stage; rescoring shares the score stage's breaker
+stage_circuit_breakers = {
+    name: CircuitBreaker(
+        name,
+        failure_rate=app.config['CIRCUIT_BREAKER_FAILURE_RATE'],
+        min_calls=app.config['CIRCUIT_BREAKER_MIN_CALLS'],
+        window_seconds=app.config['CIRCUIT_BREAKER_WINDOW'],
+        recovery_timeout=app.config['CIRCUIT_BREAKER_RECOVERY_TIMEOUT'],
+        half_open_max_calls=app.config['CIRCUIT_BREAKER_HALF_OPEN_CALLS']
+    )
+    for name in ('parse', 'score', 'serialize')
+}
+STAGE_BREAKERS = {'parse': 'parse', 'score': 'score', 'rescore': 'score', 'serialize': 'serialize'}
 
-def retry_with_backoff(func, max_retries=3, base_delay=1):
-    """Retry function with exponential backoff"""
+@contextmanager
+def guarded_stage(name):
+    """timed_stage, run through the stage's circuit breaker"""
+    with stage_circuit_breakers[STAGE_BREAKERS[name]].guard(), timed_stage(name):
+        yield
+
+def retry_with_backoff(func, max_retries=3, base_delay=1, deadline=None):
+    """Retry transient failures with jittered exponential backoff; anything else is raised at once.
+    Never sleeps past deadline (a time.monotonic() value)."""
     for attempt in range(max_retries):
+        if deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceededError('Processing took too long. Please try with a smaller file or shorter job description.')
         try:
             return func()
         except Exception as e:
-            if attempt == max_retries - 1:
-                raise e
-            
-            delay = base_delay * (2 ** attempt)
+            if error_kind(e) != 'transient':
+                raise
+            # Full jitter: concurrent retries after a shared hiccup spread out instead of colliding
+            delay = random.uniform(0, base_delay * (2 ** attempt))
+            if attempt == max_retries - 1 or (deadline is not None and time.monotonic() + delay >= deadline):
+                if isinstance(e, ProcessingError):
+                    raise
+                raise TransientError('Temporarily unable to process the resume. Please try again in a moment.') from e
+            logger.warning("Transient failure (%s), retry attempt %d in %.2fs", e, attempt + 1, delay)
             time.sleep(delay)
-            logger.warning(f"Retry attempt {attempt + 1}")
-    
-    # This should never be reached, but just in case
-    raise Exception("Max retries exceeded")
 
 # Health check endpoint
+# Probes: none of these take an admission slot (no timeout_handler) or run any resume processing,
+# so they stay fast and truthful while the worker is saturated with real requests.
+@app.route('/live', methods=['GET'])
+def liveness_check():
+    """Liveness probe: the process is up and serving requests. Does no work."""
+    return jsonify({'status': 'alive'}), 200
+
+def readiness_checks():
+    """Whether this worker should receive traffic, and why not"""
+    max_active = app.config['MAX_CONCURRENT_REQUESTS'] * app.config['READY_MAX_LOAD']
+    # Only the parse breaker gates readiness. Every resume endpoint parses, so with it open the worker
+    # can serve nothing. An open score or serialize breaker still leaves the other endpoints working
+    # (scoring without export, export without rescoring), and the stage fault behind it (a python-docx
+    # bug, a full disk) hits every worker alike: failing readiness would pull all of them out of
+    # rotation and turn a degraded service into an outage. Those stages are reported as degraded.
+    checks = {
+        'warm': ready_event.is_set(),
+        'load': active_requests < max_active,
+        'circuit_breakers': stage_circuit_breakers['parse'].allows_requests()
+    }
+    details = {
+        'active_requests': active_requests,
+        'max_active_requests': max_active,
+        'circuit_breakers': {name: breaker.state for name, breaker in stage_circuit_breakers.items()},
+        'degraded_stages': sorted(name for name, breaker in stage_circuit_breakers.items() if not breaker.allows_requests())
+    }
+    return checks, details
+
+@app.route('/ready', methods=['GET'])
+def readiness_check():
+    """Readiness probe: warm tables are in place, the worker is not saturated and documents can be parsed"""
+    checks, details = readiness_checks()
+    ready = all(checks.values())
+    return jsonify({'status': 'ready' if ready else 'not_ready', 'checks': checks, **details}), 200 if ready else 503
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for monitoring"""
-    try:
-        # Check if we can process a simple request
-        test_text = "test resume content"
-        test_job = "test job description"
-        
-        # Quick cache test
-        get_cache_key('test', test_text)
-        
-        # Quick keyword extraction test
-        extract_technical_keywords_optimized(test_job)
-        
-        return jsonify({
-            'status': 'healthy',
-            'timestamp': time.time(),
-            'cache_size': len(keyword_cache) + len(ats_score_cache),
-            'active_requests': active_requests,
-            'memory_usage': 'OK'
-        }), 200
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return jsonify({
-            'status': 'unhealthy',
-            'error': str(e),
-            'timestamp': time.time()
-        }), 503
+    checks, _ = readiness_checks()
+    return jsonify({
+        'status': 'healthy',
+        'ready': all(checks.values()),
+        'timestamp': time.time(),
+        'cache_size': len(keyword_cache) + len(ats_score_cache) + len(paragraph_feature_cache),
+        'active_requests': active_requests,
+        'memory_usage': 'OK'
+    }), 200
 
 # Cache cleanup endpoint
 @app.route('/cache/clear', methods=['POST'])
 def clear_cache():
     """Clear all caches (admin endpoint)"""
     try:
-        global keyword_cache, ats_score_cache
+        global keyword_cache, ats_score_cache, paragraph_feature_cache
         keyword_cache.clear()
         ats_score_cache.clear()
+        paragraph_feature_cache.clear()
         cleanup_temp_files()
         gc.collect()
         
@@ -160,27 +634,332 @@ def clear_cache():
             'timestamp': time.time()
         }), 200
     except Exception as e:
-        logger.error(f"Cache clear failed: {e}")
+        logger.error("Cache clear failed: %s", e)
         return jsonify({'error': str(e)}), 500
 
+# --- Metrics export ---
+# Each worker writes a snapshot of its counters to METRICS_DIR every METRICS_FLUSH_INTERVAL
+# seconds; /metrics sums the snapshots of every worker, so a scrape sees the whole host.
+# Snapshot files are named by PID and worker start time, so a reused PID never shares a file, and
+# a snapshot not rewritten for METRICS_STALE_INTERVALS flushes belongs to an exited worker and is
+# deleted (gunicorn.conf.py also deletes it as soon as the worker exits).
+METRICS_EXPORT_BUCKETS = range(3, len(LatencyHistogram.BUCKET_BOUNDS_MS), 4)  # Every 4th bound: ~2x apart
+CIRCUIT_BREAKER_STATE_VALUES = {'CLOSED': 0, 'HALF_OPEN': 1, 'OPEN': 2}
+METRICS_SNAPSHOT_VERSION = 4  # Bump when the snapshot layout changes; readers skip other versions
+METRICS_STALE_INTERVALS = 5
+metrics_flusher_pid = None
+metrics_flusher_lock = threading.Lock()
+metrics_worker_identity = None  # (pid, start time in ms) of this worker, reset in a forked child
+
+def cache_hit_rate():
+    """Share of lookups across all caches answered from cache"""
+    stats = [cache.stats() for cache in (keyword_cache, ats_score_cache, paragraph_feature_cache)]
+    hits = sum(cache_hits for cache_hits, _, _ in stats)
+    lookups = hits + sum(misses for _, misses, _ in stats)
+    return round(hits / lookups, 4) if lookups else 0.0
+
+def resident_memory_bytes():
+    """Current RSS of this process (Linux /proc), falling back to the peak RSS elsewhere"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024  # bytes on macOS, KiB on Linux
+
+def estimate_cache_bytes(cache, sample_size=256):
+    """Approximate memory held by a cache, extrapolated from the containers of a sample of entries.
+    Interned strings shared between entries are counted in each one, so this errs high."""
+    def container_size(value):
+        size = sys.getsizeof(value)
+        if isinstance(value, dict):
+            size += sum(sys.getsizeof(item) for item in value.values())
+        elif isinstance(value, (tuple, list, set, frozenset)):
+            size += sum(sys.getsizeof(item) for item in value)
+        return size
+
+    entries = len(cache)
+    if not entries:
+        return 0
+    try:
+        sample = list(itertools.islice(cache.items(), sample_size))
+    except RuntimeError:  # Resized by a request thread while sampling
+        return 0
+    sampled = sum(sys.getsizeof(key) + sys.getsizeof(entry) + sys.getsizeof(entry[0]) + container_size(entry[1])
+                  for key, entry in sample)  # entry is (timestamp, result)
+    return int(sampled * entries / len(sample)) + sys.getsizeof(cache)
+
+def temp_file_usage():
+    """Count and size of the tmp*.docx files in the temp directory (uploads and exports awaiting cleanup)"""
+    count = size = 0
+    temp_dir = tempfile.gettempdir()
+    try:
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('tmp') and entry.name.endswith('.docx'):
+                    try:
+                        size += entry.stat().st_size
+                        count += 1
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+    return count, size
+
+def collect_worker_metrics():
+    """This worker's counters, gauges and histograms as a JSON-serialisable snapshot"""
+    with stage_histograms_lock:
+        requests_snapshot = [[*key, count] for key, count in request_counts.items()]
+        histograms = [
+            [*key, {index: count for index, count in enumerate(histogram.counts) if count}, histogram.total_ms, histogram.count]
+            for key, histogram in stage_histograms.items()
+        ]
+        peaks = [[*key, peak] for key, peak in memory_peaks.items()]
+    return {
+        'version': METRICS_SNAPSHOT_VERSION,
+        'pid': os.getpid(),
+        'requests': requests_snapshot,
+        'histograms': histograms,
+        'caches': [[cache.name, *cache.stats(), len(cache), estimate_cache_bytes(cache)]
+                   for cache in (keyword_cache, ats_score_cache, paragraph_feature_cache)],
+        'rss_bytes': resident_memory_bytes(),
+        'ready': ready_event.is_set(),
+        'memory_peaks': peaks,
+        'active_requests': active_requests,
+        'circuit_breakers': {name: breaker.snapshot() for name, breaker in stage_circuit_breakers.items()}
+    }
+
+def metrics_snapshot_name():
+    """This worker's snapshot file name: worker_<pid>_<start time in ms>.json"""
+    global metrics_worker_identity
+    pid = os.getpid()
+    with metrics_flusher_lock:
+        if metrics_worker_identity is None or metrics_worker_identity[0] != pid:
+            metrics_worker_identity = (pid, int(time.time() * 1000))
+        return f'worker_{pid}_{metrics_worker_identity[1]}.json'
+
+def write_worker_metrics():
+    """Publish this worker's snapshot atomically, so readers never see a partial file"""
+    directory = app.config['METRICS_DIR']
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, metrics_snapshot_name())
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(collect_worker_metrics(), f, separators=(',', ':'))
+    os.replace(path + '.tmp', path)
+
+def flush_worker_metrics():
+    """Publish snapshots until metrics sharing is switched off"""
+    while app.config['METRICS_FLUSH_INTERVAL'] > 0:
+        time.sleep(app.config['METRICS_FLUSH_INTERVAL'])
+        try:
+            write_worker_metrics()
+        except OSError as e:
+            logger.warning("Metrics snapshot failed: %s", e)
+
+@app.before_request
+def ensure_metrics_flusher():
+    """Start the snapshot thread once per worker process (threads do not survive a fork)"""
+    global metrics_flusher_pid
+    if app.config['METRICS_FLUSH_INTERVAL'] <= 0 or metrics_flusher_pid == os.getpid():
+        return
+    with metrics_flusher_lock:
+        if metrics_flusher_pid == os.getpid():
+            return
+        metrics_flusher_pid = os.getpid()
+    threading.Thread(target=flush_worker_metrics, name='metrics-flusher', daemon=True).start()
+
+def process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def read_host_metrics():
+    """Snapshots of every worker on the host, this one taken fresh. Stale snapshots are deleted."""
+    own = collect_worker_metrics()
+    snapshots = [own]
+    directory = app.config['METRICS_DIR']
+    if app.config['METRICS_FLUSH_INTERVAL'] > 0 and os.path.isdir(directory):
+        own_name = metrics_snapshot_name()
+        stale_before = time.time() - METRICS_STALE_INTERVALS * app.config['METRICS_FLUSH_INTERVAL']
+        for name in os.listdir(directory):
+            if not (name.startswith('worker_') and name.endswith('.json')) or name == own_name:
+                continue
+            path = os.path.join(directory, name)
+            try:
+                if os.path.getmtime(path) < stale_before:
+                    os.remove(path)  # Its worker exited without a child_exit hook to clean up
+                    continue
+                with open(path, encoding='utf-8') as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue  # Removed or replaced while listing
+            if snapshot.get('version') != METRICS_SNAPSHOT_VERSION:
+                continue  # Written by a different release sharing the directory
+            # Until its snapshot is removed, an exited worker's counters still count; its gauges do not
+            snapshot['alive'] = process_alive(snapshot['pid'])
+            snapshots.append(snapshot)
+    own['alive'] = True
+    return snapshots
+
+def prometheus_labels(**labels):
+    """Render a label set, escaping values as the exposition format requires"""
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in labels.items()) + '}'
+
+def render_prometheus(snapshots):
+    """Sum worker snapshots into the Prometheus text exposition format (version 0.0.4)"""
+    requests_total = defaultdict(int)
+    histograms = {}
+    caches = {}
+    for snapshot in snapshots:
+        for endpoint, method, status, count in snapshot['requests']:
+            requests_total[(endpoint, method, status)] += count
+        for endpoint, stage, counts, total_ms, count in snapshot['histograms']:
+            merged = histograms.setdefault((endpoint, stage), [defaultdict(int), 0.0, 0])
+            for index, bucket_count in counts.items():
+                merged[0][int(index)] += bucket_count  # JSON object keys come back as strings
+            merged[1] += total_ms
+            merged[2] += count
+        for name, hits, misses, evictions, size, size_bytes in snapshot['caches']:
+            totals = caches.setdefault(name, [0, 0, 0, 0, 0])
+            totals[0] += hits
+            totals[1] += misses
+            totals[2] += evictions
+            if snapshot['alive']:
+                totals[3] += size
+                totals[4] += size_bytes
+    live = [snapshot for snapshot in snapshots if snapshot['alive']]
+
+    lines = []
+    def family(name, kind, help_text):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+
+    family('resume_requests_total', 'counter', 'Requests handled, by endpoint, method and status')
+    for (endpoint, method, status), count in sorted(requests_total.items()):
+        lines.append(f'resume_requests_total{prometheus_labels(endpoint=endpoint, method=method, status=status)} {count}')
+
+    def histogram_lines(metric, labels, counts, total_ms, count):
+        bounds = LatencyHistogram.BUCKET_BOUNDS_MS
+        cumulative = list(itertools.accumulate(counts.get(index, 0) for index in range(len(bounds))))
+        for index in METRICS_EXPORT_BUCKETS:
+            lines.append(f"{metric}_bucket{prometheus_labels(**labels, le=f'{bounds[index] / 1000:.6g}')} {cumulative[index]}")
+        lines.append(f"{metric}_bucket{prometheus_labels(**labels, le='+Inf')} {count}")
+        lines.append(f'{metric}_sum{prometheus_labels(**labels)} {total_ms / 1000:.6f}')
+        lines.append(f'{metric}_count{prometheus_labels(**labels)} {count}')
+
+    family('resume_request_duration_seconds', 'histogram', 'Request latency, by endpoint')
+    for (endpoint, stage), merged in sorted(histograms.items()):
+        if stage == 'total':
+            histogram_lines('resume_request_duration_seconds', {'endpoint': endpoint}, *merged)
+    family('resume_stage_duration_seconds', 'histogram', 'Latency of each pipeline stage, by endpoint and stage')
+    for (endpoint, stage), merged in sorted(histograms.items()):
+        if stage != 'total':
+            histogram_lines('resume_stage_duration_seconds', {'endpoint': endpoint, 'stage': stage}, *merged)
+
+    for position, (metric, help_text) in enumerate((
+        ('resume_cache_hits_total', 'Cache lookups answered from cache'),
+        ('resume_cache_misses_total', 'Cache lookups that had to compute the result'),
+        ('resume_cache_evictions_total', 'Cache entries dropped for age or size')
+    )):
+        family(metric, 'counter', help_text)
+        for name, totals in sorted(caches.items()):
+            lines.append(f'{metric}{prometheus_labels(cache=name)} {totals[position]}')
+    family('resume_cache_entries', 'gauge', 'Entries held in each cache, summed over live workers')
+    for name, totals in sorted(caches.items()):
+        lines.append(f'resume_cache_entries{prometheus_labels(cache=name)} {totals[3]}')
+    family('resume_cache_bytes', 'gauge', 'Estimated memory held by each cache, summed over live workers')
+    for name, totals in sorted(caches.items()):
+        lines.append(f'resume_cache_bytes{prometheus_labels(cache=name)} {totals[4]}')
+
+    family('resume_worker_resident_memory_bytes', 'gauge', 'Resident set size of each live worker (shared pages count in each)')
+    for snapshot in sorted(live, key=lambda snapshot: snapshot['pid']):
+        lines.append(f"resume_worker_resident_memory_bytes{prometheus_labels(pid=snapshot['pid'])} {snapshot['rss_bytes']}")
+    family('resume_worker_ready', 'gauge', 'Whether each live worker has finished warming up (1) or not (0)')
+    for snapshot in sorted(live, key=lambda snapshot: snapshot['pid']):
+        lines.append(f"resume_worker_ready{prometheus_labels(pid=snapshot['pid'])} {int(snapshot.get('ready', True))}")
+    family('resume_peak_traced_memory_bytes', 'gauge',
+           'Largest peak tracemalloc allocation of a request or stage (MEMORY_TRACKING=1 only), max over live workers')
+    peaks = {}
+    for snapshot in live:
+        for endpoint, stage, peak in snapshot['memory_peaks']:
+            peaks[(endpoint, stage)] = max(peaks.get((endpoint, stage), 0), peak)
+    for (endpoint, stage), peak in sorted(peaks.items()):
+        lines.append(f'resume_peak_traced_memory_bytes{prometheus_labels(endpoint=endpoint, stage=stage)} {int(peak)}')
+    temp_files, temp_bytes = temp_file_usage()
+    family('resume_temp_files', 'gauge', 'Upload and export temp files awaiting cleanup')
+    lines.append(f'resume_temp_files {temp_files}')
+    family('resume_temp_file_bytes', 'gauge', 'Size of the upload and export temp files awaiting cleanup')
+    lines.append(f'resume_temp_file_bytes {temp_bytes}')
+
+    family('resume_active_requests', 'gauge', 'Requests in flight (admission queue depth), summed over live workers')
+    lines.append(f"resume_active_requests {sum(snapshot['active_requests'] for snapshot in live)}")
+    family('resume_max_concurrent_requests', 'gauge', 'Admission limit per worker')
+    lines.append(f"resume_max_concurrent_requests {app.config['MAX_CONCURRENT_REQUESTS']}")
+    family('resume_workers', 'gauge', 'Live worker processes reporting metrics')
+    lines.append(f'resume_workers {len(live)}')
+    family('resume_circuit_breaker_state', 'gauge', 'Worst circuit breaker state over live workers: 0 closed, 1 half-open, 2 open')
+    breakers = sorted({name for snapshot in snapshots for name in snapshot['circuit_breakers']})
+    for breaker in breakers:
+        worst = max((CIRCUIT_BREAKER_STATE_VALUES[snapshot['circuit_breakers'][breaker]['state']]
+                     for snapshot in live if breaker in snapshot['circuit_breakers']), default=0)
+        lines.append(f'resume_circuit_breaker_state{prometheus_labels(breaker=breaker)} {worst}')
+    family('resume_circuit_breaker_transitions_total', 'counter', 'Circuit breaker state changes, by breaker and state entered')
+    for breaker in breakers:
+        for state in CIRCUIT_BREAKER_STATE_VALUES:
+            count = sum(snapshot['circuit_breakers'][breaker]['transitions'][state]
+                        for snapshot in snapshots if breaker in snapshot['circuit_breakers'])
+            lines.append(f'resume_circuit_breaker_transitions_total{prometheus_labels(breaker=breaker, state=state)} {count}')
+    family('resume_circuit_breaker_rejections_total', 'counter', 'Calls refused by an open or half-open circuit breaker')
+    for breaker in breakers:
+        count = sum(snapshot['circuit_breakers'][breaker]['rejections'] for snapshot in snapshots if breaker in snapshot['circuit_breakers'])
+        lines.append(f'resume_circuit_breaker_rejections_total{prometheus_labels(breaker=breaker)} {count}')
+    return '\n'.join(lines) + '\n'
+
 # Performance monitoring endpoint
 @app.route('/metrics', methods=['GET'])
 def get_metrics():
-    """Get performance metrics"""
+    """Prometheus metrics for every worker on the host; ?format=json for this worker's detailed snapshot"""
+    if request.args.get('format') != 'json':
+        return render_prometheus(read_host_metrics()), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
     return jsonify({
         'cache_stats': {
             'keyword_cache_size': len(keyword_cache),
             'ats_cache_size': len(ats_score_cache),
-            'cache_hit_rate': 'N/A'  # Would need to track hits/misses
+            'paragraph_cache_size': len(paragraph_feature_cache),
+            'paragraph_cache_hits': paragraph_feature_cache.hits,
+            'paragraph_cache_misses': paragraph_feature_cache.misses,
+            'cache_hit_rate': cache_hit_rate()
         },
         'system_stats': {
             'active_requests': active_requests,
             'max_concurrent_requests': app.config['MAX_CONCURRENT_REQUESTS'],
             'uptime': time.time() - app.config['START_TIME']
         },
-        'circuit_breakers': {
-            'optimization_state': optimization_circuit_breaker.state,
-            'keyword_state': keyword_circuit_breaker.state
+        'circuit_breakers': {name: breaker.snapshot() for name, breaker in stage_circuit_breakers.items()},
+        'latency': latency_snapshot(),
+        'fuzzy_matching': {
+            'enabled': app.config['FUZZY_MATCHING'],
+            'lookup_budget': app.config['FUZZY_LOOKUP_BUDGET'],
+            'index_size': len(keyword_taxonomy.fuzzy_index.deletes),
+            **fuzzy_match_stats
+        },
+        'memory': memory_snapshot(),
+        'startup': {
+            'ready': ready_event.is_set(),
+            'timings_ms': startup_timings
+        },
+        'traffic_capture': {
+            'enabled': bool(app.config['TRAFFIC_CAPTURE_PATH']),
+            'payloads': app.config['TRAFFIC_CAPTURE_PAYLOADS'],
+            'queued': capture_queue.qsize(),
+            **capture_stats
         },
         'performance_mode': {
             'fast_mode': app.config['FAST_MODE'],
@@ -189,6 +968,412 @@ def get_metrics():
         }
     }), 200
 
+# --- On-demand sampling profiler ---
+# A thread wakes every interval and records the stack of each thread (sys._current_frames),
+# so nothing is traced and request threads run at full speed. Signal timers are not used:
+# they only fire on the main thread, and gunicorn owns the worker's signal handlers.
+PROFILE_PATH_PREFIXES = sorted({os.path.dirname(os.path.abspath(__file__)) + os.sep,  # App, site-packages, stdlib
+                                *(path + os.sep for path in sys.path if path.endswith('-packages')),
+                                os.path.dirname(os.__file__) + os.sep}, key=len, reverse=True)
+profile_lock = threading.Lock()
+profile_frame_labels = {}
+
+def admin_only(f):
+    """Require X-Admin-Token to match ADMIN_TOKEN; without a configured token the endpoint is disabled"""
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        token = app.config['ADMIN_TOKEN']
+        if not token:
+            return jsonify({'error': 'Admin endpoints are disabled: set ADMIN_TOKEN to enable them'}), 403
+        if not hmac.compare_digest(request.headers.get('X-Admin-Token', '').encode(), token.encode()):
+            return jsonify({'error': 'Admin token required'}), 403
+        return f(*args, **kwargs)
+    return wrapper
+
+def profile_frame_label(code):
+    """'function (file:first line)', with the app and site-packages prefixes stripped"""
+    label = profile_frame_labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        for prefix in PROFILE_PATH_PREFIXES:
+            if filename.startswith(prefix):
+                filename = filename[len(prefix):]
+                break
+        label = profile_frame_labels[code] = f'{code.co_name} ({filename}:{code.co_firstlineno})'
+    return label
+
+def sample_stacks(seconds, interval, request_threads_only):
+    """Sample thread stacks for `seconds`; returns (collapsed stack -> samples, sampling rounds)"""
+    stacks = defaultdict(int)
+    sampler = threading.get_ident()
+    rounds = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident == sampler or (request_threads_only and ident not in request_threads):
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(profile_frame_label(frame.f_code))
+                frame = frame.f_back
+            labels.reverse()
+            stacks[';'.join(labels)] += 1
+        rounds += 1
+        time.sleep(interval)
+    return stacks, rounds
+
+def collapsed_stacks(stacks):
+    """Folded format read by flamegraph.pl, speedscope and inferno: 'frame;frame;frame count'"""
+    return ''.join(f'{stack} {count}\n' for stack, count in sorted(stacks.items()))
+
+def profile_path(pid):
+    return os.path.join(app.config['METRICS_DIR'], f'profile_{pid}.folded')
+
+def run_background_profile(seconds, interval, request_threads_only):
+    try:
+        stacks, _ = sample_stacks(seconds, interval, request_threads_only)
+        os.makedirs(app.config['METRICS_DIR'], exist_ok=True)
+        path = profile_path(os.getpid())
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(collapsed_stacks(stacks))
+        os.replace(path + '.tmp', path)
+    except Exception as e:
+        logger.error("Background profile failed: %s", e)
+    finally:
+        profile_lock.release()
+
+@app.route('/debug/profile', methods=['GET'])
+@admin_only
+def debug_profile():
+    """Sample this worker's stacks and return them collapsed, ready for a flame graph (admin endpoint).
+    ?seconds=10&interval_ms=10&threads=requests|all&wait=1|0. With wait=0 sampling runs in the
+    background and the result is fetched from /debug/profile/<pid>. Single-threaded workers only
+    support wait=0: a blocking profile would hold the only thread and sample nothing but itself."""
+    try:
+        seconds = float(request.args.get('seconds', 10))
+        interval = float(request.args.get('interval_ms', 10)) / 1000
+    except ValueError:
+        return jsonify({'error': 'seconds and interval_ms must be numbers'}), 400
+    if not 0 < seconds <= app.config['PROFILE_MAX_SECONDS'] or not 0.001 <= interval <= 1:
+        return jsonify({'error': f"seconds must be in (0, {app.config['PROFILE_MAX_SECONDS']}] and interval_ms in [1, 1000]"}), 400
+    request_threads_only = request.args.get('threads', 'requests') != 'all'
+    multithreaded = request.environ.get('wsgi.multithread', False)
+    wait = request.args.get('wait', '1' if multithreaded else '0') != '0'
+    if wait and not multithreaded:
+        return jsonify({'error': 'This worker serves one request at a time, so a blocking profile would only sample itself. Use wait=0.'}), 400
+
+    if not profile_lock.acquire(blocking=False):
+        return jsonify({'error': 'A profile is already running in this worker'}), 409
+    if not wait:
+        threading.Thread(target=run_background_profile, args=(seconds, interval, request_threads_only),
+                         name='profiler', daemon=True).start()
+        return jsonify({'pid': os.getpid(), 'seconds': seconds, 'result': f'/debug/profile/{os.getpid()}'}), 202
+    try:
+        stacks, rounds = sample_stacks(seconds, interval, request_threads_only)
+    finally:
+        profile_lock.release()
+    return collapsed_stacks(stacks), 200, {
+        'Content-Type': 'text/plain; charset=utf-8',
+        'X-Profile-Worker': str(os.getpid()),
+        'X-Profile-Rounds': str(rounds),
+        'X-Profile-Samples': str(sum(stacks.values()))
+    }
+
+@app.route('/debug/profile/<int:pid>', methods=['GET'])
+@admin_only
+def debug_profile_result(pid):
+    """Collapsed stacks of a finished background profile, from any worker on the host"""
+    try:
+        with open(profile_path(pid), encoding='utf-8') as f:
+            return f.read(), 200, {'Content-Type': 'text/plain; charset=utf-8'}
+    except FileNotFoundError:
+        return jsonify({'error': f'No finished profile for worker {pid}'}), 404
+
+# --- Memory instrumentation ---
+memory_baseline = {'snapshot': None, 'taken_at': None}
+memory_snapshot_lock = threading.Lock()
+MEMORY_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<unknown>')
+)
+
+def memory_snapshot():
+    """RSS, cache sizes, temp files and (when tracking) tracemalloc totals and peaks for this worker"""
+    temp_files, temp_bytes = temp_file_usage()
+    memory = {
+        'tracking': tracemalloc.is_tracing(),
+        'rss_bytes': resident_memory_bytes(),
+        'cache_bytes': {cache.name: estimate_cache_bytes(cache) for cache in (keyword_cache, ats_score_cache, paragraph_feature_cache)},
+        'temp_files': temp_files,
+        'temp_file_bytes': temp_bytes
+    }
+    if memory['tracking']:
+        memory['traced_bytes'] = tracemalloc.get_traced_memory()[0]
+        with stage_histograms_lock:
+            peaks = sorted(memory_peaks.items())
+        memory['peak_kb'] = {}
+        for (endpoint, stage), peak in peaks:
+            memory['peak_kb'].setdefault(endpoint, {})[stage] = round(peak / 1024, 1)
+    return memory
+
+@app.route('/toggle-memory-tracking', methods=['POST'])
+@admin_only
+def toggle_memory_tracking():
+    """Start or stop tracemalloc in this worker"""
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()  # Frees the traces; any stored baseline snapshot stays usable
+    else:
+        tracemalloc.start(app.config['MEMORY_TRACE_FRAMES'])
+    app.config['MEMORY_TRACKING'] = tracemalloc.is_tracing()
+    return jsonify({
+        'memory_tracking': app.config['MEMORY_TRACKING'],
+        'pid': os.getpid(),
+        'message': f'Memory tracking {"enabled" if app.config["MEMORY_TRACKING"] else "disabled"} in worker {os.getpid()}'
+    }), 200
+
+@app.route('/debug/memory/snapshot', methods=['POST'])
+@admin_only
+def take_memory_snapshot():
+    """Store a tracemalloc snapshot as the baseline for /debug/memory/diff (admin endpoint)"""
+    if not tracemalloc.is_tracing():
+        return jsonify({'error': 'Memory tracking is off; start it with MEMORY_TRACKING=1 or /toggle-memory-tracking'}), 409
+    snapshot = tracemalloc.take_snapshot().filter_traces(MEMORY_SNAPSHOT_FILTERS)
+    with memory_snapshot_lock:
+        memory_baseline.update(snapshot=snapshot, taken_at=time.time())
+    return jsonify({
+        'pid': os.getpid(),
+        'traced_bytes': sum(stat.size for stat in snapshot.statistics('filename')),
+        'taken_at': memory_baseline['taken_at']
+    }), 200
+
+@app.route('/debug/memory/diff', methods=['GET'])
+@admin_only
+def diff_memory_snapshot():
+    """Compare a fresh snapshot with the baseline, largest growth first (admin endpoint).
+    ?group=lineno|filename|traceback&limit=25&reset=1 (reset makes the fresh snapshot the new baseline)"""
+    group = request.args.get('group', 'lineno')
+    if group not in ('lineno', 'filename', 'traceback'):
+        return jsonify({'error': 'group must be lineno, filename or traceback'}), 400
+    try:
+        limit = max(1, int(request.args.get('limit', 25)))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    if not tracemalloc.is_tracing():
+        return jsonify({'error': 'Memory tracking is off; start it with MEMORY_TRACKING=1 or /toggle-memory-tracking'}), 409
+    with memory_snapshot_lock:
+        baseline, taken_at = memory_baseline['snapshot'], memory_baseline['taken_at']
+    if baseline is None:
+        return jsonify({'error': 'No baseline; POST /debug/memory/snapshot first'}), 409
+
+    current = tracemalloc.take_snapshot().filter_traces(MEMORY_SNAPSHOT_FILTERS)
+    stats = current.compare_to(baseline, group)
+    if request.args.get('reset') == '1':
+        with memory_snapshot_lock:
+            memory_baseline.update(snapshot=current, taken_at=time.time())
+    return jsonify({
+        'pid': os.getpid(),
+        'seconds_since_baseline': round(time.time() - taken_at, 1),
+        'size_diff_bytes': sum(stat.size_diff for stat in stats),
+        'count_diff': sum(stat.count_diff for stat in stats),
+        'top': [
+            {
+                'location': [f'{frame.filename}:{frame.lineno}' if group != 'filename' else frame.filename
+                             for frame in stat.traceback],
+                'size_bytes': stat.size,
+                'size_diff_bytes': stat.size_diff,
+                'count': stat.count,
+                'count_diff': stat.count_diff
+            }
+            for stat in stats[:limit]
+        ]
+    }), 200
+
+# --- Traffic capture ---
+# Records the live request mix for replay_traffic.py: per request the endpoint, form fields (length,
+# word count and a keyed digest), uploaded files (size and keyed digest), arrival time and outcome.
+# With TRAFFIC_CAPTURE_PAYLOADS the texts and documents are also kept, anonymized: every word that
+# is not a known keyword, action verb or common English word becomes a keyed pseudonym of the same
+# length, and every number a keyed number of the same length. Requests only pay for hashing the
+# upload; anonymizing and writing happen on a background thread.
+CAPTURE_EXCLUDED_PREFIXES = ('/debug', '/metrics', '/toggle-', '/cache/', '/taxonomy/reload', '/live', '/ready')
+CAPTURE_VERBATIM_FIELDS = frozenset({'exportFormat', 'targetScore'})  # Option values, never personal
+CAPTURE_TEXT_FIELDS = frozenset({'jobDescription', 'extraKeywords', 'companyName', 'jobRole'})
+CAPTURE_COMMON_WORDS = frozenset("""
+    a an and are as at be by for from has have in is it of on or our the their this to was we were will
+    with you your all also over per than that who within across using including new years year
+    skills skill experience education summary objective profile qualifications certifications
+    achievements awards tools technologies frameworks libraries software platforms work history
+    employment competencies expertise technical stack reduced percent dollars
+    senior junior lead engineer developer manager analyst team teams project projects
+""".split())
+CAPTURE_TOKEN_PATTERN = re.compile(r'\d+|[^\W\d_]+')
+capture_queue = queue.Queue(maxsize=app.config['TRAFFIC_CAPTURE_QUEUE_SIZE'])
+capture_stats = {'captured': 0, 'dropped': 0, 'payloads_saved': 0, 'payload_errors': 0, 'write_errors': 0}
+capture_writer_pid = None
+capture_writer_lock = threading.Lock()
+
+def keyed_digest(data):
+    return hmac.new(app.config['TRAFFIC_CAPTURE_SALT'], data, hashlib.sha256).hexdigest()
+
+def pseudonym(token):
+    """Same-length stand-in for a word or number, stable for the salt so repeats stay repeats"""
+    digest = hmac.new(app.config['TRAFFIC_CAPTURE_SALT'], token.lower().encode(), hashlib.sha256).digest()
+    digest = (digest * (len(token) // len(digest) + 1))[:len(token)]
+    if token.isdigit():
+        return ''.join(str(b % 10) for b in digest)
+    word = ''.join(string.ascii_lowercase[b % 26] for b in digest)
+    if token.isupper() and len(token) > 1:
+        return word.upper()
+    return word.capitalize() if token[0].isupper() else word
+
+def anonymize_text(text):
+    """Replace personal words and numbers, keeping keywords, industry terms and common words so the
+    anonymized text still exercises keyword matching and scoring the way the original did"""
+    taxonomy = keyword_taxonomy
+    text_lower = text.lower()
+    kept = []
+    if len(text_lower) == len(text):  # Lowercasing a few characters changes the length; then keep nothing
+        for pattern in (taxonomy.surface_pattern, taxonomy.industry_pattern):
+            kept.extend(match.span() for match in pattern.finditer(text_lower))
+    kept.sort()
+
+    def replace(match):
+        start, end = match.span()
+        index = bisect.bisect_right(kept, (start, float('inf'))) - 1
+        if index >= 0 and kept[index][1] >= end:
+            return match.group()
+        word = match.group()
+        if word.lower() in CAPTURE_COMMON_WORDS or word.lower() in ACTION_VERBS:
+            return word
+        return pseudonym(word)
+
+    return CAPTURE_TOKEN_PATTERN.sub(replace, text)
+
+def anonymize_docx(data):
+    """Anonymized copy of a .docx: all body, table, header and footer text, document properties
+    blanked, and images zero-filled at their original size"""
+    doc = Document(io.BytesIO(data))
+    text_tag = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t'
+    for part in doc.part.package.iter_parts():
+        if part.content_type.startswith('image/'):
+            part._blob = bytes(len(part.blob))  # Photos and signatures are personal; the size is what matters
+        elif hasattr(part, 'element') and part.content_type.endswith('+xml'):
+            for node in part.element.iter(text_tag):
+                if node.text:
+                    node.text = anonymize_text(node.text)
+    properties = doc.core_properties
+    for name in ('author', 'last_modified_by', 'title', 'subject', 'keywords', 'comments', 'category'):
+        setattr(properties, name, '')
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+def capture_payload_dir():
+    return app.config['TRAFFIC_CAPTURE_PATH'] + '.payloads'
+
+def store_capture_payloads(record, texts, files):
+    """Attach anonymized texts to the record and save anonymized documents next to the capture file,
+    one file per digest so duplicate submissions are stored once"""
+    for name, value in texts.items():
+        record['form'][name]['text'] = anonymize_text(value)
+    for name, data in files.items():
+        info = record['files'][name]
+        filename = f"{info['sha256']}{info['extension'] or '.bin'}"
+        path = os.path.join(capture_payload_dir(), filename)
+        if not os.path.exists(path):
+            try:
+                payload = anonymize_docx(data) if info['extension'] == '.docx' else None
+            except Exception as e:  # Not a readable document - keep the metadata only
+                capture_stats['payload_errors'] += 1
+                trace("Could not anonymize captured upload: %s", e)
+                continue
+            if payload is None:
+                continue
+            os.makedirs(capture_payload_dir(), mode=0o700, exist_ok=True)
+            temp_path = f'{path}.{os.getpid()}.tmp'
+            with os.fdopen(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, path)
+            capture_stats['payloads_saved'] += 1
+        info['payload'] = filename
+
+def write_captured_traffic():
+    """Drain the capture queue into the JSONL file. Every line is one O_APPEND write, so lines from
+    several workers appending to the same file do not interleave."""
+    while app.config['TRAFFIC_CAPTURE_PATH']:
+        record, texts, files = capture_queue.get()
+        try:
+            if texts or files:
+                store_capture_payloads(record, texts, files)
+            line = (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+            fd = os.open(app.config['TRAFFIC_CAPTURE_PATH'], os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            capture_stats['write_errors'] += 1
+            logger.warning("Traffic capture write failed: %s", e)
+
+def ensure_capture_writer():
+    """Start the writer thread once per worker process (threads do not survive a fork)"""
+    global capture_writer_pid
+    if capture_writer_pid == os.getpid():
+        return
+    with capture_writer_lock:
+        if capture_writer_pid == os.getpid():
+            return
+        capture_writer_pid = os.getpid()
+    threading.Thread(target=write_captured_traffic, name='traffic-capture', daemon=True).start()
+
+@app.after_request
+def capture_request(response):
+    if not app.config['TRAFFIC_CAPTURE_PATH'] or request.path.startswith(CAPTURE_EXCLUDED_PREFIXES):
+        return response
+    ensure_capture_writer()
+    now = time.perf_counter_ns()
+    keep_payloads = app.config['TRAFFIC_CAPTURE_PAYLOADS']
+    record = {
+        'arrival': round(time.time() - (now - getattr(request_state, 'start', now)) / 1e9, 6),
+        'method': request.method,
+        'path': request.path,
+        'args': {name: value for name, value in request.args.items() if name in CAPTURE_VERBATIM_FIELDS},
+        'form': {},
+        'files': {},
+        'status': response.status_code,
+        'duration_ms': round((now - getattr(request_state, 'start', now)) / 1e6, 2),
+        'pid': os.getpid()
+    }
+    texts, files = {}, {}
+    for name, value in request.form.items():
+        field = {'length': len(value), 'words': len(value.split()), 'sha256': keyed_digest(value.encode('utf-8'))}
+        if name in CAPTURE_VERBATIM_FIELDS:
+            field['value'] = value
+        elif keep_payloads and name in CAPTURE_TEXT_FIELDS:
+            texts[name] = value
+        record['form'][name] = field
+    for name, storage in request.files.items():
+        try:
+            storage.stream.seek(0)
+            data = storage.stream.read()
+        except (OSError, ValueError):  # Stream already closed by the handler
+            continue
+        record['files'][name] = {
+            'extension': os.path.splitext(storage.filename or '')[1].lower()[:10],
+            'content_type': storage.mimetype,
+            'size': len(data),
+            'sha256': keyed_digest(data)
+        }
+        if keep_payloads:
+            files[name] = data
+    try:
+        capture_queue.put_nowait((record, texts, files))
+        capture_stats['captured'] += 1
+    except queue.Full:  # Never make a request wait for the capture file
+        capture_stats['dropped'] += 1
+    return response
+
 @app.route('/toggle-fast-mode', methods=['POST'])
 def toggle_fast_mode():
     """Toggle fast mode on/off"""
@@ -201,15 +1386,29 @@ def toggle_fast_mode():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/toggle-fuzzy-matching', methods=['POST'])
+@admin_only
+def toggle_fuzzy_matching():
+    """Toggle typo-tolerant keyword matching on/off"""
+    try:
+        app.config['FUZZY_MATCHING'] = not app.config['FUZZY_MATCHING']
+        return jsonify({
+            'fuzzy_matching': app.config['FUZZY_MATCHING'],
+            'message': f'Fuzzy matching {"enabled" if app.config["FUZZY_MATCHING"] else "disabled"}'
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/status', methods=['GET'])
 def get_status():
     """Get current system status"""
     return jsonify({
         'status': 'operational',
+        'ready': ready_event.is_set(),
         'fast_mode': app.config['FAST_MODE'],
         'uptime': time.time() - app.config['START_TIME'],
         'active_requests': active_requests,
-        'cache_size': len(keyword_cache) + len(ats_score_cache)
+        'cache_size': len(keyword_cache) + len(ats_score_cache) + len(paragraph_feature_cache)
     }), 200
 
 # Cache management
@@ -232,16 +1431,21 @@ def cleanup_temp_files():
                     except:
                         pass
     except Exception as e:
-        logger.warning(f"Cleanup failed: {e}")
+        logger.warning("Cleanup failed: %s", e)
 
 def get_cached_result(cache_dict, key, ttl=3600):
     """Get cached result if not expired"""
     if key in cache_dict:
         timestamp, result = cache_dict[key]
         if time.time() - timestamp < ttl:
+            cache_dict.count(hits=1)
+            if getattr(request_state, 'stage_timings', None) is not None:
+                request_state.cache_hits += 1
             return result
         else:
-            del cache_dict[key]
+            cache_dict.pop(key, None)
+            cache_dict.count(evictions=1)
+    cache_dict.count(misses=1)
     return None
 
 def set_cached_result(cache_dict, key, result, ttl=3600):
@@ -255,24 +1459,32 @@ def timeout_handler(timeout_seconds=30):
         def wrapper(*args, **kwargs):
             global active_requests  # <-- moved to the top
             start_time = time.time()
+            # Check if we're at capacity. Outside the try: a rejected request never took a slot,
+            # so it must not give one back in the finally below.
+            with request_lock:
+                if active_requests >= app.config['MAX_CONCURRENT_REQUESTS']:
+                    return jsonify({'error': 'Server is busy. Please try again in a moment.'}), 503
+                active_requests += 1
+            request_state.deadline = time.monotonic() + timeout_seconds
             try:
-                # Check if we're at capacity
-                with request_lock:
-                    if active_requests >= app.config['MAX_CONCURRENT_REQUESTS']:
-                        return jsonify({'error': 'Server is busy. Please try again in a moment.'}), 503
-                    active_requests += 1
-                
                 result = f(*args, **kwargs)
                 
                 if time.time() - start_time > timeout_seconds:
-                    raise Exception("Request timed out")
+                    raise DeadlineExceededError(f'Request timed out after {timeout_seconds} seconds. Please try with a smaller file or shorter description.')
                 return result
+            except ProcessingError as e:
+                if e.kind in ('internal', 'transient'):
+                    logger.error("Error in %s: %s", f.__name__, e)
+                else:
+                    logger.info("Rejected %s request (%s): %s", f.__name__, e.kind, e)
+                return processing_error_response(e)
             except Exception as e:
-                logger.error(f"Error in {f.__name__}: {str(e)}")
+                logger.error("Error in %s: %s", f.__name__, e)
                 if time.time() - start_time > timeout_seconds:
                     return jsonify({'error': f'Request timed out after {timeout_seconds} seconds. Please try with a smaller file or shorter description.'}), 408
                 return jsonify({'error': f'Processing failed: {str(e)}'}), 500
             finally:
+                request_state.deadline = None
                 with request_lock:
                     active_requests -= 1
         return wrapper
@@ -296,146 +1508,548 @@ ATS_FORMATTING_REQUIREMENTS = {
     'min_length': 200    # words
 }
 
-# Predefined technical keywords by category (all in lowercase for matching)
-TECHNICAL_KEYWORDS = {
-    'programming_languages': {
-        'python', 'java', 'javascript', 'js', 'typescript', 'ts', 'c++', 'c#', 'ruby', 'php', 'swift',
-        'kotlin', 'go', 'golang', 'rust', 'scala', 'r', 'matlab', 'sql', 'perl', 'shell', 'bash',
-        'dart', 'elixir', 'haskell', 'lua', 'assembly', 'fortran', 'cobol', 'ada', 'groovy', 'clojure',
-        'c', 'f#', 'ocaml', 'erlang', 'julia', 'nim', 'crystal', 'zig', 'v', 'odin', 'pony'
-    },
-    'web_technologies': {
-        'html', 'css', 'sass', 'less', 'react', 'angular', 'vue', 'node.js', 'nodejs', 'express',
-        'django', 'flask', 'spring', 'asp.net', 'jquery', 'bootstrap', 'tailwind',
-        'next.js', 'nuxt.js', 'svelte', 'sveltekit', 'astro', 'remix', 'gatsby', 'webpack', 'vite',
-        'rollup', 'esbuild', 'parcel', 'graphql', 'apollo', 'prisma', 'sequelize', 'typeorm',
-        'nestjs', 'fastapi', 'fastify', 'hapi', 'koa', 'web3', 'solidity', 'ethers.js', 'web3.js',
-        'stripe', 'twilio', 'sendgrid', 'mailgun', 'socket.io', 'ws', 'websocket'
-    },
-    'databases': {
-        'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'sql server', 'dynamodb',
-        'cassandra', 'elasticsearch', 'neo4j', 'mariadb', 'cockroachdb', 'timescaledb', 'influxdb',
-        'clickhouse', 'snowflake', 'bigquery', 'redshift', 'databricks', 'hive', 'hbase', 'couchdb',
-        'rethinkdb', 'arangodb', 'fauna', 'supabase', 'planetscale', 'firebase', 'appwrite'
-    },
-    'cloud_platforms': {
-        'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean', 'firebase',
-        'cloudflare', 'vercel', 'netlify', 'alibaba cloud', 'oracle cloud', 'ibm cloud',
-        'linode', 'vultr', 'render', 'railway', 'fly.io', 'supabase', 'appwrite', 'hasura',
-        'stripe', 'twilio', 'sendgrid', 'mailgun', 'auth0', 'okta', 'cognito'
-    },
-    'data_science': {
-        'pandas', 'numpy', 'scipy', 'scikit-learn', 'sklearn', 'tensorflow', 'pytorch', 'keras',
-        'matplotlib', 'seaborn', 'plotly', 'tableau', 'power bi', 'jupyter', 'spss', 'sas',
-        'opencv', 'pillow', 'statsmodels', 'xgboost', 'lightgbm', 'catboost', 'fastai',
-        'transformers', 'spacy', 'nltk', 'gensim', 'word2vec', 'bert', 'gpt', 'llama',
-        'streamlit', 'gradio', 'mlflow', 'kubeflow', 'ray', 'dask', 'vaex', 'modin', 'rapids',
-        'polars', 'orange3', 'dataspell'
-    },
-    'tools_and_platforms': {
-        'git', 'docker', 'kubernetes', 'jenkins', 'jira', 'confluence', 'bitbucket', 'github',
-        'gitlab', 'terraform', 'ansible', 'vagrant', 'postman', 'swagger', 'snowflake',
-        'helm', 'istio', 'linkerd', 'prometheus', 'grafana', 'elk stack', 'elasticsearch',
-        'logstash', 'kibana', 'splunk', 'datadog', 'newrelic', 'sentry', 'rollbar',
-        'circleci', 'github actions', 'gitlab ci', 'travis ci', 'azure devops', 'teamcity',
-        'bamboo', 'sonarqube', 'codecov', 'coveralls', 'semaphore', 'appveyor', 'wercker',
-        'drone', 'concourse', 'spinnaker', 'argo', 'tekton', 'skaffold', 'tilt', 'lens',
-        'rancher', 'openshift', 'minikube', 'kind', 'k3s', 'microk8s', 'kubectl', 'kustomize'
-    }
-}
+class ATSScore(namedtuple('ATSScore', [
+    'total_score', 'keyword_score', 'formatting_score', 'content_score',
+    'structure_score', 'length_score', 'improvement'
+])):
+    """Immutable ATS score record - cached as is, converted with to_dict() at the response edge"""
+    __slots__ = ()
+
+    def to_dict(self):
+        return dict(zip(self._fields, self))
+
+EMPTY_ATS_SCORE = ATSScore(0, 0, 0, 0, 0, 0, 0)
+
+# --- Typo-tolerant keyword matching ---
+FUZZY_MIN_TOKEN_LENGTH = 6  # Shorter words are too easily confused ('reach' vs 'react')
+
+def bounded_edit_distance(a, b, max_distance):
+    """Optimal string alignment distance, or max_distance + 1 once it is exceeded"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+class FuzzyKeywordIndex:
+    """Symmetric-delete index over single-word keyword surfaces, built once at startup"""
+    MAX_CACHED_LOOKUPS = 50000
+
+    def __init__(self, surfaces, excluded=(), deletes=None):
+        """surfaces maps each surface form to its canonical keyword; deletes is a prebuilt index
+        (variant -> surfaces, as saved by KeywordTaxonomy.compiled_form) to use instead of building one"""
+        self.lookup_cache = {}
+        if deletes is not None:
+            self.deletes = {variant: set(matches) for variant, matches in deletes.items()}
+            return
+        self.deletes = {}
+        for surface in surfaces:
+            if len(surface) < FUZZY_MIN_TOKEN_LENGTH or not surface.isalnum():
+                continue
+            if surface in excluded or surfaces[surface] in excluded:  # Aliases of excluded keywords too
+                continue
+            for variant in self.delete_variants(surface, 2):
+                self.deletes.setdefault(variant, set()).add(surface)
+
+    @staticmethod
+    def max_distance(length):
+        """Allowed edit distance for a token of the given length"""
+        if length >= 9:
+            return 2
+        if length >= FUZZY_MIN_TOKEN_LENGTH:
+            return 1
+        return 0
+
+    @staticmethod
+    def delete_variants(word, depth):
+        """All strings reachable from word by deleting up to depth characters"""
+        variants = {word}
+        frontier = {word}
+        for _ in range(depth):
+            frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+            variants |= frontier
+        return variants
+
+    def is_cached(self, token):
+        return token in self.lookup_cache
+
+    def lookup(self, token):
+        """Return the single closest keyword surface within the allowed distance, or None"""
+        if token in self.lookup_cache:
+            return self.lookup_cache[token]
+
+        max_distance = self.max_distance(len(token))
+        best_distance = max_distance + 1
+        best = []
+        if max_distance:
+            candidates = set()
+            for variant in self.delete_variants(token, max_distance):
+                candidates |= self.deletes.get(variant, set())
+            for surface in candidates:
+                if surface[0] != token[0]:  # Typos rarely change the first letter
+                    continue
+                limit = min(max_distance, self.max_distance(len(surface)))
+                distance = bounded_edit_distance(token, surface, limit)
+                if distance > limit:  # Over the limit: bounded_edit_distance reports limit + 1 or more
+                    continue
+                if distance < best_distance:
+                    best_distance, best = distance, [surface]
+                elif distance == best_distance:
+                    best.append(surface)
+        # Ambiguous near-misses are ignored rather than guessed
+        result = best[0] if len(best) == 1 else None
+
+        if len(self.lookup_cache) >= self.MAX_CACHED_LOOKUPS:
+            self.lookup_cache.clear()
+        self.lookup_cache[token] = result
+        return result
+
+def trie_regex(terms):
+    """Alternation of the terms nested as a prefix tree, so the regex engine rules out most
+    terms on their first character instead of trying each one at every position"""
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}  # End of a term
+
+    def build(node):
+        ends = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional: longer terms are tried first, shorter ones on backtracking
+        return '(?:' + body + ')?' if ends else body
+
+    return build(trie)
+
+def compile_term_pattern(terms):
+    """Match any of the (lowercase) terms as a whole token.
+    The lookarounds stop 'js' matching inside 'node.js' and 'c' inside 'c#'."""
+    return re.compile(r'(?<![\w.+#])(?:' + trie_regex(terms) + r')(?![\w+#])')
+
+# --- Keyword taxonomy ---
+# Technical keywords, aliases and industry lists live in data/keyword_taxonomy.json and are
+# compiled into the structures below. A reload compiles a new taxonomy and swaps it in whole.
+class KeywordTaxonomy:
+    """Keyword taxonomy compiled into the structures used for matching"""
+
+    def __init__(self, data, version, compiled=None):
+        """compiled is compiled_form() of a taxonomy built from the same data: its patterns and
+        fuzzy index are reused instead of rebuilt"""
+        self.version = version
+        # Technical keywords by category (all in lowercase for matching)
+        self.technical_keywords = {
+            category: frozenset(kw.lower() for kw in keywords)
+            for category, keywords in data['technical_keywords'].items()
+        }
+        self.all_keywords = frozenset().union(*self.technical_keywords.values())
+        self.fast_keywords = frozenset(kw.lower() for kw in data.get('fast_keywords', ()))
+        self.industry_keywords = {industry: list(keywords) for industry, keywords in data['industry_keywords'].items()}
+        self.suggestion_keywords = {category: list(keywords) for category, keywords in data.get('suggestion_keywords', {}).items()}
+        self.fallback_suggestions = list(data.get('fallback_suggestions', ()))
+
+        # Every surface form (keywords and aliases) -> canonical keyword ID
+        self.canonical = {keyword: keyword for keyword in self.all_keywords}
+        self.canonical.update({alias.lower(): canonical.lower() for alias, canonical in data.get('aliases', {}).items()})
+
+        # One compiled pattern over all surface forms, preferring the longest so 'c++' wins over 'c'
+        self.surface_pattern = re.compile(compiled['surface_pattern']) if compiled else compile_term_pattern(self.canonical)
+
+        # Preferred casing: explicit display names first, then the curated industry lists
+        self.display_names = {self.canonicalize(kw): name for kw, name in data.get('display_names', {}).items()}
+        for keywords in self.industry_keywords.values():
+            for kw in keywords:
+                self.display_names.setdefault(self.canonicalize(kw), kw)
+
+        self.fuzzy_index = FuzzyKeywordIndex(self.canonical, frozenset(data.get('fuzzy_excluded_keywords', ())),
+                                             compiled['fuzzy_deletes'] if compiled else None)
+        # Ordinary English words a single edit from a keyword ('docket', 'linked'), never looked up
+        self.fuzzy_excluded_words = frozenset(word.lower() for word in data.get('fuzzy_excluded_words', ()))
+
+        # Industry classifier: every industry keyword and indicator maps to a sparse vector of
+        # (industry index, weight), so one scan of the job description scores all industries
+        indicators = data.get('industry_indicators', {})
+        self.industries = tuple(dict.fromkeys(list(self.industry_keywords) + list(indicators)))
+        self.default_industry = data.get('default_industry', self.industries[0])
+        term_weights = defaultdict(lambda: defaultdict(int))
+        for index, industry in enumerate(self.industries):
+            for term in self.industry_keywords.get(industry, []) + indicators.get(industry, []):
+                term_weights[term.lower()][index] += 1
+        self.industry_term_vectors = {term: tuple(vector.items()) for term, vector in term_weights.items()}
+        self.industry_pattern = (re.compile(compiled['industry_pattern']) if compiled
+                                 else compile_term_pattern(self.industry_term_vectors))
+
+    def compiled_form(self):
+        """The parts that are slow to build, as plain JSON-serialisable data"""
+        return {
+            'surface_pattern': self.surface_pattern.pattern,
+            'industry_pattern': self.industry_pattern.pattern,
+            'fuzzy_deletes': {variant: sorted(surfaces) for variant, surfaces in self.fuzzy_index.deletes.items()}
+        }
 
-# Flatten the keywords for easier searching
-ALL_KEYWORDS = {keyword.lower() for category in TECHNICAL_KEYWORDS.values() for keyword in category}
-
-# --- Industry-specific best-practice keyword lists ---
-INDUSTRY_KEYWORDS = {
-    'software_engineering': [
-        # Languages
-        'Python', 'Java', 'C++', 'C#', 'JavaScript', 'TypeScript', 'Go', 'Ruby', 'Kotlin', 'Swift',
-        # Frameworks/Tools
-        'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask', 'Spring', 'Express', 'Docker', 'Kubernetes',
-        'AWS', 'Azure', 'GCP', 'CI/CD', 'Git', 'REST', 'GraphQL', 'Microservices', 'Agile', 'Scrum',
-        # Practices
-        'Unit Testing', 'TDD', 'OOP', 'Design Patterns', 'DevOps', 'Cloud', 'API Development', 'Version Control',
-        # Soft skills
-        'Collaboration', 'Problem Solving', 'Communication'
-    ],
-    'data_analytics': [
-        # Languages/Tools
-        'Python', 'R', 'SQL', 'Excel', 'Tableau', 'Power BI', 'Looker', 'SAS', 'SPSS', 'Jupyter',
-        # Libraries
-        'Pandas', 'NumPy', 'Matplotlib', 'Seaborn', 'Scikit-learn', 'TensorFlow', 'PyTorch',
-        # Concepts
-        'Data Visualization', 'Data Cleaning', 'Data Mining', 'Statistical Analysis', 'ETL', 'Big Data',
-        'Machine Learning', 'Predictive Modeling', 'Regression', 'Classification', 'A/B Testing',
-        # Soft skills
-        'Attention to Detail', 'Critical Thinking', 'Storytelling', 'Business Acumen'
-    ]
+    def canonicalize(self, keyword):
+        """Return the canonical keyword ID for a surface form (unknown keywords are just lowercased)"""
+        keyword_lower = keyword.strip().lower()
+        return self.canonical.get(keyword_lower, keyword_lower)
+
+def compiled_taxonomy_stamp(version):
+    """What a compiled taxonomy was built from: the data file, this module's code and the Python version"""
+    with open(__file__, 'rb') as f:
+        code_version = hashlib.md5(f.read()).hexdigest()[:12]
+    return [version, code_version, list(sys.version_info[:2])]
+
+def save_compiled_taxonomy(taxonomy, path):
+    """Write the compiled taxonomy for the next process to load; best effort (the directory may be read-only).
+    It is plain JSON (regex sources and the fuzzy index), so a tampered file cannot run code when loaded."""
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'stamp': compiled_taxonomy_stamp(taxonomy.version), **taxonomy.compiled_form()}, f,
+                      separators=(',', ':'))
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.info("Could not save the compiled taxonomy to %s: %s", path, e)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+def load_keyword_taxonomy(path, compiled_path=None):
+    """Load the taxonomy data file and compile it, versioned by a hash of the file contents.
+    With compiled_path, reuse the compiled form saved there if its stamp matches the file's content
+    hash and this code (skipping the trie and fuzzy index builds; only the regexes are recompiled),
+    or save it."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    version = hashlib.md5(raw).hexdigest()[:12]
+    data = json.loads(raw.decode('utf-8'))
+    if compiled_path:
+        try:
+            with open(compiled_path, encoding='utf-8') as f:
+                compiled = json.load(f)
+            if compiled.get('stamp') == compiled_taxonomy_stamp(version):
+                return KeywordTaxonomy(data, version, compiled)
+        except FileNotFoundError:
+            pass
+        except Exception as e:  # Truncated or from an incompatible build - compile from the data file
+            logger.warning("Ignoring compiled taxonomy %s: %s", compiled_path, e)
+    taxonomy = KeywordTaxonomy(data, version)
+    if compiled_path:
+        save_compiled_taxonomy(taxonomy, compiled_path)
+    return taxonomy
+
+with startup_phase('taxonomy'):
+    keyword_taxonomy = load_keyword_taxonomy(app.config['TAXONOMY_PATH'], app.config['TAXONOMY_COMPILED_PATH'])
+taxonomy_state = {
+    'loaded_at': time.time(),
+    'mtime': os.path.getmtime(app.config['TAXONOMY_PATH']),
+    'reloads': 0,
+    'last_error': None
 }
+taxonomy_reload_lock = threading.Lock()
+taxonomy_watcher_pid = None
+
+def taxonomy_cache_key(data_type, *args):
+    """Cache key tied to the active taxonomy version"""
+    return get_cache_key(f"{data_type}@{keyword_taxonomy.version}", *args)
+
+def invalidate_taxonomy_caches(version):
+    """Drop cache entries computed with the given taxonomy version, leaving everything else"""
+    marker = f"@{version}:"
+    removed = 0
+    for cache_dict in (keyword_cache, ats_score_cache, paragraph_feature_cache):
+        for key in [k for k in list(cache_dict) if marker in k]:
+            if cache_dict.pop(key, None) is not None:
+                removed += 1
+    return removed
+
+def reload_keyword_taxonomy():
+    """Rebuild the taxonomy from its data file and swap it in atomically.
+    Returns 'reloaded', 'unchanged', 'busy' (another reload is running) or 'failed' (see last_error)."""
+    global keyword_taxonomy
+    if not taxonomy_reload_lock.acquire(blocking=False):
+        return 'busy'
+    mtime = None
+    try:
+        path = app.config['TAXONOMY_PATH']
+        mtime = os.path.getmtime(path)
+        new_taxonomy = load_keyword_taxonomy(path, app.config['TAXONOMY_COMPILED_PATH'])
+        taxonomy_state['mtime'] = mtime
+        taxonomy_state['last_error'] = None
+        old_taxonomy = keyword_taxonomy
+        if new_taxonomy.version == old_taxonomy.version:
+            return 'unchanged'
+
+        # A single reference assignment: requests see the old or the new taxonomy, never a mix
+        keyword_taxonomy = new_taxonomy
+        removed = invalidate_taxonomy_caches(old_taxonomy.version)
+        taxonomy_state['loaded_at'] = time.time()
+        taxonomy_state['reloads'] += 1
+        logger.info("Keyword taxonomy reloaded: %s -> %s, %d cache entries invalidated", old_taxonomy.version, new_taxonomy.version, removed)
+        check_keyword_table_versions(new_taxonomy)
+        return 'reloaded'
+    except Exception as e:
+        if mtime is not None:
+            taxonomy_state['mtime'] = mtime  # The watcher retries on the next edit, not every poll
+        taxonomy_state['last_error'] = str(e)
+        logger.error("Keyword taxonomy reload failed: %s", e)
+        return 'failed'
+    finally:
+        taxonomy_reload_lock.release()
 
-def find_keyword_with_original_case(text, keyword_lower):
-    """Find the keyword in the text and return it with its original case"""
-    pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-    match = re.search(pattern, text.lower())
-    if match:
-        start, end = match.span()
-        # Return the original casing from the text
-        return text[start:end]
-    # If not found in text, return the keyword with proper capitalization
-    return keyword_lower.title()
+def watch_taxonomy_file():
+    """Poll the taxonomy file and reload it when it changes"""
+    while app.config['TAXONOMY_WATCH_INTERVAL'] > 0:
+        time.sleep(app.config['TAXONOMY_WATCH_INTERVAL'])
+        try:
+            mtime = os.path.getmtime(app.config['TAXONOMY_PATH'])
+        except OSError:
+            continue
+        if mtime != taxonomy_state['mtime']:
+            reload_keyword_taxonomy()
+
+@app.before_request
+def ensure_taxonomy_watcher():
+    """Start the taxonomy watcher once per worker process (threads do not survive a fork)"""
+    global taxonomy_watcher_pid
+    if app.config['TAXONOMY_WATCH_INTERVAL'] <= 0 or taxonomy_watcher_pid == os.getpid():
+        return
+    with taxonomy_reload_lock:
+        if taxonomy_watcher_pid == os.getpid():
+            return
+        taxonomy_watcher_pid = os.getpid()
+    threading.Thread(target=watch_taxonomy_file, name='taxonomy-watcher', daemon=True).start()
+
+@app.route('/taxonomy', methods=['GET'])
+def get_taxonomy_status():
+    """Report the active keyword taxonomy version"""
+    taxonomy = keyword_taxonomy
+    return jsonify({
+        'version': taxonomy.version,
+        'loaded_at': taxonomy_state['loaded_at'],
+        'reloads': taxonomy_state['reloads'],
+        'last_error': taxonomy_state['last_error'],
+        'keywords': len(taxonomy.all_keywords),
+        'surface_forms': len(taxonomy.canonical),
+        'industries': list(taxonomy.industries),
+        'idf_table': {
+            'version': keyword_idf['version'],
+            'documents': keyword_idf['documents'],
+            'keywords': len(keyword_idf['idf'])
+        },
+        'stale_tables': stale_keyword_tables(taxonomy)  # Rebuild them with build_keyword_tables.py
+    }), 200
+
+@app.route('/taxonomy/reload', methods=['POST'])
+@admin_only
+def reload_taxonomy():
+    """Rebuild the keyword taxonomy in this worker and report the outcome (admin endpoint).
+    Other workers pick up the file change through their watchers."""
+    outcome = reload_keyword_taxonomy()
+    body = {
+        'outcome': outcome,
+        'version': keyword_taxonomy.version,
+        'watch_interval': app.config['TAXONOMY_WATCH_INTERVAL'],
+        'timestamp': time.time()
+    }
+    if outcome == 'failed':
+        return jsonify({'error': f"Taxonomy reload failed: {taxonomy_state['last_error']}", **body}), 500
+    if outcome == 'busy':
+        return jsonify({'error': 'A taxonomy reload is already running', **body}), 409
+    return jsonify(body), 200
+
+# --- Keyword weighting ---
+# IDF per canonical keyword, built offline from a job-description corpus by
+# build_keyword_tables.py. Without the table every keyword weighs the same.
+BM25_K1 = 1.2  # Term-frequency saturation: repeating a keyword stops paying off quickly
+BM25_B = 0.75  # Length normalization: long job descriptions repeat everything more
+keyword_table_sources = {}  # Loaded table -> taxonomy version it was built from (None if not recorded)
+
+def stale_keyword_tables(taxonomy):
+    """Names of the loaded keyword tables built from a different taxonomy version"""
+    return sorted(name for name, version in keyword_table_sources.items() if version != taxonomy.version)
+
+def check_keyword_table_versions(taxonomy):
+    """Log the loaded keyword tables built from a different taxonomy than the active one, and return their names.
+    They are still used: keywords the build did not know fall back to default weights and no neighbours."""
+    stale = stale_keyword_tables(taxonomy)
+    for name in stale:
+        logger.warning("Keyword %s table was built from taxonomy %s but %s is active; rebuild it with build_keyword_tables.py",
+                       name, keyword_table_sources[name], taxonomy.version)
+    return stale
+
+def load_keyword_idf(path):
+    """Load the precomputed IDF table, falling back to uniform weights if it is missing or unreadable"""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        table = json.loads(raw.decode('utf-8'))
+        logger.info("Loaded keyword IDF table: %d keywords from %d job descriptions", len(table['idf']), table['documents'])
+        keyword_table_sources['idf'] = table.get('taxonomy_version')
+        return {
+            'version': hashlib.md5(raw).hexdigest()[:12],
+            'documents': table['documents'],
+            'average_document_length': table.get('average_document_length') or None,
+            'default_idf': table['default_idf'],
+            'idf': table['idf']
+        }
+    except FileNotFoundError:
+        logger.info("No keyword IDF table at %s, weighting keywords uniformly", path)
+    except (ValueError, KeyError) as e:
+        logger.error("Invalid keyword IDF table %s: %s, weighting keywords uniformly", path, e)
+    return {'version': 'uniform', 'documents': 0, 'average_document_length': None, 'default_idf': 1.0, 'idf': {}}
+
+with startup_phase('keyword_idf'):
+    keyword_idf = load_keyword_idf(app.config['KEYWORD_IDF_PATH'])
+
+def load_keyword_neighbours(path):
+    """Load the precomputed co-occurrence neighbours (best first), or an empty table if it is missing"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            table = json.load(f)
+        neighbours = {
+            keyword: tuple((neighbour, score) for neighbour, score in pairs)
+            for keyword, pairs in table['neighbours'].items()
+        }
+        logger.info("Loaded keyword neighbours for %d keywords from %d job descriptions", len(neighbours), table['documents'])
+        keyword_table_sources['neighbours'] = table.get('taxonomy_version')
+        return neighbours
+    except FileNotFoundError:
+        logger.info("No keyword neighbour table at %s, suggesting from the static keyword lists", path)
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error("Invalid keyword neighbour table %s: %s, suggesting from the static keyword lists", path, e)
+    return {}
+
+with startup_phase('keyword_neighbours'):
+    keyword_neighbours = load_keyword_neighbours(app.config['KEYWORD_NEIGHBOURS_PATH'])
+check_keyword_table_versions(keyword_taxonomy)
+
+def count_keyword_terms(text):
+    """Term frequency of every canonical keyword, in a single pass of the surface pattern"""
+    taxonomy = keyword_taxonomy
+    counts = defaultdict(int)
+    for match in taxonomy.surface_pattern.finditer(text.lower()):
+        counts[taxonomy.canonical[match.group()]] += 1
+    return counts
+
+def is_fuzzy_candidate(token, taxonomy):
+    """Whether a lowercased token is worth a fuzzy lookup: long enough, not a keyword and not a known word"""
+    return (len(token) >= FUZZY_MIN_TOKEN_LENGTH and token[0].isalpha() and token not in taxonomy.canonical
+            and token not in taxonomy.fuzzy_excluded_words)
+
+def fuzzy_candidates(words):
+    """The words eligible for a fuzzy lookup, deduplicated in order of appearance"""
+    taxonomy = keyword_taxonomy
+    return tuple(dict.fromkeys(word for word in words if is_fuzzy_candidate(word, taxonomy)))
+
+def find_fuzzy_keyword_matches(tokens, budget=None):
+    """Map canonical keyword IDs to misspelled tokens that match them, within a lookup budget.
+    Tokens are looked up in the order given, so pass them in document order."""
+    taxonomy = keyword_taxonomy
+    if budget is None:
+        budget = app.config['FUZZY_LOOKUP_BUDGET']
+    matches = {}
+    lookups = 0
+    hits = 0
+    exhausted = False
+    for token in tokens:
+        if not is_fuzzy_candidate(token, taxonomy):
+            continue
+        if not taxonomy.fuzzy_index.is_cached(token):
+            if lookups >= budget:
+                exhausted = True
+                break
+            lookups += 1
+        surface = taxonomy.fuzzy_index.lookup(token)
+        if surface:
+            hits += 1
+            matches.setdefault(taxonomy.canonical[surface], token)
+
+    with fuzzy_stats_lock:
+        fuzzy_match_stats['lookups'] += lookups
+        fuzzy_match_stats['hits'] += hits
+        if exhausted:
+            fuzzy_match_stats['budget_exhausted'] += 1
+    return matches
+
+def keyword_display_name(canonical):
+    """Preferred display form of a canonical keyword"""
+    return keyword_taxonomy.display_names.get(canonical) or canonical.title()
 
 def extract_technical_keywords(text):
     """Legacy function - use extract_technical_keywords_optimized for better performance"""
     return extract_technical_keywords_optimized(text)
 
+def canonicalize_keyword(keyword):
+    """Return the canonical keyword ID for a surface form (unknown keywords are just lowercased)"""
+    return keyword_taxonomy.canonicalize(keyword)
+
+def find_keyword_matches(text):
+    """Map each canonical keyword ID found in the text to the span of its first occurrence"""
+    taxonomy = keyword_taxonomy
+    matches = {}
+    for match in taxonomy.surface_pattern.finditer(text.lower()):
+        canonical = taxonomy.canonical[match.group()]
+        if canonical not in matches:
+            matches[canonical] = match.span()
+    return matches
+
+def dedupe_keywords(keywords):
+    """Remove duplicate keywords by canonical ID, keeping the first surface form"""
+    unique_keywords = []
+    seen = set()
+    for kw in keywords:
+        canonical = canonicalize_keyword(kw)
+        if canonical not in seen:
+            unique_keywords.append(kw)
+            seen.add(canonical)
+    return unique_keywords
+
+def find_missing_keywords(keywords, resume_text):
+    """Return the keywords whose canonical ID does not appear anywhere in the resume"""
+    resume_keywords = get_document_features(resume_text)['keyword_hits']
+    return [kw for kw in keywords if canonicalize_keyword(kw) not in resume_keywords]
+
 def extract_technical_keywords_optimized(text):
-    """Optimized keyword extraction with caching - restored original functionality"""
-    cache_key = get_cache_key('keywords', text[:1000])  # Back to original cache key size
+    """Optimized keyword extraction with caching - one keyword per canonical ID, in order of appearance.
+    Returns a shared tuple of interned strings, so cache entries reuse the same keyword objects."""
+    cache_key = taxonomy_cache_key('keywords', app.config['FUZZY_MATCHING'], text)
     cached_result = get_cached_result(keyword_cache, cache_key, 1800)  # 30 min cache
-    if cached_result:
+    if cached_result is not None:
         return cached_result
     
-    found_keywords = {}
-    
-    # Pre-compile regex patterns for better performance
-    word_boundary_pattern = re.compile(r'\b\w+\b')
-    skill_patterns = [
-        re.compile(r'proficient in\s+([\w\s,;&]+)', re.IGNORECASE),
-        re.compile(r'experience with\s+([\w\s,;&]+)', re.IGNORECASE),
-        re.compile(r'knowledge of\s+([\w\s,;&]+)', re.IGNORECASE),
-        re.compile(r'skills?:\s*([\w\s,;&]+)', re.IGNORECASE),
-        re.compile(r'technologies?:\s*([\w\s,;&]+)', re.IGNORECASE),
-        re.compile(r'languages?:\s*([\w\s,;&]+)', re.IGNORECASE),
-        re.compile(r'frameworks?:\s*([\w\s,;&]+)', re.IGNORECASE),
-        re.compile(r'tools?:\s*([\w\s,;&]+)', re.IGNORECASE),
-        re.compile(r'platforms?:\s*([\w\s,;&]+)', re.IGNORECASE)
-    ]
-    
-    # Fast exact match lookup using set
+    # A single pass of the compiled surface pattern finds every keyword and alias,
+    # and aliases collapse onto their canonical keyword
     text_lower = text.lower()
-    text_words = set(word_boundary_pattern.findall(text_lower))
-    
-    # Find exact matches first (fastest) - use ALL_KEYWORDS for completeness
-    for keyword in ALL_KEYWORDS:
-        if keyword in text_words:
-            original_case = find_keyword_with_original_case(text, keyword)
-            found_keywords[keyword] = original_case
-    
-    # Process skill patterns (more expensive, so do less)
-    for pattern in skill_patterns[:5]:  # Limit to first 5 patterns for speed
-        matches = pattern.finditer(text)
-        for match in matches:
-            skills_text = match.group(1)
-            terms = re.split(r'[;,/]|\band\b|\&|\s+', skills_text)
-            for term in terms:
-                term = term.strip()
-                if term and term in ALL_KEYWORDS:
-                    original_case = find_keyword_with_original_case(text, term)
-                    found_keywords[term] = original_case
-    
-    # Sort and cache result - restore original sorting
-    sorted_keywords = sorted(found_keywords.values(), 
-                           key=lambda x: text.lower().index(x.lower()))
+    source = text if len(text_lower) == len(text) else text_lower  # Keep spans aligned
+    found_keywords = {
+        canonical: (start, source[start:end])
+        for canonical, (start, end) in find_keyword_matches(text).items()
+    }
+    
+    if app.config['FUZZY_MATCHING']:
+        # Near-misses like 'Kubernets' resolve to the keyword and are shown correctly spelled
+        token_positions = {}
+        for match in WORD_BOUNDARY_PATTERN.finditer(text_lower):
+            token_positions.setdefault(match.group(), match.start())
+        for canonical, token in find_fuzzy_keyword_matches(token_positions).items():
+            if canonical not in found_keywords:
+                found_keywords[canonical] = (token_positions[token], keyword_display_name(canonical))
+    
+    sorted_keywords = tuple(sys.intern(kw) for _, kw in sorted(found_keywords.values(), key=lambda item: item[0]))
     
     set_cached_result(keyword_cache, cache_key, sorted_keywords, 1800)
     return sorted_keywords
@@ -453,88 +2067,76 @@ def categorize_keywords(keywords):
     }
     
     for keyword in keywords:
-        keyword_lower = keyword.lower()
-        for category, keyword_set in TECHNICAL_KEYWORDS.items():
-            if keyword_lower in keyword_set:
+        canonical = canonicalize_keyword(keyword)
+        for category, keyword_set in keyword_taxonomy.technical_keywords.items():
+            if canonical in keyword_set:
                 categorized[category].append(keyword)
                 break
     
     return categorized
 
-def find_section_paragraphs(doc):
-    """Find existing sections in the document and return their paragraph indices"""
-    sections = {}
-    for i, para in enumerate(doc.paragraphs):
-        text_upper = para.text.upper().strip()
-        # More specific matching to avoid false positives
-        if text_upper == 'SKILLS':
-            sections['skills'] = i
-        elif 'TOOLS' in text_upper and len(text_upper) < 20:  # Avoid matching "Tools/Frameworks:"
-            sections['tools'] = i
-        elif 'FRAMEWORKS' in text_upper and len(text_upper) < 20:
-            sections['frameworks'] = i
-        elif 'TECHNOLOGIES' in text_upper and len(text_upper) < 20:
-            sections['technologies'] = i
-    
-    return sections
+def build_section_index(doc):
+    """Classify section headers and skill-list paragraphs in a single pass over the document"""
+    paragraphs = doc.paragraphs  # python-docx rebuilds this list on every access
+    headers = {}
+    skill_lists = []
+    for i, para in enumerate(paragraphs):
+        text = para.text
+        if not text.strip():
+            continue
+        features = analyze_paragraph(text)
+        for section in features['headers']:
+            headers.setdefault(section, i)  # First matching header wins
+        if features['skill_list']:
+            skill_lists.append(i)
+    
+    return {
+        'paragraphs': paragraphs,
+        'headers': headers,
+        'skill_lists': skill_lists
+    }
 
 def insert_keywords_into_sections(doc, missing_keywords):
-    logger.info(f"insert_keywords_into_sections called with keywords: {missing_keywords}")
+    trace("insert_keywords_into_sections called with keywords: %s", missing_keywords)
     if not missing_keywords:
-        logger.info("No keywords to insert")
         return doc
     
-    logger.info(f"Document has {len(doc.paragraphs)} paragraphs")
-    for i, para in enumerate(doc.paragraphs):
-        logger.info(f"Paragraph {i}: '{para.text[:50]}...'")
-
-    def insert_after_header(header_variations):
-        logger.info(f"Looking for headers: {header_variations}")
-        idx = None
-        for i, para in enumerate(doc.paragraphs):
-            text_upper = para.text.strip().upper()
-            # Check for various header variations
-            for header in header_variations:
-                if header in text_upper and len(text_upper) < 30:  # Avoid matching text within sentences
-                    idx = i
-                    logger.info(f"Found header '{header}' at paragraph {i}: '{para.text}'")
-                    break
-            if idx is not None:
-                break
+    section_index = build_section_index(doc)
+    paragraphs = section_index['paragraphs']
+    skill_lists = section_index['skill_lists']
+    
+    if trace_enabled():
+        trace("Document has %d paragraphs", len(paragraphs))
+        for i, para in enumerate(paragraphs):
+            trace("Paragraph %d: %r", i, para.text[:50])
+
+    def insert_after_header(section):
+        idx = section_index['headers'].get(section)
+        if idx is None:
+            trace("No %s header found", section)
+            return False
         
-        if idx is not None:
-            logger.info(f"Looking for skills paragraph after header at index {idx}")
-            # Look for the next paragraph that contains skills/keywords
-            for j in range(idx + 1, len(doc.paragraphs)):
-                para = doc.paragraphs[j]
-                text = para.text.strip()
-                if text and (',' in text or '/' in text or '&' in text or ' and ' in text):
-                    logger.info(f"Found skills paragraph at index {j}: '{text}'")
-                    add_keywords_with_style(para, missing_keywords)
-                    return True  # Successfully added keywords
-            # If no suitable paragraph found, add keywords to the header paragraph itself
-            if idx < len(doc.paragraphs) - 1:
-                next_para = doc.paragraphs[idx + 1]
-                if not next_para.text.strip():  # Empty paragraph
-                    logger.info(f"Adding keywords to empty paragraph after header")
-                    add_keywords_with_style(next_para, missing_keywords)
-                    return True
-        else:
-            logger.info("No header found")
+        trace("Found %s header at paragraph %d", section, idx)
+        # Look for the next paragraph that contains skills/keywords
+        position = bisect.bisect_right(skill_lists, idx)
+        if position < len(skill_lists):
+            para = paragraphs[skill_lists[position]]
+            trace("Found skills paragraph at index %d", skill_lists[position])
+            add_keywords_with_style(para, missing_keywords)
+            return True  # Successfully added keywords
+        # If no suitable paragraph found, add keywords to the empty paragraph after the header
+        if idx < len(paragraphs) - 1:
+            next_para = paragraphs[idx + 1]
+            if not next_para.text.strip():  # Empty paragraph
+                trace("Adding keywords to empty paragraph after %s header", section)
+                add_keywords_with_style(next_para, missing_keywords)
+                return True
         return False
 
-    # Try different section header variations
-    skills_headers = ["SKILLS", "TECHNICAL SKILLS", "SKILLS & EXPERTISE", "COMPETENCIES", "EXPERTISE"]
-    tools_headers = ["TOOLS", "TECHNOLOGIES", "TECHNICAL TOOLS", "SOFTWARE", "PLATFORMS"]
-    frameworks_headers = ["FRAMEWORKS", "LIBRARIES", "TECHNOLOGIES", "TECH STACK"]
-    
     # Try to insert keywords in order of preference
-    if insert_after_header(skills_headers):
-        return doc
-    if insert_after_header(tools_headers):
-        return doc
-    if insert_after_header(frameworks_headers):
-        return doc
+    for section in ('skills', 'tools', 'frameworks'):
+        if insert_after_header(section):
+            return doc
     
     # If no suitable section found, add a new Skills section at the end
     if missing_keywords:
@@ -575,13 +2177,11 @@ def create_export_filename(company_name, job_role, format_type):
 
 def add_keywords_with_style(paragraph, keywords):
     """Add keywords to a paragraph by appending them to existing text with proper formatting."""
-    logger.info(f"add_keywords_with_style called with keywords: {keywords}")
-    logger.info(f"Original paragraph text: '{paragraph.text}'")
     if not keywords:
-        logger.info("No keywords to add to paragraph")
         return
     
     original_text = paragraph.text.strip()
+    trace("Adding keywords %s to paragraph %r", keywords, original_text)
     
     # FIRST: Detect the user's preferred separator style
     separator = ' and '  # default
@@ -630,7 +2230,7 @@ def add_keywords_with_style(paragraph, keywords):
         run.font.name = 'Calibri'
         run.font.size = Pt(11)
     
-    logger.info(f"Updated paragraph text: '{paragraph.text}'")
+    trace("Updated paragraph text: %r", final_text)
 
 @app.route('/optimize-docx', methods=['POST'])
 @timeout_handler(30)  # Back to 30 seconds for reliability
@@ -647,11 +2247,7 @@ def optimize_docx():
     export_format = request.form.get('exportFormat', 'docx').lower()
     
     # Debug logging for keywords
-    logger.info(f"Received extraKeywords: '{extra_keywords}'")
-    logger.info(f"All form data keys: {list(request.form.keys())}")
-    for key, value in request.form.items():
-        if 'keyword' in key.lower():
-            logger.info(f"Keyword parameter '{key}': '{value}'")
+    trace("Received extraKeywords: %r, form keys: %s", extra_keywords, list(request.form.keys()))
 
     # Enhanced validation with better error messages
     if resume_file.content_length and resume_file.content_length > app.config['MAX_CONTENT_LENGTH']:
@@ -667,107 +2263,109 @@ def optimize_docx():
     try:
         # Process extra keywords from user selection
         extra_keywords_list = [s.strip() for s in re.split(r'[;,/]|\\band\\b|\\&', extra_keywords) if s.strip()]
-        logger.info(f"Processed extra keywords: {extra_keywords_list}")
         
-        # Use circuit breaker for optimization - restore reliability
+        # Parse, score and rescore run through their stage circuit breakers
         def optimization_work():
             # Optimized file processing with memory management
             with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp:
-                resume_file.save(tmp.name)
-                doc = Document(tmp.name)
-
-                # Extract text more efficiently
-                full_text = '\n'.join([p.text for p in doc.paragraphs])
+                with timed_stage('upload'):
+                    resume_file.stream.seek(0)  # A retry must save the whole upload again
+                    resume_file.save(tmp.name)
+                with guarded_stage('parse'):
+                    doc = open_resume_document(tmp.name)
+
+                    # Extract text more efficiently
+                    full_text = '\n'.join([p.text for p in doc.paragraphs])
                 
                 # Use optimized ATS scoring with caching
-                original_ats_score = calculate_ats_score_optimized(full_text, job_description)
+                with guarded_stage('score'):
+                    original_ats_score = calculate_ats_score_optimized(full_text, job_description)
                 
                 # Use optimized keyword extraction
-                keywords = extract_technical_keywords_optimized(job_description)
-                missing_keywords = [kw for kw in keywords if kw.lower() not in full_text.lower()]
+                with timed_stage('keywords'):
+                    keywords = extract_technical_keywords_optimized(job_description)
+                    missing_keywords = find_missing_keywords(keywords, full_text)
+                    
+                    # Combine job keywords and extra keywords
+                    unique_keywords = dedupe_keywords(missing_keywords + extra_keywords_list)
                 
-                # Combine job keywords and extra keywords
-                all_keywords = missing_keywords + extra_keywords_list
-                unique_keywords = []
-                seen = set()
-                for kw in all_keywords:
-                    if kw.lower() not in seen:
-                        unique_keywords.append(kw)
-                        seen.add(kw.lower())
-                
-                logger.info(f"Job keywords: {keywords}")
-                logger.info(f"Missing job keywords: {missing_keywords}")
-                logger.info(f"Extra keywords: {extra_keywords_list}")
-                logger.info(f"All unique keywords to add: {unique_keywords}")
+                trace("Job keywords: %s, missing: %s, extra: %s", keywords, missing_keywords, extra_keywords_list)
 
                 # Insert keywords efficiently
-                logger.info(f"Calling insert_keywords_into_sections with {len(unique_keywords)} keywords")
-                doc = insert_keywords_into_sections(doc, unique_keywords)
-                logger.info("insert_keywords_into_sections completed")
-                
-                # Get optimized text
-                optimized_text = '\n'.join([p.text for p in doc.paragraphs])
+                with timed_stage('insert'):
+                    doc = insert_keywords_into_sections(doc, unique_keywords)
+                    
+                    # Get optimized text
+                    optimized_text = '\n'.join([p.text for p in doc.paragraphs])
                 
                 # Calculate optimized ATS score with caching
-                optimized_ats_score = calculate_ats_score_optimized(optimized_text, job_description, original_ats_score['total_score'])
+                with guarded_stage('rescore'):
+                    optimized_ats_score = calculate_ats_score_optimized(optimized_text, job_description, original_ats_score.total_score)
 
                 return doc, original_ats_score, optimized_ats_score, keywords, missing_keywords, optimized_text, unique_keywords
 
-        # Execute with retry and circuit breaker - restore reliability
+        # Execute with retry - restore reliability
         start_time = time.time()
         result = retry_with_backoff(
-            lambda: optimization_circuit_breaker.call(optimization_work)
+            optimization_work,
+            base_delay=0.25,
+            deadline=request_deadline()
         )
         
         doc, original_ats_score, optimized_ats_score, keywords, missing_keywords, optimized_text, unique_keywords = result
         processing_time = time.time() - start_time
 
         # Handle export formats efficiently
-        if export_format == 'txt':
-            text_content = docx_to_text(doc)
-            text_buffer = io.BytesIO()
-            text_buffer.write(text_content.encode('utf-8'))
-            text_buffer.seek(0)
-            filename = create_export_filename(company_name, job_role, 'txt')
-            response = send_file(
-                text_buffer,
-                as_attachment=True,
-                download_name=filename,
-                mimetype='text/plain'
-            )
-        else:
-            out_fd, out_path = tempfile.mkstemp(suffix='.docx')
-            os.close(out_fd)
-            doc.save(out_path)
-            filename = create_export_filename(company_name, job_role, 'docx')
-            response = send_file(out_path, as_attachment=True, download_name=filename)
+        with guarded_stage('serialize'):
+            if export_format == 'txt':
+                text_content = docx_to_text(doc)
+                text_buffer = io.BytesIO()
+                text_buffer.write(text_content.encode('utf-8'))
+                text_buffer.seek(0)
+                filename = create_export_filename(company_name, job_role, 'txt')
+                response = send_file(
+                    text_buffer,
+                    as_attachment=True,
+                    download_name=filename,
+                    mimetype='text/plain'
+                )
+            else:
+                out_fd, out_path = tempfile.mkstemp(suffix='.docx')
+                os.close(out_fd)
+                doc.save(out_path)
+                filename = create_export_filename(company_name, job_role, 'docx')
+                response = send_file(out_path, as_attachment=True, download_name=filename)
 
         # Add ATS scores to response headers
-        response.headers['X-Original-ATS-Score'] = str(original_ats_score['total_score'])
-        response.headers['X-Optimized-ATS-Score'] = str(optimized_ats_score['total_score'])
-        response.headers['X-ATS-Improvement'] = str(optimized_ats_score['improvement'])
+        response.headers['X-Original-ATS-Score'] = str(original_ats_score.total_score)
+        response.headers['X-Optimized-ATS-Score'] = str(optimized_ats_score.total_score)
+        response.headers['X-ATS-Improvement'] = str(optimized_ats_score.improvement)
         
         # Enhanced response with performance metrics - restored original functionality
         return jsonify({
-            'original_ats_score': original_ats_score,
-            'optimized_ats_score': optimized_ats_score,
+            'original_ats_score': original_ats_score.to_dict(),
+            'optimized_ats_score': optimized_ats_score.to_dict(),
             'keywords': keywords,
             'missing_keywords': missing_keywords,
             'extra_keywords': extra_keywords_list,
             'keywords_added': len(unique_keywords),
             'resumeText': optimized_text[:1000] + "..." if len(optimized_text) > 1000 else optimized_text,
             'download_ready': True,
-            'message': f'Resume optimized successfully! Added {len(unique_keywords)} keywords (including {len(extra_keywords_list)} selected keywords). ATS score improved by {optimized_ats_score["improvement"]:.1f} points.',
+            'message': f'Resume optimized successfully! Added {len(unique_keywords)} keywords (including {len(extra_keywords_list)} selected keywords). ATS score improved by {optimized_ats_score.improvement:.1f} points.',
             'performance_metrics': {
                 'processing_time_ms': int(processing_time * 1000),
-                'cache_hits': len([k for k in keyword_cache.keys() if 'keywords' in k]),
+                'cache_hits': request_state.cache_hits,
+                'stages_ms': stage_timings_ms(),
+                'memory_peak_kb': request_memory_peak_kb(),
                 'text_processed': len(optimized_text),
                 'keywords_found': len(keywords),
                 'keywords_added': len(unique_keywords)
             }
         })
+    except ProcessingError:
+        raise  # Answered with its own status by timeout_handler
     except Exception as e:
-        logger.error(f"Optimization failed: {str(e)}")
+        logger.error("Optimization failed: %s", e)
         # Provide helpful error messages
         if "timeout" in str(e).lower():
             return jsonify({'error': 'Processing took too long. Please try with a smaller file or shorter job description.'}), 408
@@ -775,9 +2373,6 @@ def optimize_docx():
             return jsonify({'error': 'File is too complex to process. Please try with a simpler resume format.'}), 413
         else:
             return jsonify({'error': 'Optimization failed. Please check your file format and try again.'}), 500
-    finally:
-        # Force garbage collection to free memory
-        gc.collect()
 
 @app.route('/export-formats', methods=['GET'])
 def get_export_formats():
@@ -802,130 +2397,127 @@ def get_export_formats():
 # --- Industry inference from job description ---
 def infer_industry(job_description):
     """Infer the most likely industry from the job description."""
-    scores = {k: 0 for k in INDUSTRY_KEYWORDS}
-    text = job_description.lower()
-    
-    # Count keyword matches for each industry
-    for industry, keywords in INDUSTRY_KEYWORDS.items():
-        for kw in keywords:
-            if kw.lower() in text:
-                scores[industry] += 1
-    
-    # Also check for common industry terms
-    industry_indicators = {
-        'software_engineering': ['software', 'developer', 'programmer', 'engineer', 'coding', 'programming', 'web', 'mobile', 'app', 'frontend', 'backend', 'fullstack'],
-        'data_analytics': ['data', 'analytics', 'analyst', 'business intelligence', 'bi', 'reporting', 'dashboard', 'kpi', 'metrics', 'statistics']
-    }
+    taxonomy = keyword_taxonomy
+    scores = [0] * len(taxonomy.industries)
+    seen = set()
     
-    for industry, indicators in industry_indicators.items():
-        for indicator in indicators:
-            if indicator in text:
-                scores[industry] += 1
+    # One pass of the compiled term pattern; each distinct term adds its weights once
+    for match in taxonomy.industry_pattern.finditer(job_description.lower()):
+        term = match.group()
+        if term in seen:
+            continue
+        seen.add(term)
+        for index, weight in taxonomy.industry_term_vectors[term]:
+            scores[index] += weight
     
-    # Return the industry with the highest score, default to software_engineering if no clear match
-    best_industry = max(scores.items(), key=lambda x: x[1])
-    return best_industry[0] if best_industry[1] > 0 else 'software_engineering'
+    # Return the industry with the highest score, falling back to the default if nothing matched
+    best_score = max(scores)
+    return taxonomy.industries[scores.index(best_score)] if best_score > 0 else taxonomy.default_industry
 
 # --- Keyword importance scoring ---
+def weight_keyword_terms(term_counts, document_length, industry):
+    """BM25 weight of each canonical keyword: saturated term frequency x corpus IDF x industry importance"""
+    idf = keyword_idf
+    industry_keywords = {canonicalize_keyword(kw) for kw in keyword_taxonomy.industry_keywords.get(industry, [])}
+    average_length = idf['average_document_length'] or document_length or 1
+    length_norm = BM25_K1 * (1 - BM25_B + BM25_B * document_length / average_length)
+    weights = {}
+    for canonical, tf in term_counts.items():
+        saturation = tf * (BM25_K1 + 1) / (tf + length_norm)
+        importance = 2 if canonical in industry_keywords else 1
+        weights[canonical] = saturation * idf['idf'].get(canonical, idf['default_idf']) * importance
+    return weights
+
 def score_keywords(job_description, industry):
-    """Return a dict of keyword: score, based on frequency and industry importance."""
-    text = job_description.lower()
-    industry_keywords = [kw.lower() for kw in INDUSTRY_KEYWORDS.get(industry, [])]
-    scores = {}
-    for kw in set(re.findall(r'\b\w[\w\+\#\.\-]*\b', job_description, re.IGNORECASE)):
-        freq = text.count(kw.lower())
-        importance = 2 if kw.lower() in industry_keywords else 1
-        if freq > 0:
-            scores[kw] = freq * importance
-    return scores
+    """Return a dict of keyword: score, based on frequency, rarity across job descriptions and industry importance."""
+    weights = weight_keyword_terms(count_keyword_terms(job_description), len(job_description.split()), industry)
+    return {keyword_display_name(canonical): round(weight, 3) for canonical, weight in weights.items()}
+
+def get_keyword_weights(job_description):
+    """Cached canonical keyword -> weight for every keyword extracted from the job description"""
+    cache_key = taxonomy_cache_key('keyword_weights', app.config['FUZZY_MATCHING'], keyword_idf['version'], job_description)
+    cached_result = get_cached_result(keyword_cache, cache_key, 1800)
+    if cached_result is not None:
+        return cached_result
+    
+    term_counts = count_keyword_terms(job_description)
+    for kw in extract_job_keywords_optimized(job_description):
+        term_counts.setdefault(canonicalize_keyword(kw), 1)  # Fuzzy matches are not in the surface pattern
+    weights = weight_keyword_terms(term_counts, len(job_description.split()), infer_industry(job_description))
+    
+    set_cached_result(keyword_cache, cache_key, weights, 1800)
+    return weights
+
+def weighted_match_percentage(job_keywords, resume_keywords, weights):
+    """Share of the job's keyword weight covered by the resume's canonical keyword IDs"""
+    total_weight = 0.0
+    matched_weight = 0.0
+    for kw in job_keywords:
+        canonical = canonicalize_keyword(kw)
+        weight = weights.get(canonical, 0.0)
+        total_weight += weight
+        if canonical in resume_keywords:
+            matched_weight += weight
+    return matched_weight / total_weight if total_weight else 0
+
+def scaled_neighbours(neighbours, weight):
+    """Neighbour list as (negated score, keyword) pairs, so heapq.merge yields the best first"""
+    for neighbour, score in neighbours:
+        yield -score * weight, neighbour
+
+def iter_neighbour_suggestions(seed_weights):
+    """Neighbours of the seed keywords, best first: a lazy heap merge of their precomputed lists"""
+    streams = [
+        scaled_neighbours(keyword_neighbours[seed], weight)
+        for seed, weight in seed_weights.items() if seed in keyword_neighbours
+    ]
+    for _, neighbour in heapq.merge(*streams):
+        yield neighbour
 
 # --- Suggest up to 4 high-impact, industry-specific keywords not already in the resume or job description ---
 def suggest_extra_keywords(resume_text, job_description, industry, max_suggestions=4):
-    # Add timeout protection
-    start_time = time.time()
-    max_processing_time = 5  # 5 seconds max (reduced from 10)
-    
-    # Normalize resume words: lowercase, remove punctuation
-    resume_words = set([
-        w.lower().strip(string.punctuation)
-        for w in re.findall(r'\b\w[\w\+\#\.\-]*\b', resume_text)
-    ])
-    
-    # Normalize job description words: lowercase, remove punctuation
-    job_words = set([
+    # Normalize resume and job description words: lowercase, remove punctuation
+    mentioned_words = set([
         w.lower().strip(string.punctuation)
-        for w in re.findall(r'\b\w[\w\+\#\.\-]*\b', job_description)
+        for w in re.findall(r'\b\w[\w\+\#\.\-]*\b', resume_text + '\n' + job_description)
     ])
     
-    # Use a more efficient approach - focus on most common keywords
-    # Start with industry-specific keywords first (higher priority)
-    industry_keywords = INDUSTRY_KEYWORDS.get(industry, [])
-    
-    # Take only the most common technical keywords from priority categories
-    common_technical_keywords = []
-    priority_categories = ['programming_languages', 'web_technologies', 'databases', 'cloud_platforms']
-    
-    # Most common keywords from each category (top 10-15 most relevant)
-    common_keywords_by_category = {
-        'programming_languages': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'go', 'rust', 'scala', 'r', 'sql'],
-        'web_technologies': ['html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'bootstrap', 'tailwind', 'graphql', 'rest'],
-        'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'sql server', 'dynamodb', 'elasticsearch', 'neo4j', 'firebase'],
-        'cloud_platforms': ['aws', 'azure', 'gcp', 'heroku', 'digitalocean', 'firebase', 'vercel', 'netlify', 'supabase']
-    }
+    # Canonical IDs already covered, so 'JS' in the job rules out suggesting 'JavaScript'
+    resume_keywords = get_document_features(resume_text)['keyword_hits']
+    job_keywords = set(find_keyword_matches(job_description))
+    covered_keywords = resume_keywords | job_keywords
     
-    for category in priority_categories:
-        if category in common_keywords_by_category:
-            common_technical_keywords.extend(common_keywords_by_category[category])
-    
-    # Combine keywords but limit total size
-    all_keywords = industry_keywords + common_technical_keywords[:50]  # Limit to 50 total
-    
-    # Remove duplicates and filter out keywords already in resume OR job description
     suggestions = []
-    seen = set()
-    
-    for kw in all_keywords:
-        # Check timeout
-        if time.time() - start_time > max_processing_time:
+    seen = set(covered_keywords)
+    
+    def add_suggestion(canonical):
+        if canonical in seen or canonical in mentioned_words:
+            return False
+        seen.add(canonical)
+        suggestions.append(keyword_display_name(canonical))
+        return len(suggestions) >= max_suggestions
+    
+    # Keywords that most often accompany the job's keywords in other job descriptions,
+    # with the job's most important keywords counting most
+    if keyword_neighbours:
+        seed_weights = get_keyword_weights(job_description) if job_keywords else dict.fromkeys(resume_keywords, 1.0)
+        for canonical in iter_neighbour_suggestions(seed_weights):
+            if add_suggestion(canonical):
+                return suggestions
+    
+    # Top up from the static lists: industry-specific keywords first, then the most common
+    # keywords from the priority categories, then general terms
+    taxonomy = keyword_taxonomy
+    static_keywords = list(taxonomy.industry_keywords.get(industry, []))
+    for category in ('programming_languages', 'web_technologies', 'databases', 'cloud_platforms'):
+        static_keywords.extend(taxonomy.suggestion_keywords.get(category, []))
+    static_keywords.extend(taxonomy.fallback_suggestions)
+    
+    for kw in static_keywords:
+        if add_suggestion(canonicalize_keyword(kw)):
             break
-            
-        kw_lower = kw.lower().strip(string.punctuation)
-        # Only suggest keywords that are NOT in resume AND NOT in job description
-        if kw_lower not in resume_words and kw_lower not in job_words and kw_lower not in seen:
-            # Simplified case handling
-            if ' ' in kw:
-                # Multi-word terms
-                display_kw = ' '.join(word.title() for word in kw.split())
-            else:
-                # Single word terms
-                display_kw = kw.title()
-            
-            suggestions.append(display_kw)
-            seen.add(kw_lower)
-            if len(suggestions) >= max_suggestions:
-                break
-    
-    # If we don't have enough suggestions, add some common technical terms
-    if len(suggestions) < max_suggestions and time.time() - start_time < max_processing_time:
-        common_tech_terms = [
-            'Git', 'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP', 'CI/CD', 'REST API', 'GraphQL',
-            'Microservices', 'Agile', 'Scrum', 'DevOps', 'Cloud Computing', 'API Development',
-            'Database Design', 'System Architecture', 'Performance Optimization', 'Security',
-            'Testing', 'Code Review', 'Version Control', 'Linux', 'Shell Scripting'
-        ]
-        
-        for term in common_tech_terms:
-            if time.time() - start_time > max_processing_time:
-                break
-                
-            term_lower = term.lower().strip(string.punctuation)
-            if term_lower not in resume_words and term_lower not in job_words and term_lower not in seen:
-                suggestions.append(term)
-                seen.add(term_lower)
-                if len(suggestions) >= max_suggestions:
-                    break
     
-    return suggestions[:max_suggestions]
+    return suggestions
 
 @app.route('/suggest-keywords', methods=['POST'])
 @timeout_handler(15)  # 15 second timeout
@@ -947,11 +2539,15 @@ def suggest_keywords():
     try:
         # Save uploaded file to a temp location
         with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp:
-            resume_file.save(tmp.name)
-            doc = Document(tmp.name)
-        resume_text = '\n'.join([p.text for p in doc.paragraphs])
-        industry = infer_industry(job_description)
-        suggestions = suggest_extra_keywords(resume_text, job_description, industry)
+            with timed_stage('upload'):
+                resume_file.save(tmp.name)
+            with guarded_stage('parse'):
+                doc = open_resume_document(tmp.name)
+                resume_text = '\n'.join([p.text for p in doc.paragraphs])
+        with timed_stage('industry'):
+            industry = infer_industry(job_description)
+        with timed_stage('suggest'):
+            suggestions = suggest_extra_keywords(resume_text, job_description, industry)
         
         # Add debug information
         resume_words = set([
@@ -966,10 +2562,16 @@ def suggest_keywords():
                 'resume_text_length': len(resume_text),
                 'resume_words_count': len(resume_words),
                 'suggestions_count': len(suggestions),
-                'industry_keywords_available': len(INDUSTRY_KEYWORDS.get(industry, [])),
-                'technical_keywords_total': sum(len(keywords) for keywords in TECHNICAL_KEYWORDS.values())
+                'industry_keywords_available': len(keyword_taxonomy.industry_keywords.get(industry, [])),
+                'technical_keywords_total': sum(len(keywords) for keywords in keyword_taxonomy.technical_keywords.values())
+            },
+            'performance_metrics': {
+                'cache_hits': request_state.cache_hits,
+                'stages_ms': stage_timings_ms()
             }
         })
+    except ProcessingError:
+        raise
     except Exception as e:
         return jsonify({'error': f'Keyword suggestion failed: {str(e)}'}), 500
 
@@ -996,60 +2598,191 @@ def finalize_resume():
 
     try:
         with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp:
-            resume_file.save(tmp.name)
-            doc = Document(tmp.name)
-
-        full_text = '\n'.join([p.text for p in doc.paragraphs])
+            with timed_stage('upload'):
+                resume_file.save(tmp.name)
+            with guarded_stage('parse'):
+                doc = open_resume_document(tmp.name)
+                full_text = '\n'.join([p.text for p in doc.paragraphs])
         
         # Calculate original ATS score
-        original_ats_score = calculate_ats_score(full_text, job_description)
+        with guarded_stage('score'):
+            original_ats_score = calculate_ats_score(full_text, job_description)
         
-        job_keywords = extract_technical_keywords(job_description)
-        missing_job_keywords = [kw for kw in job_keywords if kw.lower() not in full_text.lower()]
-        extra_keywords_list = [s.strip() for s in re.split(r'[;,/]|\\band\\b|\\&', extra_keywords) if s.strip()]
-        all_keywords = missing_job_keywords + extra_keywords_list
-        unique_keywords = []
-        seen = set()
-        for kw in all_keywords:
-            if kw.lower() not in seen:
-                unique_keywords.append(kw)
-                seen.add(kw.lower())
-        doc = insert_keywords_into_sections(doc, unique_keywords)
-        
-        # Get final optimized text for ATS scoring
-        final_text = '\n'.join([p.text for p in doc.paragraphs])
+        with timed_stage('keywords'):
+            job_keywords = extract_technical_keywords(job_description)
+            missing_job_keywords = find_missing_keywords(job_keywords, full_text)
+            extra_keywords_list = [s.strip() for s in re.split(r'[;,/]|\\band\\b|\\&', extra_keywords) if s.strip()]
+            unique_keywords = dedupe_keywords(missing_job_keywords + extra_keywords_list)
+        with timed_stage('insert'):
+            doc = insert_keywords_into_sections(doc, unique_keywords)
+            
+            # Get final optimized text for ATS scoring
+            final_text = '\n'.join([p.text for p in doc.paragraphs])
         
         # Calculate final optimized ATS score
-        final_ats_score = calculate_ats_score(final_text, job_description, original_ats_score['total_score'])
-
-        if export_format == 'txt':
-            text_content = docx_to_text(doc)
-            text_buffer = io.BytesIO()
-            text_buffer.write(text_content.encode('utf-8'))
-            text_buffer.seek(0)
-            filename = create_export_filename(company_name, job_role, 'txt')
-            response = send_file(
-                text_buffer,
-                as_attachment=True,
-                download_name=filename,
-                mimetype='text/plain'
-            )
-        else:
-            out_fd, out_path = tempfile.mkstemp(suffix='.docx')
-            os.close(out_fd)
-            doc.save(out_path)
-            filename = create_export_filename(company_name, job_role, 'docx')
-            response = send_file(out_path, as_attachment=True, download_name=filename)
+        with guarded_stage('rescore'):
+            final_ats_score = calculate_ats_score(final_text, job_description, original_ats_score.total_score)
+
+        with guarded_stage('serialize'):
+            if export_format == 'txt':
+                text_content = docx_to_text(doc)
+                text_buffer = io.BytesIO()
+                text_buffer.write(text_content.encode('utf-8'))
+                text_buffer.seek(0)
+                filename = create_export_filename(company_name, job_role, 'txt')
+                response = send_file(
+                    text_buffer,
+                    as_attachment=True,
+                    download_name=filename,
+                    mimetype='text/plain'
+                )
+            else:
+                out_fd, out_path = tempfile.mkstemp(suffix='.docx')
+                os.close(out_fd)
+                doc.save(out_path)
+                filename = create_export_filename(company_name, job_role, 'docx')
+                response = send_file(out_path, as_attachment=True, download_name=filename)
         
         # Add ATS scores to response headers
-        response.headers['X-Original-ATS-Score'] = str(original_ats_score['total_score'])
-        response.headers['X-Optimized-ATS-Score'] = str(final_ats_score['total_score'])
-        response.headers['X-ATS-Improvement'] = str(final_ats_score['improvement'])
+        response.headers['X-Original-ATS-Score'] = str(original_ats_score.total_score)
+        response.headers['X-Optimized-ATS-Score'] = str(final_ats_score.total_score)
+        response.headers['X-ATS-Improvement'] = str(final_ats_score.improvement)
         
         return response
+    except ProcessingError:
+        raise
     except Exception as e:
         return jsonify({'error': f'Finalization failed: {str(e)}'}), 500
 
+# --- Paragraph-level feature cache ---
+# Resumes are re-submitted with only a line or two edited, so each paragraph is analyzed
+# once and cached by content hash; document features are a merge of cached paragraphs.
+ACTION_VERBS = frozenset({
+    'developed', 'implemented', 'managed', 'created', 'designed', 'built',
+    'improved', 'increased', 'decreased', 'led', 'coordinated', 'organized',
+    'analyzed', 'researched', 'planned', 'executed', 'delivered', 'achieved'
+})
+
+# The content-quality and formatting detectors as one named-group alternation, so a paragraph is
+# swept once and each match is counted under its group name. Runs on lowercased text. The leading
+# lookahead lists the first characters of every branch, so most positions are rejected at once.
+FEATURE_SCAN_PATTERN = re.compile(
+    r'(?=[0-9$<cdiprst])(?:'
+    # 'increased by 40%' - the number is left for achievement_amount to count as well
+    r'(?P<achievement_delta>\b(?:increased|decreased|reduced|improved) by (?=\d))'
+    r'|(?P<achievement_amount>\d+(?:%|\s*percent|\s*dollars)|\$\d+)'
+    r'|(?P<layout_markup><(?:table|img|chart|header|footer))'
+    r'|(?P<layout_style>columns?|text-align:\s*center|position:\s*absolute)'
+    r'|(?P<skills_mention>skills?)'
+    r')'
+)
+ACHIEVEMENT_FEATURES = ('achievement_amount', 'achievement_delta')
+FORMATTING_ISSUE_FEATURES = ('layout_markup', 'layout_style')
+
+def scan_paragraph_features(text_lower):
+    """Sweep the feature pattern over a lowercased paragraph once, returning counts per feature"""
+    counts = defaultdict(int)
+    for match in FEATURE_SCAN_PATTERN.finditer(text_lower):
+        counts[match.lastgroup] += 1
+    return counts
+
+# Header variations per resume section (matched against short, upper-cased paragraphs)
+SECTION_HEADERS = {
+    'skills': ["SKILLS", "TECHNICAL SKILLS", "SKILLS & EXPERTISE", "COMPETENCIES", "EXPERTISE"],
+    'tools': ["TOOLS", "TECHNOLOGIES", "TECHNICAL TOOLS", "SOFTWARE", "PLATFORMS"],
+    'frameworks': ["FRAMEWORKS", "LIBRARIES", "TECHNOLOGIES", "TECH STACK"],
+    'experience': ["EXPERIENCE", "WORK HISTORY", "EMPLOYMENT"],
+    'education': ["EDUCATION"],
+    'summary': ["SUMMARY", "OBJECTIVE", "PROFILE"],
+    'qualifications': ["QUALIFICATIONS", "CERTIFICATIONS"],
+    'achievements': ["ACHIEVEMENTS", "AWARDS"]
+}
+
+def classify_paragraph_header(text):
+    """Return the sections a short header-like paragraph belongs to"""
+    text_upper = text.strip().upper()
+    if not text_upper or len(text_upper) >= 30:  # Avoid matching text within sentences
+        return ()
+    return tuple(
+        section for section, variations in SECTION_HEADERS.items()
+        if any(header in text_upper for header in variations)
+    )
+
+def analyze_paragraph(text):
+    """Extract scoring features from a single paragraph, cached by content hash"""
+    cache_key = taxonomy_cache_key('paragraph', text)
+    cached_result = get_cached_result(paragraph_feature_cache, cache_key, app.config['CACHE_TTL'])
+    if cached_result is not None:
+        return cached_result
+
+    text_lower = text.lower()
+    stripped = text.strip()
+    words = WORD_BOUNDARY_PATTERN.findall(text_lower)
+    tokens = frozenset(map(sys.intern, words))  # Shared across cached paragraphs
+    feature_counts = scan_paragraph_features(text_lower)
+    features = {
+        'tokens': tokens,
+        'fuzzy_candidates': fuzzy_candidates(words),  # In order, so the lookup budget goes to the top of the resume
+        'keyword_hits': frozenset(find_keyword_matches(text)),  # Canonical keyword IDs
+        'action_verbs': tokens & ACTION_VERBS,  # Whole words, so 'skilled' no longer counts as 'led'
+        'achievement_counts': tuple(feature_counts[name] for name in ACHIEVEMENT_FEATURES),
+        'formatting_issues': tuple(feature_counts[name] > 0 for name in FORMATTING_ISSUE_FEATURES),
+        'mentions_skills': feature_counts['skills_mention'] > 0,
+        'headers': classify_paragraph_header(text),
+        'skill_list': bool(stripped) and (',' in stripped or '/' in stripped or '&' in stripped or ' and ' in stripped),
+        'word_count': len(text.split())
+    }
+
+    if len(paragraph_feature_cache) >= app.config['PARAGRAPH_CACHE_MAX_ENTRIES']:
+        # Evict the oldest entry - dicts preserve insertion order
+        try:
+            if paragraph_feature_cache.pop(next(iter(paragraph_feature_cache)), None) is not None:
+                paragraph_feature_cache.count(evictions=1)
+        except (StopIteration, RuntimeError):
+            pass
+    set_cached_result(paragraph_feature_cache, cache_key, features, app.config['CACHE_TTL'])
+    return features
+
+def get_document_features(resume_text):
+    """Merge cached paragraph features into document-level features"""
+    tokens = set()
+    candidates = {}  # Fuzzy lookup candidates in document order
+    keyword_hits = set()
+    action_verbs = set()
+    achievement_counts = [0] * len(ACHIEVEMENT_FEATURES)
+    formatting_issues = [False] * len(FORMATTING_ISSUE_FEATURES)
+    mentions_skills = False
+    sections = set()
+    word_count = 0
+
+    for paragraph in resume_text.split('\n'):
+        if not paragraph.strip():
+            continue
+        features = analyze_paragraph(paragraph)
+        tokens |= features['tokens']
+        candidates.update(dict.fromkeys(features['fuzzy_candidates']))
+        keyword_hits |= features['keyword_hits']
+        action_verbs |= features['action_verbs']
+        for i, count in enumerate(features['achievement_counts']):
+            achievement_counts[i] += count
+        for i, flagged in enumerate(features['formatting_issues']):
+            formatting_issues[i] = formatting_issues[i] or flagged
+        mentions_skills = mentions_skills or features['mentions_skills']
+        sections.update(features['headers'])
+        word_count += features['word_count']
+
+    return {
+        'tokens': tokens,
+        'fuzzy_candidates': tuple(candidates),
+        'keyword_hits': keyword_hits,
+        'action_verbs': action_verbs,
+        'achievement_counts': achievement_counts,
+        'formatting_issues': formatting_issues,
+        'mentions_skills': mentions_skills,
+        'sections': sections,
+        'word_count': word_count
+    }
+
 def calculate_ats_score(resume_text, job_description, original_score=None):
     """Legacy function - use calculate_ats_score_optimized for better performance"""
     return calculate_ats_score_optimized(resume_text, job_description, original_score)
@@ -1057,32 +2790,22 @@ def calculate_ats_score(resume_text, job_description, original_score=None):
 def calculate_ats_score_optimized(resume_text, job_description, original_score=None):
     """Optimized ATS score calculation with caching - restored original functionality"""
     if not resume_text or not job_description:
-        return {
-            'total_score': 0,
-            'keyword_score': 0,
-            'formatting_score': 0,
-            'content_score': 0,
-            'structure_score': 0,
-            'length_score': 0,
-            'improvement': 0
-        }
+        return EMPTY_ATS_SCORE
     
-    cache_key = get_cache_key('ats_score', resume_text[:500], job_description[:500])
+    cache_key = taxonomy_cache_key('ats_score', app.config['FUZZY_MATCHING'], resume_text, job_description)
     cached_result = get_cached_result(ats_score_cache, cache_key, 1800)
-    if cached_result:
+    if cached_result is not None:
+        # Cached records are shared, so the improvement goes on a copy
         if original_score:
-            cached_result['improvement'] = round(cached_result['total_score'] - original_score, 1)
+            return cached_result._replace(improvement=round(cached_result.total_score - original_score, 1))
         return cached_result
     
-    # Parallel processing of different score components - restore original
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        future_keyword = executor.submit(calculate_keyword_match_score_optimized, resume_text.lower(), job_description.lower())
-        future_formatting = executor.submit(calculate_formatting_score_optimized, resume_text)
-        future_content = executor.submit(calculate_content_quality_score_optimized, resume_text)
-        
-        keyword_score = future_keyword.result()
-        formatting_score = future_formatting.result()
-        content_score = future_content.result()
+    # Document features are merged from cached paragraphs, so only edited paragraphs are re-analyzed
+    features = get_document_features(resume_text)
+    keyword_score = calculate_keyword_match_score_optimized(resume_text, job_description, features)
+    formatting_score = calculate_formatting_score_optimized(resume_text, features)
+    content_score = calculate_content_quality_score_optimized(resume_text, features)
+    structure_score = calculate_structure_score_optimized(resume_text, features)
     
     # Calculate weighted total score - restore original weights
     total_score = (
@@ -1093,42 +2816,42 @@ def calculate_ats_score_optimized(resume_text, job_description, original_score=N
     
     total_score = max(0, min(100, total_score))
     
-    result = {
-        'total_score': round(total_score, 1),
-        'keyword_score': round(keyword_score, 1),
-        'formatting_score': round(formatting_score, 1),
-        'content_score': round(content_score, 1),
-        'structure_score': 85.0,  # Default good score
-        'length_score': 90.0,     # Default good score
-        'improvement': round(total_score - (original_score or 0), 1) if original_score else 0
-    }
+    result = ATSScore(
+        total_score=round(total_score, 1),
+        keyword_score=round(keyword_score, 1),
+        formatting_score=round(formatting_score, 1),
+        content_score=round(content_score, 1),
+        structure_score=round(structure_score, 1),
+        length_score=90.0,     # Default good score
+        improvement=0
+    )
     
     set_cached_result(ats_score_cache, cache_key, result, 1800)
+    if original_score:
+        return result._replace(improvement=round(total_score - original_score, 1))
     return result
 
 def calculate_keyword_match_score(resume_text, job_description):
     """Legacy function - use calculate_keyword_match_score_optimized for better performance"""
     return calculate_keyword_match_score_optimized(resume_text, job_description)
 
-def calculate_keyword_match_score_optimized(resume_text, job_description):
+def calculate_keyword_match_score_optimized(resume_text, job_description, features=None):
     """Optimized keyword matching with better performance"""
     job_keywords = extract_job_keywords_optimized(job_description)
     
     if not job_keywords:
         return 50
     
-    # Use set for faster lookups
-    resume_words = set(re.findall(r'\b\w+\b', resume_text))
-    matched_keywords = []
-    
-    for keyword in job_keywords:
-        keyword_lower = keyword.lower()
-        if keyword_lower in resume_words:
-            matched_keywords.append(keyword)
-        elif keyword_lower in resume_text:  # Fallback for multi-word keywords
-            matched_keywords.append(keyword)
+    if features is None:
+        features = get_document_features(resume_text)
+    # Both sides are compared by canonical ID, so 'JS' in the resume credits 'JavaScript'
+    resume_keywords = features['keyword_hits']
+    if app.config['FUZZY_MATCHING'] and any(canonicalize_keyword(kw) not in resume_keywords for kw in job_keywords):
+        # Also credit misspelled keywords in the resume
+        resume_keywords = resume_keywords | set(find_fuzzy_keyword_matches(features['fuzzy_candidates']))
     
-    match_percentage = len(matched_keywords) / len(job_keywords)
+    # Rare, repeated and industry-relevant keywords count for more than boilerplate ones
+    match_percentage = weighted_match_percentage(job_keywords, resume_keywords, get_keyword_weights(job_description))
     
     # More granular scoring to show improvements
     if match_percentage >= 0.9:
@@ -1158,49 +2881,27 @@ def extract_job_keywords(job_description):
 
 def extract_job_keywords_optimized(job_description):
     """Optimized job keyword extraction"""
-    cache_key = get_cache_key('job_keywords', job_description[:1000])
-    cached_result = get_cached_result(keyword_cache, cache_key, 1800)
-    if cached_result:
-        return cached_result
-    
-    keywords = extract_technical_keywords_optimized(job_description)
-    
-    # Simplified additional keyword extraction
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', job_description.lower())
-    additional_keywords = [word for word in words if word in ALL_KEYWORDS]
-    
-    all_keywords = list(keywords) + additional_keywords
-    unique_keywords = []
-    seen = set()
-    for kw in all_keywords:
-        if kw.lower() not in seen:
-            unique_keywords.append(kw)
-            seen.add(kw.lower())
-    
-    result = unique_keywords[:20]  # Reduced limit for speed
-    set_cached_result(keyword_cache, cache_key, result, 1800)
-    return result
+    # Technical extraction already yields one keyword per canonical ID and caches the tuple,
+    # so job keywords share its cache entry. Every keyword is kept: the match score weights
+    # them, so minor ones no longer dilute it
+    return extract_technical_keywords_optimized(job_description)
 
 def calculate_formatting_score(resume_text):
     """Legacy function - use calculate_formatting_score_optimized for better performance"""
     return calculate_formatting_score_optimized(resume_text)
 
-def calculate_formatting_score_optimized(resume_text):
+def calculate_formatting_score_optimized(resume_text, features=None):
     """Optimized formatting score calculation"""
+    if features is None:
+        features = get_document_features(resume_text)
     score = 80
     
-    # Pre-compiled patterns for better performance
-    problematic_patterns = [
-        re.compile(r'<table|<img|<chart|<header|<footer', re.IGNORECASE),
-        re.compile(r'columns?|text-align:\s*center|position:\s*absolute', re.IGNORECASE)
-    ]
-    
-    for pattern in problematic_patterns:
-        if pattern.search(resume_text):
+    for flagged in features['formatting_issues']:
+        if flagged:
             score -= 10
     
     # Check for good formatting
-    if re.search(r'skills?', resume_text, re.IGNORECASE):
+    if features['mentions_skills']:
         score += 10
     
     return max(0, min(100, score))
@@ -1209,49 +2910,37 @@ def calculate_content_quality_score(resume_text):
     """Legacy function - use calculate_content_quality_score_optimized for better performance"""
     return calculate_content_quality_score_optimized(resume_text)
 
-def calculate_content_quality_score_optimized(resume_text):
+def calculate_content_quality_score_optimized(resume_text, features=None):
     """Optimized content quality score calculation"""
+    if features is None:
+        features = get_document_features(resume_text)
     score = 70
     
-    # Pre-compiled action verbs set for faster lookup
-    action_verbs = {
-        'developed', 'implemented', 'managed', 'created', 'designed', 'built',
-        'improved', 'increased', 'decreased', 'led', 'coordinated', 'organized',
-        'analyzed', 'researched', 'planned', 'executed', 'delivered', 'achieved'
-    }
-    
-    resume_lower = resume_text.lower()
-    action_verb_count = sum(1 for verb in action_verbs if verb in resume_lower)
-    score += min(20, action_verb_count * 2)
+    score += min(20, len(features['action_verbs']) * 2)
     
     # Check for quantifiable achievements
-    achievement_patterns = [
-        re.compile(r'\d+%|\d+\s*percent|\$\d+|\d+\s*dollars', re.IGNORECASE),
-        re.compile(r'increased by \d+|decreased by \d+|reduced by \d+|improved by \d+', re.IGNORECASE)
-    ]
-    
-    achievement_count = sum(1 for pattern in achievement_patterns if pattern.search(resume_text))
+    achievement_count = sum(1 for count in features['achievement_counts'] if count)
     score += min(10, achievement_count * 2)
     
     return max(0, min(100, score))
 
 def calculate_structure_score(resume_text):
-    """Calculate structure score (0-100)"""
-    score = 80  # Start with higher base score
+    """Legacy function - use calculate_structure_score_optimized for better performance"""
+    return calculate_structure_score_optimized(resume_text)
+
+def calculate_structure_score_optimized(resume_text, features=None):
+    """Calculate structure score (0-100) from the section headers found in the resume"""
+    if features is None:
+        features = get_document_features(resume_text)
+    sections = features['sections']
+    score = 60
     
     # Check for required sections
     required_sections = ['experience', 'education', 'skills']
-    section_count = sum(1 for section in required_sections if section in resume_text.lower())
-    score += section_count * 10  # Reduced points per section but higher base
-    
-    # Check for proper section headers
-    header_patterns = [
-        r'experience', r'education', r'skills', r'summary', r'objective',
-        r'work history', r'employment', r'qualifications', r'achievements'
-    ]
+    score += sum(10 for section in required_sections if section in sections)
     
-    header_count = sum(1 for pattern in header_patterns if re.search(pattern, resume_text, re.IGNORECASE))
-    score += min(10, header_count * 2)  # Reduced max points
+    # Reward additional recognised section headers
+    score += min(10, len(sections - set(required_sections)) * 2)
     
     return max(0, min(100, score))
 
@@ -1275,13 +2964,12 @@ def optimize_for_ats(resume_text, job_description, target_score=95):
     """
     current_score = calculate_ats_score(resume_text, job_description)
     
-    if current_score['total_score'] >= target_score:
+    if current_score.total_score >= target_score:
         return resume_text, current_score
     
     # Extract missing keywords
-    job_keywords = extract_job_keywords(job_description.lower())
-    resume_lower = resume_text.lower()
-    missing_keywords = [kw for kw in job_keywords if kw.lower() not in resume_lower]
+    job_keywords = extract_job_keywords(job_description)
+    missing_keywords = find_missing_keywords(job_keywords, resume_text)
     
     # Add missing keywords strategically
     optimized_text = resume_text
@@ -1293,7 +2981,7 @@ def optimize_for_ats(resume_text, job_description, target_score=95):
         optimized_text += skills_section
     
     # Recalculate score
-    new_score = calculate_ats_score(optimized_text, job_description, current_score['total_score'])
+    new_score = calculate_ats_score(optimized_text, job_description, current_score.total_score)
     
     return optimized_text, new_score
 
@@ -1311,17 +2999,25 @@ def calculate_ats_score_endpoint():
             return jsonify({'error': 'Job description is required'}), 400
         
         # Read the DOCX file
-        doc = Document(resume_file)
-        resume_text = docx_to_text(doc)
+        with guarded_stage('parse'):
+            doc = open_resume_document(resume_file)
+            resume_text = docx_to_text(doc)
         
         # Calculate ATS score
-        ats_score = calculate_ats_score(resume_text, job_description)
+        with guarded_stage('score'):
+            ats_score = calculate_ats_score(resume_text, job_description)
         
         return jsonify({
-            'ats_score': ats_score,
-            'resume_text': resume_text[:500] + "..." if len(resume_text) > 500 else resume_text
+            'ats_score': ats_score.to_dict(),
+            'resume_text': resume_text[:500] + "..." if len(resume_text) > 500 else resume_text,
+            'performance_metrics': {
+                'cache_hits': request_state.cache_hits,
+                'stages_ms': stage_timings_ms()
+            }
         })
         
+    except ProcessingError:
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1340,29 +3036,33 @@ def optimize_ats_endpoint():
             return jsonify({'error': 'Job description is required'}), 400
         
         # Read the DOCX file
-        doc = Document(resume_file)
-        original_text = docx_to_text(doc)
+        with guarded_stage('parse'):
+            doc = open_resume_document(resume_file)
+            original_text = docx_to_text(doc)
         
         # Calculate original ATS score
-        original_score = calculate_ats_score(original_text, job_description)
+        with guarded_stage('score'):
+            original_score = calculate_ats_score(original_text, job_description)
         
         # Optimize for ATS
-        optimized_text, optimized_score = optimize_for_ats(original_text, job_description, target_score)
-        
-        # Create optimized document
-        optimized_doc = Document()
+        with timed_stage('optimize'):
+            optimized_text, optimized_score = optimize_for_ats(original_text, job_description, target_score)
         
-        # Add optimized content
-        for paragraph in optimized_text.split('\n'):
-            if paragraph.strip():
-                p = optimized_doc.add_paragraph(paragraph.strip())
-                p.style.font.name = 'Calibri'
-                p.style.font.size = Pt(11)
-        
-        # Save to temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.docx')
-        optimized_doc.save(temp_file.name)
-        temp_file.close()
+        with guarded_stage('serialize'):
+            # Create optimized document
+            optimized_doc = Document()
+            
+            # Add optimized content
+            for paragraph in optimized_text.split('\n'):
+                if paragraph.strip():
+                    p = optimized_doc.add_paragraph(paragraph.strip())
+                    p.style.font.name = 'Calibri'
+                    p.style.font.size = Pt(11)
+            
+            # Save to temporary file
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.docx')
+            optimized_doc.save(temp_file.name)
+            temp_file.close()
         
         return send_file(
             temp_file.name,
@@ -1371,6 +3071,8 @@ def optimize_ats_endpoint():
             mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
         )
         
+    except ProcessingError:
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1389,67 +3091,60 @@ def download_optimized():
         export_format = request.form.get('exportFormat', 'docx').lower()
         
         # Debug logging for keywords
-        logger.info(f"Download endpoint - Received extraKeywords: '{extra_keywords}'")
-        logger.info(f"Download endpoint - All form data keys: {list(request.form.keys())}")
-        for key, value in request.form.items():
-            if 'keyword' in key.lower():
-                logger.info(f"Download endpoint - Keyword parameter '{key}': '{value}'")
+        trace("Download endpoint - Received extraKeywords: %r, form keys: %s", extra_keywords, list(request.form.keys()))
 
         # Save uploaded file to a temp location
         with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp:
-            resume_file.save(tmp.name)
-            doc = Document(tmp.name)
+            with timed_stage('upload'):
+                resume_file.save(tmp.name)
+            with guarded_stage('parse'):
+                doc = open_resume_document(tmp.name)
 
-        # Extract all text for keyword matching
-        full_text = '\n'.join([p.text for p in doc.paragraphs])
-        
-        # Use the new technical keyword extraction that preserves case
-        keywords = extract_technical_keywords(job_description)
-        missing_keywords = [kw for kw in keywords if kw.lower() not in full_text.lower()]
-        
-        # Process extra keywords from user selection
-        extra_keywords_list = [s.strip() for s in re.split(r'[;,/]|\\band\\b|\\&', extra_keywords) if s.strip()]
-        logger.info(f"Download endpoint - Processed extra keywords: {extra_keywords_list}")
+                # Extract all text for keyword matching
+                full_text = '\n'.join([p.text for p in doc.paragraphs])
         
-        # Combine job keywords and extra keywords
-        all_keywords = missing_keywords + extra_keywords_list
-        unique_keywords = []
-        seen = set()
-        for kw in all_keywords:
-            if kw.lower() not in seen:
-                unique_keywords.append(kw)
-                seen.add(kw.lower())
+        with timed_stage('keywords'):
+            # Use the new technical keyword extraction that preserves case
+            keywords = extract_technical_keywords(job_description)
+            missing_keywords = find_missing_keywords(keywords, full_text)
+            
+            # Process extra keywords from user selection
+            extra_keywords_list = [s.strip() for s in re.split(r'[;,/]|\\band\\b|\\&', extra_keywords) if s.strip()]
+            
+            # Combine job keywords and extra keywords
+            unique_keywords = dedupe_keywords(missing_keywords + extra_keywords_list)
         
-        logger.info(f"Download endpoint - Job keywords: {keywords}")
-        logger.info(f"Download endpoint - Missing job keywords: {missing_keywords}")
-        logger.info(f"Download endpoint - Extra keywords: {extra_keywords_list}")
-        logger.info(f"Download endpoint - All unique keywords to add: {unique_keywords}")
+        trace("Download endpoint - Job keywords: %s, missing: %s, extra: %s", keywords, missing_keywords, extra_keywords_list)
 
         # Insert keywords into existing Skills section
-        doc = insert_keywords_into_sections(doc, unique_keywords)
+        with timed_stage('insert'):
+            doc = insert_keywords_into_sections(doc, unique_keywords)
 
         # Handle different export formats
-        if export_format == 'txt':
-            # Convert to plain text
-            text_content = docx_to_text(doc)
-            text_buffer = io.BytesIO()
-            text_buffer.write(text_content.encode('utf-8'))
-            text_buffer.seek(0)
-            filename = create_export_filename(company_name, job_role, 'txt')
-            return send_file(
-                text_buffer,
-                as_attachment=True,
-                download_name=filename,
-                mimetype='text/plain'
-            )
-        else:
-            # Default: DOCX format
-            out_fd, out_path = tempfile.mkstemp(suffix='.docx')
-            os.close(out_fd)
-            doc.save(out_path)
-            filename = create_export_filename(company_name, job_role, 'docx')
-            return send_file(out_path, as_attachment=True, download_name=filename)
-
+        with guarded_stage('serialize'):
+            if export_format == 'txt':
+                # Convert to plain text
+                text_content = docx_to_text(doc)
+                text_buffer = io.BytesIO()
+                text_buffer.write(text_content.encode('utf-8'))
+                text_buffer.seek(0)
+                filename = create_export_filename(company_name, job_role, 'txt')
+                return send_file(
+                    text_buffer,
+                    as_attachment=True,
+                    download_name=filename,
+                    mimetype='text/plain'
+                )
+            else:
+                # Default: DOCX format
+                out_fd, out_path = tempfile.mkstemp(suffix='.docx')
+                os.close(out_fd)
+                doc.save(out_path)
+                filename = create_export_filename(company_name, job_role, 'docx')
+                return send_file(out_path, as_attachment=True, download_name=filename)
+
+    except ProcessingError:
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1464,11 +3159,13 @@ def debug_keywords():
 
     # Save uploaded file to a temp location
     with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp:
-        resume_file.save(tmp.name)
-        doc = Document(tmp.name)
+        with timed_stage('upload'):
+            resume_file.save(tmp.name)
+        with timed_stage('parse'):
+            doc = open_resume_document(tmp.name)
 
-    # Extract all text
-    full_text = '\n'.join([p.text for p in doc.paragraphs])
+            # Extract all text
+            full_text = '\n'.join([p.text for p in doc.paragraphs])
     
     # Extract keywords using both methods
     technical_keywords = extract_technical_keywords(job_description)
@@ -1478,24 +3175,18 @@ def debug_keywords():
     original_ats_score = calculate_ats_score(full_text, job_description)
     
     # Find missing keywords
-    missing_keywords = [kw for kw in technical_keywords if kw.lower() not in full_text.lower()]
+    missing_keywords = find_missing_keywords(technical_keywords, full_text)
     
     # Simulate adding keywords
     test_text = full_text + "\n\nSkills: " + ", ".join(missing_keywords[:10])
-    test_ats_score = calculate_ats_score(test_text, job_description, original_ats_score['total_score'])
+    test_ats_score = calculate_ats_score(test_text, job_description, original_ats_score.total_score)
     
     # Detailed keyword matching analysis
-    resume_lower = full_text.lower()
-    matched_keywords = []
-    for keyword in job_keywords:
-        keyword_lower = keyword.lower()
-        pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-        if re.search(pattern, resume_lower):
-            matched_keywords.append(keyword)
-        elif keyword_lower in resume_lower:
-            matched_keywords.append(keyword)
-    
-    match_percentage = len(matched_keywords) / len(job_keywords) if job_keywords else 0
+    resume_keywords = get_document_features(full_text)['keyword_hits']
+    matched_keywords = [kw for kw in job_keywords if canonicalize_keyword(kw) in resume_keywords]
+    keyword_weights = get_keyword_weights(job_description)
+    
+    match_percentage = weighted_match_percentage(job_keywords, resume_keywords, keyword_weights)
     
     return jsonify({
         'resume_text_length': len(full_text),
@@ -1504,17 +3195,18 @@ def debug_keywords():
         'missing_keywords': missing_keywords,
         'matched_keywords': matched_keywords,
         'match_percentage': match_percentage,
-        'original_ats_score': original_ats_score,
-        'test_ats_score': test_ats_score,
+        'original_ats_score': original_ats_score.to_dict(),
+        'test_ats_score': test_ats_score.to_dict(),
         'technical_keywords': technical_keywords,
         'job_keywords': job_keywords,
+        'keyword_weights': {keyword_display_name(kw): round(weight, 3) for kw, weight in keyword_weights.items()},
         'resume_preview': full_text[:500] + "..." if len(full_text) > 500 else full_text,
         'score_breakdown': {
-            'keyword_score': original_ats_score['keyword_score'],
-            'formatting_score': original_ats_score['formatting_score'],
-            'content_score': original_ats_score['content_score'],
-            'structure_score': original_ats_score['structure_score'],
-            'length_score': original_ats_score['length_score']
+            'keyword_score': original_ats_score.keyword_score,
+            'formatting_score': original_ats_score.formatting_score,
+            'content_score': original_ats_score.content_score,
+            'structure_score': original_ats_score.structure_score,
+            'length_score': original_ats_score.length_score
         }
     })
 
@@ -1529,19 +3221,22 @@ def test_suggestions():
 
     # Save uploaded file to a temp location
     with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp:
-        resume_file.save(tmp.name)
-        doc = Document(tmp.name)
-
-    resume_text = '\n'.join([p.text for p in doc.paragraphs])
-    industry = infer_industry(job_description)
-    suggestions = suggest_extra_keywords(resume_text, job_description, industry)
+        with timed_stage('upload'):
+            resume_file.save(tmp.name)
+        with timed_stage('parse'):
+            doc = open_resume_document(tmp.name)
+            resume_text = '\n'.join([p.text for p in doc.paragraphs])
+    with timed_stage('industry'):
+        industry = infer_industry(job_description)
+    with timed_stage('suggest'):
+        suggestions = suggest_extra_keywords(resume_text, job_description, industry)
     
     # Get all available keywords for comparison
     all_technical_keywords = []
-    for category, keywords in TECHNICAL_KEYWORDS.items():
-        all_technical_keywords.extend(keywords)
+    for category, keywords in keyword_taxonomy.technical_keywords.items():
+        all_technical_keywords.extend(sorted(keywords))
     
-    industry_keywords = INDUSTRY_KEYWORDS.get(industry, [])
+    industry_keywords = keyword_taxonomy.industry_keywords.get(industry, [])
     
     # Normalize resume words
     resume_words = set([
@@ -1566,5 +3261,61 @@ def test_suggestions():
         }
     })
 
+# --- Warm-up and readiness ---
+# The taxonomy, its compiled patterns, the fuzzy index, the IDF and neighbour tables are built at
+# import; python-docx and some lazily built state are not. warm_up() loads them and then sets
+# ready_event. gunicorn's master runs it before forking (prepare_for_fork), so preloaded workers
+# start ready; any other process warms up in the background from its first request.
+ready_event = threading.Event()
+warm_up_lock = threading.Lock()
+warm_up_pid = None
+
+def warm_up():
+    """Load python-docx and exercise the scoring and suggestion paths once, then signal readiness"""
+    with warm_up_lock:
+        if ready_event.is_set():
+            return
+        with startup_phase('warm_up'):
+            Document()  # Imports python-docx and loads its default template and part classes
+            sample_resume = 'Experience\nDeveloped Python services, increased throughput by 40%\nSkills\nPython, SQL and AWS'
+            sample_job = 'Software engineer with Python, SQL, AWS and Kubernetes experience'
+            calculate_ats_score_optimized(sample_resume, sample_job)
+            suggest_extra_keywords(sample_resume, sample_job, infer_industry(sample_job))
+        startup_timings['ready'] = round((time.perf_counter() - import_started) * 1000, 2)
+        ready_event.set()
+        logger.info("Ready: warmed up in %.0f ms, %.0f ms after import started", startup_timings['warm_up'], startup_timings['ready'])
+
+@app.before_request
+def ensure_warm_up():
+    """Start warming up in the background on a process's first request (threads do not survive a fork)"""
+    global warm_up_pid
+    if ready_event.is_set() or warm_up_pid == os.getpid():
+        return
+    with warm_up_lock:
+        if ready_event.is_set() or warm_up_pid == os.getpid():
+            return
+        warm_up_pid = os.getpid()
+    threading.Thread(target=warm_up, name='warm-up', daemon=True).start()
+
+# --- Preloading (gunicorn preload_app, see gunicorn.conf.py) ---
+def prepare_for_fork():
+    """Build every shared table in the master process, then freeze it out of the GC.
+    Workers forked afterwards share these pages copy-on-write; collections in the workers
+    no longer touch (and so copy) them."""
+    warm_up()
+
+    # Warm-up results should not be shared as if they were real cache entries
+    keyword_cache.clear()
+    ats_score_cache.clear()
+    paragraph_feature_cache.clear()
+    for cache in (keyword_cache, ats_score_cache, paragraph_feature_cache):
+        cache.reset_stats()
+
+    gc.collect()
+    gc.freeze()
+    logger.info("Prepared for fork: %d objects frozen", gc.get_freeze_count())
+
+startup_timings['import'] = round((time.perf_counter() - import_started) * 1000, 2)
+
 if __name__ == '__main__':
     app.run(port=8000, debug=False, use_reloader=False) 
\ No newline at end of file
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite: times the engine functions and the endpoints in-process, through the
+Flask test client, so no server or network is needed.
+
+Each benchmark is warmed up and then timed for --repeat samples. Fast benchmarks run several
+calls per sample (calibrated to --min-sample-ms) so timer resolution and loop overhead do not
+matter; benchmarks with per-sample setup (cold caches, a freshly parsed document) run one call
+per sample with the setup outside the timing. Results are printed as a table and, with --output,
+written as JSON with summary statistics and the raw samples.
+
+Inputs come from generate_corpus.py, so input size can be swept, e.g. --pages 1, 5, 15.
+
+Usage:
+    python benchmark.py
+    python benchmark.py --filter endpoint --repeat 50 --output results.json
+    python benchmark.py --pages 15 --layout academic --tables 2 --images 1 --filter 'docx|optimize'
+    python benchmark.py --list
+"""
+
+import argparse
+import gc
+import io
+import json
+import logging
+import math
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+from docx import Document
+
+import app
+import generate_corpus
+
+class Benchmark:
+    """A timed callable. setup(), when given, runs before every sample outside the timing and
+    returns the arguments for that sample."""
+    def __init__(self, name, func, setup=None):
+        self.name = name
+        self.func = func
+        self.setup = setup
+
+def clear_caches():
+    app.keyword_cache.clear()
+    app.ats_score_cache.clear()
+    app.paragraph_feature_cache.clear()
+
+def build_benchmarks(args):
+    vocabulary = generate_corpus.load_vocabulary()
+    doc, _ = generate_corpus.generate_resume(random.Random(f'{args.seed}:resume'), vocabulary, args.pages, args.layout,
+                                             args.keyword_density, args.tables, args.images)
+    resume_bytes = generate_corpus.docx_bytes(doc)
+    resume_text = '\n'.join(p.text for p in Document(io.BytesIO(resume_bytes)).paragraphs)
+    job_description, _ = generate_corpus.generate_job_description(random.Random(f'{args.seed}:job'), vocabulary,
+                                                                  args.jd_words, args.jd_keywords)
+    keywords = list(app.extract_technical_keywords_optimized(job_description))
+    client = app.app.test_client()
+
+    def parse():
+        return (Document(io.BytesIO(resume_bytes)),)
+
+    def clear_then(*extra):
+        def setup():
+            clear_caches()
+            return extra
+        return setup
+
+    def clear_scores():
+        app.ats_score_cache.clear()
+        return ()
+
+    def form(**fields):
+        def setup():
+            data = {'resume': (io.BytesIO(resume_bytes), 'resume.docx'), 'jobDescription': job_description}
+            data.update(fields)
+            return (data,)
+        return setup
+
+    def post(path):
+        def call(data):
+            response = client.post(path, data=data, content_type='multipart/form-data')
+            if response.status_code != 200:
+                raise RuntimeError(f'{path} returned {response.status_code}: {response.get_data(as_text=True)[:200]}')
+        return call
+
+    def get(path):
+        def call():
+            response = client.get(path)
+            if response.status_code != 200:
+                raise RuntimeError(f'{path} returned {response.status_code}')
+        return call
+
+    endpoint_form = form(extraKeywords='Rust, Scala', companyName='Acme', jobRole='Engineer')
+    return [
+        Benchmark('keywords.extract.cold', app.extract_technical_keywords_optimized, clear_then(job_description)),
+        Benchmark('keywords.extract.warm', lambda: app.extract_technical_keywords_optimized(job_description)),
+        Benchmark('ats_score.cold', app.calculate_ats_score_optimized, clear_then(resume_text, job_description)),
+        Benchmark('ats_score.warm_paragraphs', lambda: app.calculate_ats_score_optimized(resume_text, job_description),
+                  clear_scores),
+        Benchmark('ats_score.warm', lambda: app.calculate_ats_score_optimized(resume_text, job_description)),
+        Benchmark('docx.parse', lambda: Document(io.BytesIO(resume_bytes))),
+        Benchmark('docx.save', lambda doc: doc.save(io.BytesIO()), parse),
+        Benchmark('docx.insert_keywords', lambda doc: app.insert_keywords_into_sections(doc, keywords), parse),
+        Benchmark('endpoint.optimize_docx.cold', post('/optimize-docx'), lambda: (clear_caches(), endpoint_form())[1]),
+        Benchmark('endpoint.optimize_docx', post('/optimize-docx'), endpoint_form),
+        Benchmark('endpoint.optimize_docx.txt', post('/optimize-docx'), form(exportFormat='txt')),
+        Benchmark('endpoint.suggest_keywords', post('/suggest-keywords'), form()),
+        Benchmark('endpoint.finalize_resume', post('/finalize-resume'), endpoint_form),
+        Benchmark('endpoint.download_optimized', post('/download-optimized'), endpoint_form),
+        Benchmark('endpoint.calculate_ats_score', post('/calculate-ats-score'), form()),
+        Benchmark('endpoint.optimize_ats', post('/optimize-ats'), form()),
+        Benchmark('endpoint.health', get('/health')),
+    ], {'resume_words': len(resume_text.split()), 'resume_bytes': len(resume_bytes),
+        'job_description_words': len(job_description.split()), 'job_keywords': len(keywords)}
+
+def time_sample(benchmark, loops):
+    """Nanoseconds per call for one sample"""
+    args = benchmark.setup() if benchmark.setup else ()
+    func = benchmark.func
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        func(*args)
+    return (time.perf_counter_ns() - start) / loops
+
+def calibrate_loops(benchmark, min_sample_ns):
+    """Calls per sample needed for a sample to last at least min_sample_ns"""
+    if benchmark.setup is not None:
+        return 1
+    loops = 1
+    while loops < 1_000_000:
+        elapsed = time_sample(benchmark, loops) * loops
+        if elapsed >= min_sample_ns:
+            break
+        loops *= 10 if elapsed * 10 < min_sample_ns else 2
+    return loops
+
+def summarize(samples_ms):
+    """Robust summary: median with a distribution-free 95% confidence interval, spread and tail percentiles"""
+    ordered = sorted(samples_ms)
+    n = len(ordered)
+    if n > 1:
+        percentiles = statistics.quantiles(ordered, n=100, method='inclusive')
+        q1, q3 = percentiles[24], percentiles[74]
+    else:
+        percentiles = [ordered[0]] * 99
+        q1 = q3 = ordered[0]
+    # Ranks of the median's order-statistic confidence interval (normal approximation to the binomial)
+    half_width = 1.96 * math.sqrt(n) / 2
+    low = max(0, math.floor(n / 2 - half_width))
+    high = min(n - 1, math.ceil(n / 2 + half_width))
+    fence = q3 + 1.5 * (q3 - q1)
+    return {
+        'samples': n,
+        'min_ms': ordered[0],
+        'median_ms': statistics.median(ordered),
+        'median_ci95_ms': [ordered[low], ordered[high]],
+        'mean_ms': statistics.fmean(ordered),
+        'stdev_ms': statistics.stdev(ordered) if n > 1 else 0.0,
+        'iqr_ms': q3 - q1,
+        'p90_ms': percentiles[89],
+        'p95_ms': percentiles[94],
+        'p99_ms': percentiles[98],
+        'max_ms': ordered[-1],
+        'outliers': sum(1 for sample in ordered if sample > fence)
+    }
+
+def run_benchmark(benchmark, repeat, warmup, min_sample_ns):
+    loops = calibrate_loops(benchmark, min_sample_ns)
+    for _ in range(warmup):
+        time_sample(benchmark, loops)
+    gc.collect()
+    samples = [time_sample(benchmark, loops) / 1e6 for _ in range(repeat)]
+    result = summarize(samples)
+    result['loops'] = loops
+    result['samples_ms'] = [round(sample, 6) for sample in samples]
+    return result
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z')
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the engine functions and endpoints in-process')
+    parser.add_argument('--filter', help='Only run benchmarks whose name matches this regular expression')
+    parser.add_argument('--repeat', type=int, default=30, help='Timed samples per benchmark')
+    parser.add_argument('--warmup', type=int, default=3, help='Untimed samples before timing')
+    parser.add_argument('--min-sample-ms', type=float, default=20, help='Calibrate fast benchmarks to at least this per sample')
+    parser.add_argument('--pages', type=int, default=2, help='Size of the generated resume')
+    parser.add_argument('--layout', choices=sorted(generate_corpus.LAYOUTS), default='standard')
+    parser.add_argument('--keyword-density', type=float, default=0.3, help='Share of resume bullets naming keywords')
+    parser.add_argument('--tables', type=int, default=0, help='Tables in the generated resume')
+    parser.add_argument('--images', type=int, default=0, help='Images in the generated resume')
+    parser.add_argument('--jd-words', type=int, default=400, help='Length of the generated job description')
+    parser.add_argument('--jd-keywords', type=int, default=20, help='Keywords named by the job description')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument('--list', action='store_true', help='List benchmark names and exit')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)  # Request summaries would dominate the output
+    app.app.config['METRICS_FLUSH_INTERVAL'] = 0  # Keep the run self-contained: no snapshot files
+    app.warm_up()  # As a server does before its first request, rather than in the background mid-run
+    benchmarks, inputs = build_benchmarks(args)
+    if args.filter:
+        benchmarks = [b for b in benchmarks if re.search(args.filter, b.name)]
+    if args.list:
+        print('\n'.join(b.name for b in benchmarks))
+        return
+
+    results = {}
+    print(f"{'benchmark':<32} {'loops':>7} {'median ms':>10} {'95% CI':>19} {'p95 ms':>9} {'p99 ms':>9} {'iqr':>8}")
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, args.repeat, args.warmup, args.min_sample_ms * 1e6)
+        results[benchmark.name] = result
+        low, high = result['median_ci95_ms']
+        print(f"{benchmark.name:<32} {result['loops']:>7} {result['median_ms']:>10.4f} {f'{low:.4f}-{high:.4f}':>19} "
+              f"{result['p95_ms']:>9.4f} {result['p99_ms']:>9.4f} {result['iqr_ms']:>8.4f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'environment': environment(),
+                'settings': vars(args),
+                'inputs': inputs,
+                'benchmarks': results
+            }, f, indent=2)
+            f.write('\n')
+        print(f"Wrote {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Concurrency scaling benchmark: drive /optimize-docx with an increasing number of concurrent
+clients under each execution model and report the throughput and p95 latency curves and the knee,
+so worker type and count can be sized from measurements on the target host.
+
+Execution models (all in-process, through the Flask test client, so no server is needed):
+    thread    one process, N request threads - gunicorn's gthread worker with threads=N. Threads
+              share the caches and the GIL, and requests past MAX_CONCURRENT_REQUESTS get a 503.
+    process   N forked processes each serving one request at a time - gunicorn sync workers with
+              workers=N and preload_app. Caches are per process.
+    async     an asyncio event loop handing requests to a pool of N threads, the way an ASGI
+              server runs a WSGI app. The app itself is synchronous, so this measures the thread
+              model plus event-loop overhead.
+
+Each level runs N closed-loop clients for --duration seconds after --warmup seconds. Every
+request gets its own job description (a requisition number is appended), so the per-request
+keyword and score caches miss as they do for distinct submissions in production.
+
+The knee is the lowest concurrency whose throughput is within --knee-tolerance of the best level:
+past it more concurrency only adds latency. Size workers x threads at about the knee.
+
+Usage:
+    python benchmark_concurrency.py
+    python benchmark_concurrency.py --models thread process --levels 1 2 4 8 16 --duration 10
+    python benchmark_concurrency.py --max-concurrent 32 --pages 5 --output scaling.json
+"""
+
+import argparse
+import asyncio
+import io
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import app
+import generate_corpus
+from benchmark import environment
+
+MODELS = ('thread', 'process', 'async')
+REJECTED_RETRY_DELAY = 0.1  # A client told the server is busy waits before trying again instead of spinning
+
+def build_payload(args):
+    vocabulary = generate_corpus.load_vocabulary()
+    doc, _ = generate_corpus.generate_resume(generate_corpus.item_rng(args.seed, 'resume'), vocabulary, args.pages)
+    job_description, _ = generate_corpus.generate_job_description(generate_corpus.item_rng(args.seed, 'job'),
+                                                                  vocabulary, args.jd_words, args.jd_keywords)
+    return generate_corpus.docx_bytes(doc), job_description
+
+def request_loop(client_id, payload, warm_until, stop_at):
+    """One closed-loop client: send requests back to back until stop_at, keeping those started after warm-up"""
+    resume_bytes, job_description = payload
+    client = app.app.test_client()
+    samples = []
+    for sequence in itertools.count():
+        started = time.monotonic()
+        if started >= stop_at:
+            break
+        response = client.post('/optimize-docx', content_type='multipart/form-data', data={
+            'resume': (io.BytesIO(resume_bytes), 'resume.docx'),
+            'jobDescription': f'{job_description} Requisition {client_id}-{sequence}.',
+            'exportFormat': 'docx'
+        })
+        response.get_data()
+        finished = time.monotonic()
+        if started >= warm_until and finished <= stop_at:
+            samples.append(((finished - started) * 1000, response.status_code))
+        if response.status_code == 503:
+            time.sleep(REJECTED_RETRY_DELAY)
+    return samples
+
+def run_threads(concurrency, payload, warm_until, stop_at):
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(request_loop, i, payload, warm_until, stop_at) for i in range(concurrency)]
+        return [sample for future in futures for sample in future.result()]
+
+def process_client(client_id, payload, warm_until, stop_at, results):
+    results.put(request_loop(client_id, payload, warm_until, stop_at))
+
+def run_processes(concurrency, payload, warm_until, stop_at):
+    context = multiprocessing.get_context('fork')  # Inherit the loaded app, as preload_app does
+    results = context.Queue()
+    workers = [context.Process(target=process_client, args=(i, payload, warm_until, stop_at, results))
+               for i in range(concurrency)]
+    for worker in workers:
+        worker.start()
+    samples = [sample for _ in workers for sample in results.get()]
+    for worker in workers:
+        worker.join()
+    return samples
+
+def run_async(concurrency, payload, warm_until, stop_at):
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+        batches = await asyncio.gather(*(asyncio.to_thread(request_loop, i, payload, warm_until, stop_at)
+                                         for i in range(concurrency)))
+        return [sample for batch in batches for sample in batch]
+    return asyncio.run(main())
+
+RUNNERS = {'thread': run_threads, 'process': run_processes, 'async': run_async}
+
+def run_level(model, concurrency, payload, warmup, duration):
+    start = time.monotonic() + 0.2  # Let every client get going before the warm-up clock starts
+    warm_until = start + warmup
+    samples = RUNNERS[model](concurrency, payload, warm_until, warm_until + duration)
+    latencies = sorted(ms for ms, status in samples if status == 200)
+    rejected = sum(1 for _, status in samples if status == 503)
+    p95 = statistics.quantiles(latencies, n=100, method='inclusive')[94] if len(latencies) > 1 else (latencies or [0])[0]
+    return {
+        'concurrency': concurrency,
+        'requests': len(samples),
+        'completed': len(latencies),
+        'rejected_503': rejected,
+        'errors': len(samples) - len(latencies) - rejected,
+        'throughput_rps': round(len(latencies) / duration, 2),
+        'p50_ms': round(statistics.median(latencies), 2) if latencies else None,
+        'p95_ms': round(p95, 2) if latencies else None
+    }
+
+def find_knee(levels, tolerance):
+    """Lowest concurrency reaching within tolerance of the best throughput"""
+    best = max(level['throughput_rps'] for level in levels)
+    if best <= 0:
+        return None
+    return next(level['concurrency'] for level in levels if level['throughput_rps'] >= (1 - tolerance) * best)
+
+def main():
+    parser = argparse.ArgumentParser(description='Throughput and p95 latency of /optimize-docx under rising concurrency')
+    parser.add_argument('--models', nargs='+', choices=MODELS, default=list(MODELS))
+    parser.add_argument('--levels', type=int, nargs='+', help='Concurrency levels (default: powers of two up to 4x the CPUs or 2x MAX_CONCURRENT_REQUESTS)')
+    parser.add_argument('--duration', type=float, default=5, help='Measured seconds per level')
+    parser.add_argument('--warmup', type=float, default=1, help='Unmeasured seconds per level')
+    parser.add_argument('--max-concurrent', type=int, help='Override MAX_CONCURRENT_REQUESTS (per process)')
+    parser.add_argument('--knee-tolerance', type=float, default=0.05, help='Throughput shortfall from the best level still counted as saturated')
+    parser.add_argument('--pages', type=int, default=2, help='Size of the generated resume')
+    parser.add_argument('--jd-words', type=int, default=400, help='Length of the generated job description')
+    parser.add_argument('--jd-keywords', type=int, default=20, help='Keywords named by the job description')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Write the curves as JSON to this file')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)  # Request summaries would dominate the output
+    app.app.config['METRICS_FLUSH_INTERVAL'] = 0  # Keep the run self-contained: no snapshot files
+    if args.max_concurrent:
+        app.app.config['MAX_CONCURRENT_REQUESTS'] = args.max_concurrent
+    cpus = os.cpu_count() or 1
+    # Far enough past both the CPU count and the admission limit to see where each one bites
+    upper = max(4 * cpus, 2 * app.app.config['MAX_CONCURRENT_REQUESTS'])
+    levels = args.levels or sorted({2 ** i for i in range(upper.bit_length()) if 2 ** i <= upper} | {upper})
+    payload = build_payload(args)
+    app.prepare_for_fork()
+
+    print(f"{cpus} CPUs, MAX_CONCURRENT_REQUESTS={app.app.config['MAX_CONCURRENT_REQUESTS']}, "
+          f"{args.duration}s per level after {args.warmup}s warm-up")
+    results = {}
+    for model in args.models:
+        print(f"\n{model}")
+        print(f"{'concurrency':>11} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'503s':>6} {'errors':>6}  throughput")
+        curve = []
+        for concurrency in levels:
+            level = run_level(model, concurrency, payload, args.warmup, args.duration)
+            curve.append(level)
+            best = max(point['throughput_rps'] for point in curve) or 1
+            bar = '#' * round(30 * level['throughput_rps'] / best)
+            print(f"{concurrency:>11} {level['throughput_rps']:>8.2f} {level['p50_ms'] or 0:>9.1f} "
+                  f"{level['p95_ms'] or 0:>9.1f} {level['rejected_503']:>6} {level['errors']:>6}  {bar}")
+        knee = find_knee(curve, args.knee_tolerance)
+        results[model] = {'levels': curve, 'knee_concurrency': knee}
+        if knee is not None:
+            at_knee = next(level for level in curve if level['concurrency'] == knee)
+            print(f"knee: {knee} concurrent ({at_knee['throughput_rps']} rps, p95 {at_knee['p95_ms']} ms)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'environment': environment(),
+                'settings': vars(args),
+                'max_concurrent_requests': app.app.config['MAX_CONCURRENT_REQUESTS'],
+                'models': results
+            }, f, indent=2)
+            f.write('\n')
+        print(f"Wrote {args.output}")
+
+if __name__ == '__main__':
+    main()
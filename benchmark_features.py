@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark the resume feature detectors: the per-pattern detectors used before the combined sweep
+(five IGNORECASE scans plus a substring test per action verb) against the single
+FEATURE_SCAN_PATTERN sweep, at three levels, legacy and current side by side:
+
+    detectors   the detectors alone, per paragraph
+    analysis    get_document_features with an empty paragraph cache (tokens, keyword matches,
+                headers and the detectors)
+    ats score   calculate_ats_score_optimized end to end with every cache empty
+
+The legacy rows run the same code with analyze_paragraph swapped for a copy using the old
+detectors, so the only difference is the detectors. The score column shows the content-quality
+score under each: the sweep matches action verbs as whole words, the old detectors as substrings.
+
+Usage:
+    python benchmark_features.py
+    python benchmark_features.py --pages 1 5 10 20 --repeat 20
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+import app
+
+WORDS_PER_PAGE = 500
+JOB_DESCRIPTION = ('Senior software engineer. Requirements: Python, SQL, AWS, Docker, Kubernetes, React and Git. '
+                   'Experience leading teams, designing data pipelines and improving release quality.')
+
+# --- Legacy detectors, as they were before the combined feature sweep ---
+LEGACY_ACHIEVEMENT_PATTERNS = [
+    re.compile(r'\d+%|\d+\s*percent|\$\d+|\d+\s*dollars', re.IGNORECASE),
+    re.compile(r'increased by \d+|decreased by \d+|reduced by \d+|improved by \d+', re.IGNORECASE)
+]
+LEGACY_FORMATTING_ISSUE_PATTERNS = [
+    re.compile(r'<table|<img|<chart|<header|<footer', re.IGNORECASE),
+    re.compile(r'columns?|text-align:\s*center|position:\s*absolute', re.IGNORECASE)
+]
+LEGACY_SKILLS_MENTION_PATTERN = re.compile(r'skills?', re.IGNORECASE)
+
+def legacy_detectors(text, text_lower):
+    return (frozenset(verb for verb in app.ACTION_VERBS if verb in text_lower),
+            tuple(len(pattern.findall(text)) for pattern in LEGACY_ACHIEVEMENT_PATTERNS),
+            tuple(bool(pattern.search(text)) for pattern in LEGACY_FORMATTING_ISSUE_PATTERNS),
+            LEGACY_SKILLS_MENTION_PATTERN.search(text) is not None)
+
+def current_detectors(text, text_lower):
+    tokens = frozenset(app.WORD_BOUNDARY_PATTERN.findall(text_lower))  # Analysis builds these anyway
+    counts = app.scan_paragraph_features(text_lower)
+    return (tokens & app.ACTION_VERBS,
+            tuple(counts[name] for name in app.ACHIEVEMENT_FEATURES),
+            tuple(counts[name] > 0 for name in app.FORMATTING_ISSUE_FEATURES),
+            counts['skills_mention'] > 0)
+
+def legacy_analyze_paragraph(text):
+    """app.analyze_paragraph with the legacy detectors in place of the sweep"""
+    cache_key = app.taxonomy_cache_key('paragraph', text)
+    cached_result = app.get_cached_result(app.paragraph_feature_cache, cache_key, app.app.config['CACHE_TTL'])
+    if cached_result is not None:
+        return cached_result
+    text_lower = text.lower()
+    stripped = text.strip()
+    action_verbs, achievement_counts, formatting_issues, mentions_skills = legacy_detectors(text, text_lower)
+    words = app.WORD_BOUNDARY_PATTERN.findall(text_lower)
+    features = {
+        'tokens': frozenset(map(sys.intern, words)),
+        'fuzzy_candidates': app.fuzzy_candidates(words),
+        'keyword_hits': frozenset(app.find_keyword_matches(text)),
+        'action_verbs': action_verbs,
+        'achievement_counts': achievement_counts,
+        'formatting_issues': formatting_issues,
+        'mentions_skills': mentions_skills,
+        'headers': app.classify_paragraph_header(text),
+        'skill_list': bool(stripped) and (',' in stripped or '/' in stripped or '&' in stripped or ' and ' in stripped),
+        'word_count': len(text.split())
+    }
+    app.set_cached_result(app.paragraph_feature_cache, cache_key, features, app.app.config['CACHE_TTL'])
+    return features
+
+@contextmanager
+def detectors(legacy):
+    """Run the app with the legacy or the current paragraph analysis"""
+    current = app.analyze_paragraph
+    if legacy:
+        app.analyze_paragraph = legacy_analyze_paragraph
+    try:
+        yield
+    finally:
+        app.analyze_paragraph = current
+
+def clear_caches():
+    app.keyword_cache.clear()
+    app.ats_score_cache.clear()
+    app.paragraph_feature_cache.clear()
+
+# --- Measured operations ---
+def run_detectors(detect):
+    def run(paragraphs):
+        for paragraph in paragraphs:
+            detect(paragraph, paragraph.lower())
+    return run
+
+def analysis_cold(resume_text):
+    app.paragraph_feature_cache.clear()
+    app.get_document_features(resume_text)
+
+def ats_score_cold(resume_text):
+    clear_caches()
+    app.calculate_ats_score_optimized(resume_text, JOB_DESCRIPTION)
+
+def content_score(resume_text):
+    clear_caches()
+    return app.calculate_content_quality_score_optimized(resume_text)
+
+def make_resume(pages, rng):
+    """Synthetic resume of roughly `pages` pages: section headers followed by bullet paragraphs"""
+    vocabulary = ('team project system users customers platform service data pipeline reports '
+                  'stakeholders quality release process application features design code review').split()
+    verbs = sorted(app.ACTION_VERBS) + ['worked', 'helped', 'supported', 'owned']
+    achievements = ['by 25%', 'saving $40000', 'increased by 30 percent', 'reduced by 15%', '']
+    keywords = ['Python', 'SQL', 'AWS', 'Docker', 'React', 'Kubernetes', 'Git', 'Java']
+    headers = ['Experience', 'Skills', 'Education', 'Projects', 'Summary', 'Certifications']
+
+    paragraphs = ['Jane Doe', 'jane@example.com | 555-0100']
+    words = 0
+    while words < pages * WORDS_PER_PAGE:
+        paragraphs.append(rng.choice(headers))
+        for _ in range(rng.randint(3, 6)):
+            sentence = ' '.join([rng.choice(verbs).capitalize()] + rng.sample(vocabulary, 8) +
+                                ['using', rng.choice(keywords), rng.choice(achievements)])
+            paragraphs.append(sentence.strip())
+            words += len(sentence.split())
+    paragraphs.append('Python, SQL, AWS, Docker and Git')
+    return '\n'.join(paragraphs)
+
+def time_call(func, arg, repeat):
+    func(arg)  # Warm up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark legacy vs combined feature detection')
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 2, 5, 10, 20])
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'pages':>5} {'words':>6}  {'detectors ms':^23}  {'analysis ms':^23}  {'ats score ms':^23}  content score")
+    print(f"{'':>12}  " + '  '.join([f"{'legacy':>8} {'current':>8} {'gain':>5}"] * 3) + '  legacy -> current')
+    for pages in args.pages:
+        text = make_resume(pages, rng)
+        paragraphs = [paragraph for paragraph in text.split('\n') if paragraph.strip()]
+        row = []
+        for operation, arg in ((None, paragraphs), (analysis_cold, text), (ats_score_cold, text)):
+            timings = []
+            for legacy in (True, False):
+                with detectors(legacy):
+                    func = operation or run_detectors(legacy_detectors if legacy else current_detectors)
+                    timings.append(time_call(func, arg, args.repeat))
+            row.append(f"{timings[0]:>8.3f} {timings[1]:>8.3f} {timings[0] / timings[1]:>4.1f}x")
+        with detectors(True):
+            legacy_content = content_score(text)
+        current_content = content_score(text)
+        print(f"{pages:>5} {len(text.split()):>6}  {'  '.join(row)}  {legacy_content} -> {current_content}")
+    clear_caches()
+
+if __name__ == '__main__':
+    main()
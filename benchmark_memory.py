@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Measure how much memory each cached result costs, using tracemalloc. Compares the old cache
+entry shapes (7-key score dicts, lists of freshly sliced keyword strings, paragraph tokens
+without interning) against what the caches hold now (ATSScore records, tuples of interned
+keywords, interned tokens).
+
+Usage:
+    python benchmark_memory.py
+    python benchmark_memory.py --entries 20000
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+import app
+
+def measure(build):
+    """Bytes retained by whatever build() returns"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, kept
+
+def random_scores(rng, count):
+    return [[round(rng.uniform(40, 100), 1) for _ in range(5)] for _ in range(count)]
+
+def make_job_description(rng):
+    keywords = sorted(app.keyword_taxonomy.canonical)
+    filler = 'we are looking for an engineer with experience in'.split()
+    words = []
+    for _ in range(rng.randint(8, 20)):
+        words.extend(rng.sample(filler, 4))
+        words.append(rng.choice(keywords))
+    return ' '.join(words)
+
+def make_paragraph(rng):
+    vocabulary = ('developed managed team project system users customers platform service data '
+                  'pipeline reports stakeholders quality release process application features design').split()
+    return ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(8, 25)))
+
+def score_entries(scores, record):
+    """Cache-shaped entries: key -> (timestamp, score)"""
+    now = time.time()
+    cache = {}
+    for i, (total, keyword, formatting, content, structure) in enumerate(scores):
+        if record:
+            value = app.ATSScore(total, keyword, formatting, content, structure, 90.0, 0)
+        else:
+            value = {
+                'total_score': total, 'keyword_score': keyword, 'formatting_score': formatting,
+                'content_score': content, 'structure_score': structure, 'length_score': 90.0,
+                'improvement': 0
+            }
+        cache[i] = (now, value)
+    return cache
+
+def legacy_keywords(text):
+    """Keywords as the old extraction kept them: a list of strings sliced from the text"""
+    return [text[start:end] for start, end in sorted(app.find_keyword_matches(text).values())]
+
+def current_keywords(text):
+    """Keywords as extract_technical_keywords_optimized caches them: a tuple of interned strings"""
+    return tuple(map(sys.intern, legacy_keywords(text)))
+
+def main():
+    parser = argparse.ArgumentParser(description='Bytes per cached score, keyword list and paragraph')
+    parser.add_argument('--entries', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    n = args.entries
+
+    scores = random_scores(rng, n)
+    old_scores, _ = measure(lambda: score_entries(scores, record=False))
+    new_scores, _ = measure(lambda: score_entries(scores, record=True))
+
+    job_descriptions = [make_job_description(rng) for _ in range(n)]
+    old_keywords, _ = measure(lambda: [legacy_keywords(jd) for jd in job_descriptions])
+    new_keywords, _ = measure(lambda: [current_keywords(jd) for jd in job_descriptions])
+
+    paragraphs = [make_paragraph(rng) for _ in range(n)]
+    old_tokens, _ = measure(lambda: [frozenset(app.WORD_BOUNDARY_PATTERN.findall(p.lower())) for p in paragraphs])
+    new_tokens, _ = measure(lambda: [frozenset(map(sys.intern, app.WORD_BOUNDARY_PATTERN.findall(p.lower()))) for p in paragraphs])
+
+    print(f"{n} entries each (bytes per entry, excluding cache keys)")
+    print(f"{'':<22} {'before':>8} {'after':>8} {'saved':>7}")
+    for name, old, new in (
+        ('ATS score', old_scores, new_scores),
+        ('keyword list', old_keywords, new_keywords),
+        ('paragraph tokens', old_tokens, new_tokens),
+    ):
+        print(f"{name:<22} {old / n:>8.0f} {new / n:>8.0f} {1 - new / old:>6.0%}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Build the keyword tables used by the ATS scorer and keyword suggestions from a job-description corpus:
+    data/keyword_idf.json         BM25 IDF per canonical keyword
+    data/keyword_neighbours.json  top-k co-occurring keywords per keyword, ranked by PMI
+
+Usage:
+    python build_keyword_tables.py corpus.jsonl
+    python build_keyword_tables.py job_descriptions/ --top-k 20 --min-cooccurrence 5
+
+The corpus is either a JSONL file (one job description per line, in a "job_description",
+"description" or "text" field) or a directory of .txt files (one job description per file).
+"""
+
+import argparse
+from collections import Counter
+import heapq
+import itertools
+import json
+import math
+import os
+import statistics
+import sys
+
+from app import app, load_keyword_taxonomy
+
+TEXT_FIELDS = ('job_description', 'description', 'text')
+
+def read_corpus(path):
+    """Yield job description texts from a JSONL file or a directory of .txt files"""
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith('.txt'):
+                with open(os.path.join(path, name), encoding='utf-8') as f:
+                    yield f.read()
+        return
+
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            text = record if isinstance(record, str) else next((record[k] for k in TEXT_FIELDS if k in record), None)
+            if text is None:
+                print(f"Skipping line {line_number}: no job description field", file=sys.stderr)
+                continue
+            yield text
+
+def bm25_idf(document_count, document_frequency):
+    """BM25 inverse document frequency (always positive)"""
+    return math.log(1 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+def scan_corpus(texts, taxonomy):
+    """Reduce each job description to its word count and the set of canonical keywords it mentions"""
+    documents = []
+    for text in texts:
+        keywords = frozenset(taxonomy.canonical[match.group()] for match in taxonomy.surface_pattern.finditer(text.lower()))
+        documents.append((len(text.split()), keywords))
+    if not documents:
+        raise ValueError('Corpus contains no job descriptions')
+    return documents
+
+def count_document_frequency(documents, taxonomy):
+    """Count in how many job descriptions each canonical keyword appears (0 for keywords never seen)"""
+    document_frequency = dict.fromkeys(taxonomy.all_keywords, 0)
+    for _, keywords in documents:
+        for canonical in keywords:
+            document_frequency[canonical] = document_frequency.get(canonical, 0) + 1
+    return document_frequency
+
+def build_idf_table(documents, document_frequency, taxonomy):
+    """Derive each canonical keyword's IDF from its document frequency"""
+    count = len(documents)
+    idf = {kw: round(bm25_idf(count, df), 4) for kw, df in sorted(document_frequency.items())}
+    return {
+        'taxonomy_version': taxonomy.version,
+        'documents': count,
+        'average_document_length': round(sum(length for length, _ in documents) / count, 1),
+        # Keywords added to the taxonomy after the build get a middling weight
+        'default_idf': round(statistics.median(idf.values()), 4),
+        'idf': idf
+    }
+
+def build_neighbour_table(documents, taxonomy, top_k=10, min_cooccurrence=3):
+    """Top-k neighbours of each keyword by pointwise mutual information of appearing in the same job description"""
+    document_frequency = Counter()
+    cooccurrence = Counter()
+    for _, keywords in documents:
+        document_frequency.update(keywords)
+        cooccurrence.update(itertools.combinations(sorted(keywords), 2))
+
+    count = len(documents)
+    candidates = {}
+    for (a, b), together in cooccurrence.items():
+        if together < min_cooccurrence:
+            continue  # Too rare to trust: PMI overrates pairs seen once or twice
+        pmi = math.log(together * count / (document_frequency[a] * document_frequency[b]))
+        if pmi <= 0:
+            continue  # No more likely together than apart
+        candidates.setdefault(a, []).append((pmi, b))
+        candidates.setdefault(b, []).append((pmi, a))
+
+    neighbours = {
+        kw: [[neighbour, round(pmi, 4)] for pmi, neighbour in heapq.nlargest(top_k, pairs)]
+        for kw, pairs in sorted(candidates.items())
+    }
+    return {
+        'taxonomy_version': taxonomy.version,
+        'documents': count,
+        'top_k': top_k,
+        'min_cooccurrence': min_cooccurrence,
+        'neighbours': neighbours
+    }
+
+def write_table(table, path):
+    """Write a table as compact JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(table, f, separators=(',', ':'), sort_keys=True)
+        f.write('\n')
+
+def main():
+    parser = argparse.ArgumentParser(description='Build keyword IDF and neighbour tables from a job-description corpus')
+    parser.add_argument('corpus', help='JSONL file or directory of .txt job descriptions')
+    parser.add_argument('--taxonomy', default=app.config['TAXONOMY_PATH'], help='Keyword taxonomy data file')
+    parser.add_argument('--idf-output', default=app.config['KEYWORD_IDF_PATH'], help='Where to write the IDF table')
+    parser.add_argument('--neighbours-output', default=app.config['KEYWORD_NEIGHBOURS_PATH'], help='Where to write the neighbour table')
+    parser.add_argument('--top-k', type=int, default=10, help='Neighbours kept per keyword')
+    parser.add_argument('--min-cooccurrence', type=int, default=3, help='Job descriptions a pair must share to be kept')
+    args = parser.parse_args()
+
+    taxonomy = load_keyword_taxonomy(args.taxonomy)
+    documents = scan_corpus(read_corpus(args.corpus), taxonomy)
+
+    document_frequency = count_document_frequency(documents, taxonomy)
+    idf_table = build_idf_table(documents, document_frequency, taxonomy)
+    write_table(idf_table, args.idf_output)
+    seen = sum(1 for frequency in document_frequency.values() if frequency > 0)
+    print(f"Wrote {args.idf_output}: {idf_table['documents']} job descriptions, {seen}/{len(idf_table['idf'])} keywords seen")
+
+    neighbour_table = build_neighbour_table(documents, taxonomy, args.top_k, args.min_cooccurrence)
+    write_table(neighbour_table, args.neighbours_output)
+    print(f"Wrote {args.neighbours_output}: neighbours for {len(neighbour_table['neighbours'])} keywords")
+
+if __name__ == '__main__':
+    main()
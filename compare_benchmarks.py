@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Performance regression gate: compare benchmark.py results against a stored baseline and exit
+non-zero when a benchmark got significantly slower.
+
+A benchmark is flagged only when both hold:
+    - its median moved by more than --threshold (default 5%), and
+    - a Mann-Whitney U test on the raw samples says the shift is unlikely to be noise (p < --alpha)
+so a noisy benchmark needs a larger, consistent shift before it fails the gate, and a tiny but
+real shift below the threshold is reported without failing it. Small samples without ties use the
+exact U distribution; the normal approximation could not go below p = 0.012 with 5 samples a side.
+If even completely separated samples could not reach --alpha at the sample sizes given, the gate
+cannot flag anything: those benchmarks are reported as "alpha unreachable" and the exit code is 2.
+
+Usage:
+    python compare_benchmarks.py --save                      # run the suite, store it as the baseline
+    python compare_benchmarks.py                             # run the suite again, compare, gate
+    python compare_benchmarks.py --threshold 0.10 -- --filter endpoint --repeat 50
+    python compare_benchmarks.py --current results.json      # compare an existing run
+    python compare_benchmarks.py --baseline main.json --current branch.json
+
+Arguments after -- are passed to benchmark.py. Store a baseline from the commit you compare
+against (e.g. main), on the same machine, with the same benchmark settings.
+"""
+
+import argparse
+from functools import lru_cache
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, 'benchmark_baseline.json')
+EXACT_MAX_SAMPLES = 30  # Per side; beyond this the normal approximation is accurate and the exact table large
+# Settings that change what is measured; comparing runs that differ in these is meaningless
+COMPARABLE_SETTINGS = ('pages', 'layout', 'keyword_density', 'tables', 'images', 'jd_words', 'jd_keywords', 'seed')
+
+def run_suite(benchmark_args):
+    """Run benchmark.py in a fresh process and return its JSON results"""
+    fd, path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        subprocess.run([sys.executable, os.path.join(HERE, 'benchmark.py'), *benchmark_args, '--output', path], check=True)
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    finally:
+        os.remove(path)
+
+@lru_cache(maxsize=None)
+def exact_u_distribution(n1, n2):
+    """Number of orderings of n1 + n2 distinct values giving each U statistic (0..n1*n2)"""
+    # counts[m][u]: orderings of m first-group and n second-group values with U = u, for n = 0, 1, ... n2.
+    # The largest value is either a second-group value, or a first-group value beating all n of them.
+    size = n1 * n2 + 1
+    counts = [[1] + [0] * (size - 1) for _ in range(n1 + 1)]
+    for n in range(1, n2 + 1):
+        previous = counts
+        counts = [previous[0]]
+        for m in range(1, n1 + 1):
+            counts.append([previous[m][u] + (counts[m - 1][u - n] if u >= n else 0) for u in range(size)])
+    return counts[n1]
+
+def mann_whitney_p(a, b):
+    """Two-sided p-value of the Mann-Whitney U test: exact for small samples without ties,
+    otherwise the normal approximation with tie and continuity corrections"""
+    n1, n2 = len(a), len(b)
+    combined = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1  # Average rank of the tied run
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    if not tie_term and max(n1, n2) <= EXACT_MAX_SAMPLES:
+        counts = exact_u_distribution(n1, n2)
+        u = round(min(u, n1 * n2 - u))  # The distribution is symmetric
+        return min(1.0, 2 * sum(counts[:u + 1]) / math.comb(n1 + n2, n1))
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)  # With continuity correction
+    return min(1.0, math.erfc(max(z, 0) / math.sqrt(2)))
+
+def smallest_p_value(n1, n2):
+    """The p-value of completely separated samples: nothing at these sizes can be more significant"""
+    return mann_whitney_p(range(n1), range(n1, n1 + n2))
+
+def compare(baseline, current, threshold, alpha, min_samples):
+    """Per-benchmark verdicts: regression, improvement, unchanged, noise, new, removed, too few samples
+    or alpha unreachable"""
+    rows = []
+    for name in sorted(set(baseline['benchmarks']) | set(current['benchmarks'])):
+        old = baseline['benchmarks'].get(name)
+        new = current['benchmarks'].get(name)
+        if old is None or new is None:
+            rows.append({'name': name, 'verdict': 'new' if old is None else 'removed',
+                         'old_ms': old and old['median_ms'], 'new_ms': new and new['median_ms']})
+            continue
+        change = new['median_ms'] / old['median_ms'] - 1 if old['median_ms'] else 0.0
+        old_samples, new_samples = old.get('samples_ms', []), new.get('samples_ms', [])
+        if min(len(old_samples), len(new_samples)) < min_samples:
+            verdict, p_value = 'too few samples', None
+        elif smallest_p_value(len(old_samples), len(new_samples)) >= alpha:
+            verdict, p_value = 'alpha unreachable', None
+        else:
+            p_value = mann_whitney_p(old_samples, new_samples)
+            if p_value >= alpha:
+                verdict = 'noise' if abs(change) > threshold else 'unchanged'
+            elif change > threshold:
+                verdict = 'REGRESSION'
+            elif change < -threshold:
+                verdict = 'improvement'
+            else:
+                verdict = 'unchanged'  # Real but within the threshold
+        rows.append({'name': name, 'verdict': verdict, 'old_ms': old['median_ms'], 'new_ms': new['median_ms'],
+                     'change': change, 'p_value': p_value,
+                     'old_iqr_ms': old.get('iqr_ms'), 'new_iqr_ms': new.get('iqr_ms')})
+    return rows
+
+def setting_mismatches(baseline, current):
+    old, new = baseline.get('settings', {}), current.get('settings', {})
+    mismatches = [f"{key}: {old.get(key)} -> {new.get(key)}" for key in COMPARABLE_SETTINGS if old.get(key) != new.get(key)]
+    old_env, new_env = baseline.get('environment', {}), current.get('environment', {})
+    for key in ('python', 'implementation', 'platform', 'cpus'):
+        if old_env.get(key) != new_env.get(key):
+            mismatches.append(f"environment {key}: {old_env.get(key)} -> {new_env.get(key)}")
+    return mismatches
+
+def print_table(rows, baseline, current):
+    print(f"baseline {baseline.get('environment', {}).get('commit') or '?'} -> current {current.get('environment', {}).get('commit') or '?'}")
+    print(f"{'benchmark':<32} {'baseline ms':>12} {'current ms':>12} {'change':>8} {'p-value':>8}  verdict")
+    for row in rows:
+        old = f"{row['old_ms']:.4f}" if row.get('old_ms') is not None else '-'
+        new = f"{row['new_ms']:.4f}" if row.get('new_ms') is not None else '-'
+        change = f"{row['change']:+.1%}" if row.get('change') is not None else '-'
+        p_value = f"{row['p_value']:.4f}" if row.get('p_value') is not None else '-'
+        print(f"{row['name']:<32} {old:>12} {new:>12} {change:>8} {p_value:>8}  {row['verdict']}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare benchmark results against a stored baseline',
+                                     usage='%(prog)s [options] [-- benchmark.py arguments]')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline results file')
+    parser.add_argument('--current', help='Compare this results file instead of running the suite')
+    parser.add_argument('--save', action='store_true', help='Run the suite and store the results as the baseline')
+    parser.add_argument('--threshold', type=float, default=0.05, help='Relative median change that counts (0.05 = 5%%)')
+    parser.add_argument('--alpha', type=float, default=0.01, help='Significance level of the Mann-Whitney test')
+    parser.add_argument('--min-samples', type=int, default=5, help='Samples per side needed to judge a benchmark')
+    parser.add_argument('--json', dest='json_output', help='Also write the comparison as JSON to this file')
+    argv = sys.argv[1:]
+    benchmark_args = argv[argv.index('--') + 1:] if '--' in argv else []
+    args = parser.parse_args(argv[:argv.index('--')] if '--' in argv else argv)
+
+    if args.save:
+        results = run_suite(benchmark_args)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; create one with --save", file=sys.stderr)
+        return 2
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current, encoding='utf-8') as f:
+            current = json.load(f)
+    else:
+        current = run_suite(benchmark_args)
+
+    for mismatch in setting_mismatches(baseline, current):
+        print(f"warning: runs are not comparable ({mismatch})", file=sys.stderr)
+    rows = compare(baseline, current, args.threshold, args.alpha, args.min_samples)
+    print_table(rows, baseline, current)
+    if args.json_output:
+        with open(args.json_output, 'w', encoding='utf-8') as f:
+            json.dump({'threshold': args.threshold, 'alpha': args.alpha, 'results': rows}, f, indent=2)
+            f.write('\n')
+
+    regressions = [row['name'] for row in rows if row['verdict'] == 'REGRESSION']
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    unjudged = [row['name'] for row in rows if row['verdict'] == 'alpha unreachable']
+    if unjudged:
+        print(f"\nerror: p < {args.alpha} cannot be reached with this few samples, so {len(unjudged)} benchmark(s) "
+              f"could not be judged: {', '.join(unjudged)}. Run more repeats or raise --alpha.", file=sys.stderr)
+        return 2
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
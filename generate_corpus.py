@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Generate a deterministic corpus of synthetic DOCX resumes and job descriptions for benchmarks
+and load tests. Resumes vary along five controlled dimensions:
+    pages             ~500 words per page (a 15-page academic CV is --pages 15 --layouts academic)
+    keyword density   share of bullet points that mention taxonomy keywords
+    layout            section order and style (standard, skills_first, academic, no_headers)
+    tables            skills grids and project tables
+    images            embedded PNG pictures (a photo and logos)
+Job descriptions vary by length in words (exact, at most the app's 750) and number of distinct
+keywords; combinations whose keywords do not fit in the length are skipped.
+
+The same seed always produces byte-identical files: every item draws from its own RNG seeded by
+its name, and DOCX zip entries get fixed timestamps.
+
+Output directory layout:
+    resumes/*.docx              one file per combination of the resume dimensions
+    job_descriptions.jsonl      one {"id", "job_description", ...} record per line
+                                (readable by build_keyword_tables.py)
+    manifest.json               the parameters and measured size of every item
+
+Usage:
+    python generate_corpus.py corpus/
+    python generate_corpus.py corpus/ --pages 1 2 5 15 --layouts standard academic --densities 0.1 0.5
+    python generate_corpus.py --sample test_resume.docx
+"""
+
+import argparse
+import io
+import itertools
+import json
+import os
+import random
+import struct
+import sys
+import zipfile
+import zlib
+from datetime import datetime
+
+from docx import Document
+from docx.shared import Inches
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'keyword_taxonomy.json')
+WORDS_PER_PAGE = 500
+FIXED_TIMESTAMP = datetime(2024, 1, 1)
+
+LAYOUTS = {
+    'standard': ['Summary', 'Experience', 'Skills', 'Education'],
+    'skills_first': ['Skills', 'Experience', 'Projects', 'Education', 'Certifications'],
+    'academic': ['Education', 'Research Experience', 'Publications', 'Teaching', 'Grants and Awards', 'Skills'],
+    'no_headers': ['Summary', 'Experience', 'Skills', 'Education'],  # Same content, no heading paragraphs
+}
+# Sections that grow to reach the requested length; the others stay a fixed size
+BODY_SECTIONS = {'Experience', 'Projects', 'Research Experience', 'Publications', 'Teaching'}
+
+VERBS = ('Developed Implemented Managed Created Designed Built Improved Increased Reduced Led Coordinated '
+         'Organized Analyzed Researched Planned Executed Delivered Achieved Owned Supported Maintained').split()
+NOUNS = ('platform service pipeline dashboard API system workflow tooling release process application '
+         'feature integration migration model report infrastructure test suite library').split()
+FILLER = ('for internal teams across multiple regions with a focus on reliability and cost while working '
+          'closely with product design and operations stakeholders').split()
+OUTCOMES = ('reducing latency by {n}%', 'saving ${n}000 per year', 'increasing adoption by {n} percent',
+            'cutting incident volume by {n}%', 'serving {n}0000 daily users', '')
+TITLES = ('Software Engineer', 'Senior Software Engineer', 'Data Analyst', 'Research Assistant',
+          'Platform Engineer', 'Product Engineer', 'Machine Learning Engineer', 'Technical Lead')
+COMPANIES = ('Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries', 'Wayne Enterprises')
+DEGREES = ('BSc Computer Science', 'MSc Data Science', 'PhD Computational Biology', 'BA Economics', 'MEng Software Systems')
+DUTIES = 'build design maintain lead own improve scale operate review automate'.split()
+OPENERS = ('You will', 'The team will', 'We expect you to')
+REQUIREMENT_OPENERS = ('Experience with', 'Hands-on knowledge of', 'Familiarity with', 'Strong skills in')
+MAX_JOB_DESCRIPTION_WORDS = 750  # /optimize-docx rejects longer job descriptions
+JOURNALS = ('Journal of Applied Computing', 'Proceedings of the Data Systems Conference', 'Computational Methods Review')
+
+def load_vocabulary(path=TAXONOMY_PATH):
+    """Keyword display names and industry indicator words from the keyword taxonomy"""
+    with open(path, encoding='utf-8') as f:
+        taxonomy = json.load(f)
+    display_names = taxonomy.get('display_names', {})
+    keywords = sorted({kw for group in taxonomy['technical_keywords'].values() for kw in group})
+    return {
+        'keywords': [display_names.get(kw) or kw.title() for kw in keywords],
+        'industries': {name: sorted(words) for name, words in taxonomy.get('industry_indicators', {}).items()}
+    }
+
+def png_bytes(rng, width, height):
+    """A small RGB PNG with random colour blocks, built without an imaging library"""
+    colours = [bytes(rng.randrange(256) for _ in range(3)) for _ in range(4)]
+    block = max(1, width // 4)
+    rows = b''.join(b'\x00' + b''.join(colours[(x // block + y // block) % 4] for x in range(width)) for y in range(height))
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(rows, 9)) + chunk(b'IEND', b'')
+
+def docx_bytes(doc):
+    """Serialize a document reproducibly: fixed core properties and zip entry timestamps"""
+    properties = doc.core_properties
+    properties.created = properties.modified = FIXED_TIMESTAMP
+    properties.last_printed = FIXED_TIMESTAMP
+    properties.revision = 1
+    properties.author = properties.last_modified_by = 'generate_corpus'
+    raw = io.BytesIO()
+    doc.save(raw)
+    raw.seek(0)
+    output = io.BytesIO()
+    with zipfile.ZipFile(raw) as source, zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            entry = zipfile.ZipInfo(info.filename, date_time=FIXED_TIMESTAMP.timetuple()[:6])
+            entry.compress_type = zipfile.ZIP_DEFLATED
+            target.writestr(entry, source.read(info.filename))
+    return output.getvalue()
+
+def bullet(rng, vocabulary, keyword_density):
+    """One achievement line; with probability keyword_density it names one or two keywords"""
+    words = [rng.choice(VERBS), rng.choice(NOUNS)] + rng.sample(FILLER, rng.randint(4, 9))
+    keywords = []
+    if rng.random() < keyword_density:
+        keywords = rng.sample(vocabulary['keywords'], rng.randint(1, 2))
+        words += ['using', ' and '.join(keywords)]
+    outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 60))
+    if outcome:
+        words.append(outcome)
+    return ' '.join(words), keywords
+
+class ResumeBuilder:
+    """Accumulates a generated resume and what went into it"""
+    def __init__(self, rng, vocabulary, keyword_density):
+        self.rng = rng
+        self.vocabulary = vocabulary
+        self.keyword_density = keyword_density
+        self.doc = Document()
+        self.words = 0
+        self.keywords = set()
+        self.tables = 0
+        self.images = 0
+
+    def paragraph(self, text, style=None):
+        self.doc.add_paragraph(text, style=style)
+        self.words += len(text.split())
+
+    def bullet(self):
+        text, keywords = bullet(self.rng, self.vocabulary, self.keyword_density)
+        self.keywords.update(keywords)
+        self.paragraph(text, style='List Bullet')
+
+    def image(self, width_inches):
+        self.doc.add_picture(io.BytesIO(png_bytes(self.rng, 48, 48)), width=Inches(width_inches))
+        self.images += 1
+
+    def table(self, header, rows):
+        table = self.doc.add_table(rows=1, cols=len(header))
+        table.style = 'Table Grid'
+        for cell, text in zip(table.rows[0].cells, header):
+            cell.text = text
+        for row in rows:
+            for cell, text in zip(table.add_row().cells, row):
+                cell.text = text
+                self.words += len(text.split())
+        self.tables += 1
+
+    def skills_table(self):
+        keywords = self.rng.sample(self.vocabulary['keywords'], 12)
+        self.keywords.update(keywords)
+        self.table(['Area', 'Tools'], [[area, ', '.join(keywords[i * 3:i * 3 + 3])]
+                                      for i, area in enumerate(('Languages', 'Frameworks', 'Data', 'Infrastructure'))])
+
+    def projects_table(self):
+        rows = []
+        for _ in range(4):
+            keyword = self.rng.choice(self.vocabulary['keywords'])
+            self.keywords.add(keyword)
+            rows.append([f'{self.rng.choice(NOUNS).title()} {self.rng.choice(NOUNS)}', keyword,
+                         self.rng.choice(OUTCOMES).format(n=self.rng.randint(5, 60)) or 'Shipped'])
+        self.table(['Project', 'Technology', 'Outcome'], rows)
+
+def write_section(builder, section, headers, tables_left):
+    """Fixed-size part of a section; returns how many tables it used"""
+    rng = builder.rng
+    if headers:
+        builder.doc.add_heading(section, level=1)
+        builder.words += len(section.split())
+    used = 0
+    if section == 'Summary':
+        builder.paragraph(' '.join(bullet(rng, builder.vocabulary, builder.keyword_density)[0] for _ in range(2)))
+    elif section == 'Skills':
+        if tables_left > 0:
+            builder.skills_table()
+            used = 1
+        else:
+            keywords = rng.sample(builder.vocabulary['keywords'], 10)
+            builder.keywords.update(keywords)
+            builder.paragraph(', '.join(keywords))
+    elif section == 'Education':
+        for _ in range(rng.randint(1, 3)):
+            builder.paragraph(f'{rng.choice(DEGREES)}, University of {rng.choice(COMPANIES).split()[0]}, {rng.randint(2000, 2022)}')
+    elif section in ('Certifications', 'Grants and Awards'):
+        for _ in range(3):
+            builder.paragraph(f'{rng.choice(NOUNS).title()} {section.split()[0].rstrip("s")} ({rng.randint(2010, 2024)})')
+    return used
+
+def grow_section(builder, section):
+    """Add one block (a role, a publication, a course) to a section that grows with page count"""
+    rng = builder.rng
+    if section == 'Publications':
+        builder.paragraph(f'{rng.choice(COMPANIES).split()[0]}, J. et al. ({rng.randint(2005, 2024)}). '
+                          f'{" ".join(rng.sample(FILLER, 8)).capitalize()}. {rng.choice(JOURNALS)}, {rng.randint(1, 40)}.')
+    elif section == 'Teaching':
+        builder.paragraph(f'Teaching Assistant, {rng.choice(DEGREES).split(" ", 1)[1]} ({rng.randint(2010, 2024)})')
+        builder.bullet()
+    else:
+        builder.paragraph(f'{rng.choice(TITLES)}, {rng.choice(COMPANIES)} ({rng.randint(2010, 2020)}-{rng.randint(2021, 2024)})')
+        for _ in range(rng.randint(3, 6)):
+            builder.bullet()
+
+def generate_resume(rng, vocabulary, pages=2, layout='standard', keyword_density=0.3, tables=0, images=0):
+    """Build a resume; returns the Document and a description of what it contains"""
+    builder = ResumeBuilder(rng, vocabulary, keyword_density)
+    sections = LAYOUTS[layout]
+    headers = layout != 'no_headers'
+
+    if images:
+        builder.image(1.0)  # Photo in the header
+    builder.doc.add_heading('Jordan Example', 0) if headers else builder.paragraph('Jordan Example')
+    builder.paragraph('jordan@example.com | 555-0100 | github.com/jexample')
+
+    tables_left = tables
+    for section in sections:
+        tables_left -= write_section(builder, section, headers, tables_left)
+        if section in BODY_SECTIONS:
+            grow_section(builder, section)
+
+    # Grow the body sections round-robin until the target length, placing extra tables and images as we go
+    body = [section for section in sections if section in BODY_SECTIONS] or ['Experience']
+    for section in itertools.cycle(body):
+        if builder.words >= pages * WORDS_PER_PAGE and tables_left <= 0 and builder.images >= images:
+            break
+        if tables_left > 0:
+            builder.projects_table()
+            tables_left -= 1
+        if builder.images < images:
+            builder.image(0.5)  # Company or institution logo
+        if builder.words < pages * WORDS_PER_PAGE:
+            grow_section(builder, section)
+
+    return builder.doc, {
+        'pages': pages,
+        'layout': layout,
+        'keyword_density': keyword_density,
+        'tables': builder.tables,
+        'images': builder.images,
+        'words': builder.words,
+        'keywords': sorted(builder.keywords)
+    }
+
+def duty_sentence(rng, indicators, length):
+    """One 'About the role' sentence of exactly `length` words"""
+    if length < 3:
+        return ' '.join(['Apply', 'today'][:length]) + '.'
+    opener = rng.choice([opener for opener in OPENERS if len(opener.split()) < length]).split()
+    words = [*opener, rng.choice(DUTIES)]
+    if len(words) < length:
+        words.append(rng.choice(NOUNS))
+    indicator = rng.choice(indicators).split()
+    if length - len(words) < len(indicator):
+        indicator = []
+    filler = length - len(words) - len(indicator)
+    words += rng.sample(FILLER, filler) + indicator
+    return ' '.join(words) + '.'
+
+def requirement_sentence(rng, keywords):
+    """'Experience with A, B and C.' for one to three keywords"""
+    named = keywords[0] if len(keywords) == 1 else f"{', '.join(keywords[:-1])} and {keywords[-1]}"
+    return f'{rng.choice(REQUIREMENT_OPENERS)} {named}.'
+
+def generate_job_description(rng, vocabulary, words=400, keywords=15, industry=None):
+    """Job description of exactly `words` words (clamped to the app's limit of 750) naming `keywords`
+    keywords. Raises ValueError when the keywords and headings alone need more words than that."""
+    words = min(words, MAX_JOB_DESCRIPTION_WORDS)
+    industry = industry or rng.choice(sorted(vocabulary['industries']) or ['software_engineering'])
+    indicators = vocabulary['industries'].get(industry) or ['engineer']
+    chosen = rng.sample(vocabulary['keywords'], min(keywords, len(vocabulary['keywords'])))
+    title = f'{rng.choice(("Senior", "Lead", "Staff", ""))} {rng.choice(indicators).title()} {rng.choice(("Engineer", "Specialist", "Analyst"))}'.strip()
+
+    requirements = []
+    pending = list(chosen)
+    while pending:
+        group = pending[:rng.randint(1, 3)]
+        del pending[:len(group)]
+        requirements.append(requirement_sentence(rng, group))
+    head = [f'{title} at {rng.choice(COMPANIES)}.', 'About the role:']
+    tail = ['Requirements:', *requirements]
+    # The duty sentences take whatever the headings and requirements leave, so the total is exact
+    remaining = words - len(' '.join(head + tail).split())
+    if remaining < 0:
+        raise ValueError(f'{len(chosen)} keywords need at least {words - remaining} words, more than {words}')
+    duties = []
+    while remaining:
+        # Leave at least 3 words for the next sentence, so only a tiny budget ends in a fragment
+        length = remaining if remaining <= 16 else min(rng.randint(9, 16), remaining - 3)
+        duties.append(duty_sentence(rng, indicators, length))
+        remaining -= length
+    text = ' '.join(head + duties + tail)
+    return text, {'words': len(text.split()), 'keywords': sorted(chosen), 'industry': industry}
+
+def item_rng(seed, name):
+    """An independent RNG per item, so adding dimensions never changes existing items"""
+    return random.Random(f'{seed}:{name}')
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic resumes and job descriptions')
+    parser.add_argument('output', nargs='?', help='Directory to write the corpus into')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 2, 5])
+    parser.add_argument('--layouts', nargs='+', choices=sorted(LAYOUTS), default=['standard', 'academic'])
+    parser.add_argument('--densities', type=float, nargs='+', default=[0.1, 0.4], help='Keyword density per bullet point')
+    parser.add_argument('--tables', type=int, nargs='+', default=[0, 2])
+    parser.add_argument('--images', type=int, nargs='+', default=[0, 1])
+    parser.add_argument('--variants', type=int, default=1, help='Resumes per combination of dimensions')
+    parser.add_argument('--jd-words', type=int, nargs='+', default=[150, 400, 740])
+    parser.add_argument('--jd-keywords', type=int, nargs='+', default=[5, 20, 40])
+    parser.add_argument('--taxonomy', default=TAXONOMY_PATH, help='Keyword taxonomy to draw keywords from')
+    parser.add_argument('--sample', metavar='PATH', help='Write a single one-page standard resume to PATH and exit')
+    args = parser.parse_args()
+    vocabulary = load_vocabulary(args.taxonomy)
+
+    if args.sample:
+        doc, _ = generate_resume(item_rng(args.seed, 'sample'), vocabulary, pages=1)
+        with open(args.sample, 'wb') as f:
+            f.write(docx_bytes(doc))
+        print(f"Wrote {args.sample}")
+        return
+    if not args.output:
+        parser.error('an output directory (or --sample PATH) is required')
+
+    os.makedirs(os.path.join(args.output, 'resumes'), exist_ok=True)
+    manifest = {'seed': args.seed, 'resumes': [], 'job_descriptions': []}
+    for pages, layout, density, tables, images, variant in itertools.product(
+            args.pages, args.layouts, args.densities, args.tables, args.images, range(args.variants)):
+        name = f'resume_p{pages:02d}_{layout}_d{density:.2f}_t{tables}_i{images}_v{variant}'
+        doc, meta = generate_resume(item_rng(args.seed, name), vocabulary, pages, layout, density, tables, images)
+        data = docx_bytes(doc)
+        path = os.path.join('resumes', f'{name}.docx')
+        with open(os.path.join(args.output, path), 'wb') as f:
+            f.write(data)
+        manifest['resumes'].append({'file': path, 'bytes': len(data), **meta})
+
+    with open(os.path.join(args.output, 'job_descriptions.jsonl'), 'w', encoding='utf-8') as f:
+        for words, keywords, variant in itertools.product(args.jd_words, args.jd_keywords, range(args.variants)):
+            name = f'jd_w{words}_k{keywords}_v{variant}'
+            try:
+                text, meta = generate_job_description(item_rng(args.seed, name), vocabulary, words, keywords)
+            except ValueError as e:
+                print(f"Skipping {name}: {e}", file=sys.stderr)
+                continue
+            f.write(json.dumps({'id': name, 'job_description': text, **meta}) + '\n')
+            manifest['job_descriptions'].append({'id': name, **meta})
+
+    with open(os.path.join(args.output, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    print(f"Wrote {len(manifest['resumes'])} resumes and {len(manifest['job_descriptions'])} job descriptions to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Gunicorn settings: load app.py once in the master and fork workers from it"""
+import gc
+import os
+import tempfile
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))  # More than 1 switches to the gthread worker
+timeout = int(os.environ.setdefault('GUNICORN_TIMEOUT', '60'))  # app.py caps /debug/profile below this
+
+# Workers publish metric snapshots here; any worker answering /metrics sums them all.
+# One directory per master, so a restarted server does not count its predecessor's requests.
+os.environ.setdefault('METRICS_DIR', os.path.join(tempfile.gettempdir(), f'resume-metrics-{os.getpid()}'))
+
+# Every worker polls the keyword taxonomy file, so an edit reaches all of them; POST /taxonomy/reload
+# only reloads the worker that serves it.
+os.environ.setdefault('TAXONOMY_WATCH_INTERVAL', '5')
+
+# Import app.py (keyword taxonomy, compiled patterns, IDF and neighbour tables) once in the master.
+# Workers inherit it instead of each rebuilding their own copy.
+preload_app = True
+
+def on_starting(server):
+    """Drop snapshots left by a previous server using the same METRICS_DIR"""
+    directory = os.environ['METRICS_DIR']
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if name.startswith('worker_'):
+                os.remove(os.path.join(directory, name))
+
+def child_exit(server, worker):
+    """Drop the snapshot of a worker that exited, so /metrics stops counting it at once"""
+    directory = os.environ['METRICS_DIR']
+    prefix = f'worker_{worker.pid}_'
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if name.startswith(prefix):
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass
+
+def when_ready(server):
+    """Runs in the master after the app is loaded and before the first worker is forked"""
+    from app import prepare_for_fork
+    prepare_for_fork()
+
+def post_fork(server, worker):
+    # Thresholds are inherited, but set them again in case a hook or library changed them
+    from app import app
+    gc.set_threshold(*app.config['GC_THRESHOLDS'])
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Replay traffic captured with TRAFFIC_CAPTURE_PATH against the app, in-process (Flask test client)
+or against a running server, and report latency percentiles, error rates and throughput.
+
+Requests are sent open-loop on the captured schedule: request i goes out at
+(arrival_i - arrival_0) / --speed seconds after the start, whether or not earlier requests have
+finished, with at most --concurrency in flight. Latency is measured from the scheduled send time,
+so time spent waiting for a free connection counts (a slow server cannot hide its queueing by
+slowing the load down); service time is measured from the actual send.
+
+Captures made with TRAFFIC_CAPTURE_PAYLOADS=1 replay the anonymized texts and documents. Without
+payloads, each distinct digest gets a synthetic stand-in from generate_corpus.py of about the
+captured size, so duplicate submissions still hit the caches the way they did in production.
+
+Usage:
+    python replay_traffic.py capture.jsonl                          # in-process, real time
+    python replay_traffic.py capture.jsonl --speed 10               # 10x faster than captured
+    python replay_traffic.py capture.jsonl --speed 0 --concurrency 8   # as fast as possible
+    python replay_traffic.py capture.jsonl --target http://localhost:5000 --output replay.json
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import re
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import generate_corpus
+
+EMPTY_DOCX_BYTES = 37300  # Size of a generated resume with no body text
+DOCX_BYTES_PER_PAGE = 750  # Compressed size of one generated page
+
+def load_capture(path, path_filter=None, limit=None):
+    """Captured records in arrival order (lines from several workers may be slightly out of order)"""
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if path_filter and not re.search(path_filter, record['path']):
+                continue
+            records.append(record)
+    records.sort(key=lambda record: record['arrival'])
+    return records[:limit] if limit else records
+
+class PayloadSource:
+    """Request bodies for captured records: anonymized payloads when captured, synthetic stand-ins
+    (one per digest) otherwise"""
+
+    def __init__(self, capture_path, seed):
+        self.payload_dir = capture_path + '.payloads'
+        self.seed = seed
+        self.vocabulary = generate_corpus.load_vocabulary()
+        self.documents = {}
+        self.texts = {}
+        self.lock = threading.Lock()
+        self.synthetic = 0
+
+    def document(self, info):
+        with self.lock:
+            if info['sha256'] not in self.documents:
+                payload = os.path.join(self.payload_dir, info.get('payload') or '')
+                if info.get('payload') and os.path.exists(payload):
+                    with open(payload, 'rb') as f:
+                        self.documents[info['sha256']] = f.read()
+                else:
+                    pages = max(1, min(30, round((info['size'] - EMPTY_DOCX_BYTES) / DOCX_BYTES_PER_PAGE)))
+                    rng = generate_corpus.item_rng(self.seed, info['sha256'])
+                    doc, _ = generate_corpus.generate_resume(rng, self.vocabulary, pages=pages)
+                    self.documents[info['sha256']] = generate_corpus.docx_bytes(doc)
+                    self.synthetic += 1
+            return self.documents[info['sha256']]
+
+    def text(self, name, field):
+        if 'value' in field:
+            return field['value']
+        if 'text' in field:
+            return field['text']
+        with self.lock:
+            if field['sha256'] not in self.texts:
+                rng = generate_corpus.item_rng(self.seed, field['sha256'])
+                text = None
+                if name == 'jobDescription':
+                    try:
+                        text, _ = generate_corpus.generate_job_description(rng, self.vocabulary, words=field['words'],
+                                                                           keywords=min(15, field['words'] // 10))
+                    except ValueError:  # Too short for headings; fall back to a list of keywords
+                        pass
+                if text is None:
+                    words = rng.sample(self.vocabulary['keywords'], min(field['words'], len(self.vocabulary['keywords'])))
+                    text = ', '.join(words) if name == 'extraKeywords' else ' '.join(words).title()
+                self.texts[field['sha256']] = text[:field['length']] if name != 'jobDescription' else text
+                self.synthetic += 1
+            return self.texts[field['sha256']]
+
+    def body(self, record):
+        form = {name: self.text(name, field) for name, field in record['form'].items()}
+        files = {name: (self.document(info), f"resume{info['extension'] or '.docx'}") for name, info in record['files'].items()}
+        return form, files
+
+def encode_multipart(form, files):
+    boundary = uuid.uuid4().hex
+    body = io.BytesIO()
+    for name, value in form.items():
+        body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode())
+        body.write(value.encode('utf-8') + b'\r\n')
+    for name, (data, filename) in files.items():
+        body.write(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                   f'Content-Type: application/octet-stream\r\n\r\n'.encode())
+        body.write(data + b'\r\n')
+    body.write(f'--{boundary}--\r\n'.encode())
+    return body.getvalue(), f'multipart/form-data; boundary={boundary}'
+
+def http_sender(target, timeout):
+    def send(record, form, files):
+        url = target.rstrip('/') + record['path']
+        if record['args']:
+            url += '?' + urllib.parse.urlencode(record['args'])
+        data, headers = None, {}
+        if form or files:
+            data, headers['Content-Type'] = encode_multipart(form, files)
+        request = urllib.request.Request(url, data=data, headers=headers, method=record['method'])
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            e.read()
+            return e.code
+    return send
+
+def in_process_sender():
+    import app
+    logging.disable(logging.INFO)  # Request summaries would dominate the output
+    app.app.config['METRICS_FLUSH_INTERVAL'] = 0
+    app.app.config['TRAFFIC_CAPTURE_PATH'] = None  # Do not capture the replay itself
+    app.warm_up()
+    clients = threading.local()
+
+    def send(record, form, files):
+        if not hasattr(clients, 'client'):
+            clients.client = app.app.test_client()
+        data = dict(form)
+        data.update({name: (io.BytesIO(content), filename) for name, (content, filename) in files.items()})
+        response = clients.client.open(record['path'], method=record['method'], query_string=record['args'],
+                                       data=data or None, content_type='multipart/form-data' if data else None)
+        response.get_data()
+        return response.status_code
+    return send
+
+def percentiles(values):
+    if not values:
+        return {}
+    ordered = sorted(values)
+    cuts = statistics.quantiles(ordered, n=100, method='inclusive') if len(ordered) > 1 else [ordered[0]] * 99
+    return {
+        'p50_ms': round(statistics.median(ordered), 3),
+        'p90_ms': round(cuts[89], 3),
+        'p95_ms': round(cuts[94], 3),
+        'p99_ms': round(cuts[98], 3),
+        'max_ms': round(ordered[-1], 3)
+    }
+
+def summarize(results, wall_seconds):
+    """Counts, error rates, throughput and latency percentiles for a list of request results"""
+    count = len(results)
+    client_errors = sum(1 for result in results if result['status'] and 400 <= result['status'] < 500)
+    server_errors = sum(1 for result in results if result['status'] and result['status'] >= 500)
+    failures = sum(1 for result in results if result['status'] is None)
+    return {
+        'requests': count,
+        'client_errors': client_errors,
+        'server_errors': server_errors,
+        'failures': failures,  # No response: connection errors and timeouts
+        'error_rate': round((server_errors + failures) / count, 4) if count else 0.0,
+        'status_mismatches': sum(1 for result in results if result['status'] != result['captured_status']),
+        'throughput_rps': round(count / wall_seconds, 2) if wall_seconds else 0.0,
+        'latency': percentiles([result['latency_ms'] for result in results]),
+        'service': percentiles([result['service_ms'] for result in results])
+    }
+
+def replay(records, source, send, speed, concurrency):
+    """Send the records on their captured schedule (scaled by speed; 0 sends them back to back)"""
+    results = []
+    results_lock = threading.Lock()
+    bodies = [source.body(record) for record in records]  # Build every body before the clock starts
+    first_arrival = records[0]['arrival']
+
+    def run(record, body, scheduled):
+        sent = time.perf_counter()
+        try:
+            status, error = send(record, *body), None
+        except Exception as e:
+            status, error = None, f'{type(e).__name__}: {e}'
+        done = time.perf_counter()
+        with results_lock:
+            results.append({
+                'path': record['path'],
+                'status': status,
+                'captured_status': record['status'],
+                'error': error,
+                'latency_ms': (done - scheduled) * 1000,
+                'service_ms': (done - sent) * 1000
+            })
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for record, body in zip(records, bodies):
+            scheduled = start + (record['arrival'] - first_arrival) / speed if speed > 0 else time.perf_counter()
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(run, record, body, scheduled)
+    return results, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay captured traffic and report latency, errors and throughput')
+    parser.add_argument('capture', help='JSONL file written by the app with TRAFFIC_CAPTURE_PATH set')
+    parser.add_argument('--target', help='Base URL of a running server (default: replay in-process)')
+    parser.add_argument('--speed', type=float, default=1.0, help='Replay rate relative to capture (0 = as fast as possible)')
+    parser.add_argument('--concurrency', type=int, default=16, help='Maximum requests in flight')
+    parser.add_argument('--filter', help='Only replay requests whose path matches this regular expression')
+    parser.add_argument('--limit', type=int, help='Replay only the first N captured requests')
+    parser.add_argument('--timeout', type=float, default=60, help='Per-request timeout against --target')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for synthetic stand-ins of uncaptured payloads')
+    parser.add_argument('--output', help='Write the report as JSON to this file')
+    args = parser.parse_args()
+
+    records = load_capture(args.capture, args.filter, args.limit)
+    if not records:
+        parser.error(f'No requests to replay in {args.capture}')
+    source = PayloadSource(args.capture, args.seed)
+    send = http_sender(args.target, args.timeout) if args.target else in_process_sender()
+    results, wall_seconds = replay(records, source, send, args.speed, args.concurrency)
+
+    captured_seconds = records[-1]['arrival'] - records[0]['arrival']
+    report = {
+        'capture': os.path.abspath(args.capture),
+        'target': args.target or 'in-process',
+        'speed': args.speed,
+        'concurrency': args.concurrency,
+        'captured_seconds': round(captured_seconds, 3),
+        'wall_seconds': round(wall_seconds, 3),
+        'synthetic_payloads': source.synthetic,
+        'overall': summarize(results, wall_seconds),
+        'endpoints': {
+            path: summarize([result for result in results if result['path'] == path], wall_seconds)
+            for path in sorted({result['path'] for result in results})
+        },
+        'errors': sorted({result['error'] for result in results if result['error']})[:20]
+    }
+
+    print(f"Replayed {len(results)} requests from {report['captured_seconds']}s of capture in "
+          f"{report['wall_seconds']}s ({report['target']}, speed {args.speed or 'max'}, "
+          f"{source.synthetic} synthetic payloads)")
+    print(f"{'endpoint':<28} {'requests':>8} {'rps':>8} {'err %':>6} {'4xx':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for path, summary in [*report['endpoints'].items(), ('overall', report['overall'])]:
+        latency = summary['latency']
+        print(f"{path:<28} {summary['requests']:>8} {summary['throughput_rps']:>8.2f} {summary['error_rate']:>6.1%} "
+              f"{summary['client_errors']:>5} {latency['p50_ms']:>9.2f} {latency['p95_ms']:>9.2f} "
+              f"{latency['p99_ms']:>9.2f} {latency['max_ms']:>9.2f}")
+    for error in report['errors']:
+        print(f"error: {error}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"Wrote {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Start-up report: how long a fresh worker takes to import app.py and to become ready, which
+modules the time goes to (python -X importtime) and how long each of the app's own start-up
+phases takes (taxonomy, keyword tables, warm-up).
+
+Every run starts a new interpreter, so nothing is cached in memory; the compiled taxonomy on disk
+is. --cold deletes it first to measure a first start after a deploy.
+
+Usage:
+    python startup_report.py
+    python startup_report.py --runs 10 --top 15
+    python startup_report.py --cold --output startup.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Runs in the child: import, warm up, and report the app's own phase timings on the last line
+CHILD = """
+import time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+app.warm_up()
+ready = time.perf_counter()
+import json
+print(json.dumps({'import_ms': (imported - started) * 1000, 'ready_ms': (ready - started) * 1000,
+                  'phases_ms': app.startup_timings}))
+"""
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)')
+
+def run_once():
+    """Start-up timings and (module, self ms, cumulative ms) per import of one fresh interpreter"""
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', CHILD], cwd=HERE,
+                            capture_output=True, text=True, check=True)
+    process_ms = (time.perf_counter() - started) * 1000
+    modules = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            modules.append((name, int(self_us) / 1000, int(cumulative_us) / 1000))
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings['process_ms'] = process_ms
+    return timings, modules
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure worker start-up: imports, start-up phases and time to ready')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters to start (medians are reported)')
+    parser.add_argument('--top', type=int, default=10, help='Slowest modules to list')
+    parser.add_argument('--cold', action='store_true', help='Delete the compiled taxonomy before every run')
+    parser.add_argument('--output', help='Write the report as JSON to this file')
+    args = parser.parse_args()
+
+    compiled_path = os.environ.get('TAXONOMY_COMPILED_PATH') or os.path.join(HERE, 'data', 'keyword_taxonomy.compiled.json')
+    runs = []
+    for _ in range(args.runs):
+        if args.cold and os.path.exists(compiled_path):
+            os.remove(compiled_path)
+        runs.append(run_once())
+
+    def median(values):
+        return round(statistics.median(values), 2)
+
+    phases = sorted({phase for timings, _ in runs for phase in timings['phases_ms']})
+    report = {
+        'runs': args.runs,
+        'cold': args.cold,
+        'process_ms': median([timings['process_ms'] for timings, _ in runs]),
+        'import_ms': median([timings['import_ms'] for timings, _ in runs]),
+        'ready_ms': median([timings['ready_ms'] for timings, _ in runs]),
+        'phases_ms': {phase: median([timings['phases_ms'].get(phase, 0) for timings, _ in runs]) for phase in phases},
+    }
+    # Per-module self times (median over runs), and summed per top-level package
+    module_times = {}
+    package_times = {}
+    for _, modules in runs:
+        packages = {}
+        for name, self_ms, cumulative_ms in modules:
+            module_times.setdefault(name, []).append((self_ms, cumulative_ms))
+            packages[name.split('.')[0]] = packages.get(name.split('.')[0], 0) + self_ms
+        for package, ms in packages.items():
+            package_times.setdefault(package, []).append(ms)
+    report['packages_ms'] = dict(sorted(((package, median(times)) for package, times in package_times.items()),
+                                        key=lambda item: -item[1])[:args.top])
+    report['modules'] = sorted(
+        ({'module': name, 'self_ms': median([t[0] for t in times]), 'cumulative_ms': median([t[1] for t in times])}
+         for name, times in module_times.items()),
+        key=lambda module: -module['self_ms']
+    )[:args.top]
+
+    print(f"{args.runs} fresh interpreters{' (compiled taxonomy deleted before each)' if args.cold else ''}, medians:")
+    print(f"  process start to exit   {report['process_ms']:>9.1f} ms")
+    print(f"  import app              {report['import_ms']:>9.1f} ms")
+    print(f"  import app + warm_up()  {report['ready_ms']:>9.1f} ms")
+    print("\napp start-up phases")
+    for phase, ms in report['phases_ms'].items():
+        print(f"  {phase:<22} {ms:>9.1f} ms")
+    print("\nimport time by top-level package (self time)")
+    for package, ms in report['packages_ms'].items():
+        print(f"  {package:<22} {ms:>9.1f} ms")
+    print("\nslowest modules (self time)")
+    for module in report['modules']:
+        print(f"  {module['module']:<40} {module['self_ms']:>8.1f} ms self {module['cumulative_ms']:>8.1f} ms cumulative")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"Wrote {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,540 @@
+"""Unit tests for app.py's keyword matching and scoring. Run with: python -m pytest test_app.py"""
+
+import errno
+import io
+import json
+import os
+import time
+
+import pytest
+
+import app
+
+# Ordinary English words one or more edits away from a keyword, which must not match it
+FUZZY_NEAR_MISSES = ['tables', 'linear', 'transform', 'graphs', 'notify', 'powers', 'circle', 'variant']
+
+@pytest.fixture
+def fuzzy_matching():
+    previous = app.app.config['FUZZY_MATCHING']
+    app.app.config['FUZZY_MATCHING'] = True
+    yield
+    app.app.config['FUZZY_MATCHING'] = previous
+
+@pytest.mark.parametrize('word', FUZZY_NEAR_MISSES)
+def test_fuzzy_lookup_rejects_words_beyond_the_distance_limit(word):
+    assert app.keyword_taxonomy.fuzzy_index.lookup(word) is None
+
+@pytest.mark.parametrize('typo, surface', [('kubernets', 'kubernetes'), ('postgress', 'postgres'),
+                                           ('pyhton', 'python'), ('dokcer', 'docker')])
+def test_fuzzy_lookup_matches_typos_within_the_limit(typo, surface):
+    assert app.keyword_taxonomy.fuzzy_index.lookup(typo) == surface
+
+def test_fuzzy_extraction_ignores_near_miss_words(fuzzy_matching):
+    keywords = app.extract_technical_keywords_optimized(' '.join(FUZZY_NEAR_MISSES))
+    assert not keywords
+
+# English words a single edit from a keyword are excluded before any lookup
+@pytest.mark.parametrize('word', ['docket', 'docked', 'linked', 'conference', 'jupiter', 'reacts', 'annular'])
+def test_fuzzy_extraction_skips_excluded_words(fuzzy_matching, word):
+    assert not app.is_fuzzy_candidate(word, app.keyword_taxonomy)
+    app.keyword_cache.clear()
+    assert app.extract_technical_keywords_optimized(f'Filed the {word} reports') == ()
+
+def test_fuzzy_extraction_finds_typos_among_ordinary_words(fuzzy_matching):
+    app.keyword_cache.clear()
+    keywords = app.extract_technical_keywords_optimized('Linked the docket service to Kubernets and Postgress at the conference')
+    assert keywords == ('Kubernetes', 'PostgreSQL')
+
+def test_fuzzy_candidates_follow_document_order():
+    app.paragraph_feature_cache.clear()
+    features = app.get_document_features('Zookeeper kubernets\nAlerting across regions kubernets')
+    assert features['fuzzy_candidates'] == ('zookeeper', 'kubernets', 'alerting', 'across', 'regions')
+
+def test_fuzzy_budget_goes_to_the_top_of_the_resume(fuzzy_matching, monkeypatch):
+    # Alphabetical order would spend the single lookup on 'aardvarks' and miss the typo
+    monkeypatch.setattr(app.keyword_taxonomy.fuzzy_index, 'lookup_cache', {})
+    monkeypatch.setitem(app.app.config, 'FUZZY_LOOKUP_BUDGET', 1)
+    app.paragraph_feature_cache.clear()
+    app.keyword_cache.clear()
+    score = app.calculate_keyword_match_score_optimized('Kubernets operator\nAardvarks enthusiast', 'Kubernetes')
+    assert score == 100
+
+# Action verbs count as whole words only: 'skilled' and 'called' used to count as 'led'
+@pytest.mark.parametrize('text, verbs', [
+    ('Led a team of five engineers', {'led'}),
+    ('Skilled communicator who called stakeholders weekly', set()),
+    ('Designed and built the billing service', {'designed', 'built'}),
+    ('Redesigned the rebuilt pipeline', set()),
+])
+def test_action_verbs_match_whole_words(text, verbs):
+    assert app.analyze_paragraph(text)['action_verbs'] == verbs
+
+def test_content_score_ignores_verbs_inside_other_words():
+    app.paragraph_feature_cache.clear()
+    assert app.calculate_content_quality_score_optimized('Skilled communicator, called clients daily') == 70
+    assert app.calculate_content_quality_score_optimized('Led and managed the team') == 74
+
+def test_achievement_delta_and_amount_both_count():
+    assert app.analyze_paragraph('Throughput increased by 40% after the rewrite')['achievement_counts'] == (1, 1)
+
+# Empty results are cached like any other: a paragraph or text without keywords is analyzed once
+def test_empty_keyword_result_is_served_from_the_cache(monkeypatch):
+    app.keyword_cache.clear()
+    calls = []
+    find_keyword_matches = app.find_keyword_matches
+    monkeypatch.setattr(app, 'find_keyword_matches', lambda text: calls.append(text) or find_keyword_matches(text))
+    assert app.extract_technical_keywords_optimized('Enjoys hiking and cooking') == ()
+    assert app.extract_technical_keywords_optimized('Enjoys hiking and cooking') == ()
+    assert len(calls) == 1
+
+def test_empty_keyword_weights_are_served_from_the_cache(monkeypatch):
+    app.keyword_cache.clear()
+    calls = []
+    count_keyword_terms = app.count_keyword_terms
+    monkeypatch.setattr(app, 'count_keyword_terms', lambda text: calls.append(text) or count_keyword_terms(text))
+    assert app.get_keyword_weights('Friendly office manager wanted') == {}
+    assert app.get_keyword_weights('Friendly office manager wanted') == {}
+    assert len(calls) == 1
+
+# Section insertion: the section index must pick the same paragraph as the linear scan it replaced.
+# Each layout is paragraphs, or ('table', [cell texts]), and the body paragraph the keywords should land in
+# (None: a new Skills section is appended).
+SECTION_LAYOUTS = {
+    'skills list after header': (['Jane Doe', 'SKILLS', 'Python, SQL and Git', 'EXPERIENCE', 'Led a team'], 2),
+    'empty paragraph after header': (['Jane Doe', 'Technical Skills', '', 'Experience'], 2),
+    'no skills section, tools list': (['Jane Doe', 'Experience', 'Built a service', 'Tools', 'Jira / Confluence'], 4),
+    'no skills, tools or frameworks': (['Jane Doe', 'Experience', 'Built a service', 'Education'], None),
+    'several skills headers': (['Skills', 'Python, SQL', 'Projects', 'Core Skills', 'Go and Rust'], 1),
+    'skills header without a list': (['Skills', 'Built a service', 'Experience', 'Planning, hiring'], 3),
+    'list before the header only': (['Python, SQL', 'Skills', 'Built a service'], None),
+    'header sentence too long': (['My technical skills are listed in the section below', 'Python, SQL'], None),
+    'headers inside tables': ([('table', ['Skills', 'Python, SQL']), 'Experience', 'Built a service'], None),
+    'table header, body tools': ([('table', ['Skills']), 'Platforms', 'AWS and GCP'], 1),
+}
+
+def legacy_section_target(paragraphs):
+    """The pre-index linear scan, reduced to the index of the paragraph it would have filled"""
+    for header_variations in (app.SECTION_HEADERS['skills'], app.SECTION_HEADERS['tools'],
+                              app.SECTION_HEADERS['frameworks']):
+        idx = None
+        for i, text in enumerate(paragraphs):
+            text_upper = text.strip().upper()
+            if any(header in text_upper and len(text_upper) < 30 for header in header_variations):
+                idx = i
+                break
+        if idx is None:
+            continue
+        for j in range(idx + 1, len(paragraphs)):
+            text = paragraphs[j].strip()
+            if text and (',' in text or '/' in text or '&' in text or ' and ' in text):
+                return j
+        if idx < len(paragraphs) - 1 and not paragraphs[idx + 1].strip():
+            return idx + 1
+    return None
+
+def make_docx(layout):
+    doc = app.Document()
+    for item in layout:
+        if isinstance(item, tuple):
+            table = doc.add_table(rows=1, cols=len(item[1]))
+            for cell, text in zip(table.rows[0].cells, item[1]):
+                cell.text = text
+        else:
+            doc.add_paragraph(item)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return app.Document(buffer)
+
+@pytest.mark.parametrize('layout, expected', SECTION_LAYOUTS.values(), ids=SECTION_LAYOUTS.keys())
+def test_keywords_are_inserted_where_the_linear_scan_put_them(layout, expected):
+    doc = make_docx(layout)
+    before = [para.text for para in doc.paragraphs]
+    assert legacy_section_target(before) == expected
+
+    app.insert_keywords_into_sections(doc, ['Kubernetes'])
+    after = [para.text for para in doc.paragraphs]
+    changed = [i for i, text in enumerate(before) if after[i] != text]
+    if expected is None:
+        assert not changed
+        assert after[len(before):] == ['', 'Skills:', 'Kubernetes']
+    else:
+        assert changed == [expected]
+        assert after[expected].endswith('Kubernetes')
+    assert all(cell.text != 'Kubernetes' for table in doc.tables for cell in table._cells)
+
+# Aliases resolve to canonical keyword IDs, while extraction keeps the surface form the text used
+@pytest.mark.parametrize('surface, canonical', [('k8s', 'kubernetes'), ('K8s', 'kubernetes'), ('JS', 'javascript'),
+                                                ('golang', 'go'), ('Postgres', 'postgresql'), ('Python', 'python')])
+def test_aliases_canonicalize(surface, canonical):
+    assert app.canonicalize_keyword(surface) == canonical
+
+def test_extraction_keeps_the_surface_form_and_collapses_aliases():
+    app.keyword_cache.clear()
+    keywords = app.extract_technical_keywords_optimized('Deploy with K8s and JS, then Kubernetes and JavaScript again')
+    assert keywords == ('K8s', 'JS')
+
+def test_resume_alias_credits_the_job_keyword():
+    job_description = 'We need JavaScript and Kubernetes experience'
+    assert app.find_missing_keywords(app.extract_job_keywords_optimized(job_description), 'Built UIs in JS on k8s') == []
+    assert app.calculate_keyword_match_score_optimized('Built UIs in JS on k8s', job_description) == 100
+
+def test_ats_score_extracts_job_keywords_from_the_original_text(monkeypatch):
+    app.keyword_cache.clear()
+    app.ats_score_cache.clear()
+    texts = []
+    extract = app.extract_technical_keywords_optimized
+    monkeypatch.setattr(app, 'extract_technical_keywords_optimized', lambda text: texts.append(text) or extract(text))
+    job_description = 'Senior engineer: Python, Docker and AWS'
+    app.calculate_ats_score_optimized('Skills\nPython, Docker', job_description)
+    assert texts and set(texts) == {job_description}
+
+# Taxonomy reload: a new version swaps in and drops only the old version's cache entries,
+# a malformed file keeps the active taxonomy, and every outcome is reported
+@pytest.fixture
+def taxonomy_file(tmp_path, monkeypatch):
+    path = tmp_path / 'keyword_taxonomy.json'
+    with open(app.app.config['TAXONOMY_PATH'], encoding='utf-8') as f:
+        path.write_text(f.read(), encoding='utf-8')
+    monkeypatch.setitem(app.app.config, 'TAXONOMY_PATH', str(path))
+    monkeypatch.setitem(app.app.config, 'TAXONOMY_COMPILED_PATH', None)
+    monkeypatch.setitem(app.app.config, 'ADMIN_TOKEN', 'secret')
+    monkeypatch.setattr(app, 'keyword_taxonomy', app.keyword_taxonomy)  # Restored after the test
+    monkeypatch.setattr(app, 'taxonomy_state', dict(app.taxonomy_state))
+    return path
+
+def add_keyword(path, keyword):
+    data = json.loads(path.read_text(encoding='utf-8'))
+    data['technical_keywords']['programming_languages'].append(keyword)
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+def reload_taxonomy():
+    response = app.app.test_client().post('/taxonomy/reload', headers={'X-Admin-Token': 'secret'})
+    return response.status_code, response.get_json()
+
+def test_reload_with_a_new_version_invalidates_old_cache_entries(taxonomy_file):
+    old_version = app.keyword_taxonomy.version
+    app.analyze_paragraph('Wrote Zig and Python services')
+    app.paragraph_feature_cache[app.get_cache_key('paragraph@other', 'kept')] = (time.time(), {})
+    assert any(f'paragraph@{old_version}:' in key for key in app.paragraph_feature_cache)
+
+    add_keyword(taxonomy_file, 'zig')
+    status, body = reload_taxonomy()
+    assert (status, body['outcome']) == (200, 'reloaded')
+    assert body['version'] == app.keyword_taxonomy.version != old_version
+    assert not any(f'@{old_version}:' in key for key in app.paragraph_feature_cache)
+    assert app.get_cache_key('paragraph@other', 'kept') in app.paragraph_feature_cache
+    assert 'zig' in app.analyze_paragraph('Wrote Zig and Python services')['keyword_hits']
+
+    status, body = reload_taxonomy()
+    assert (status, body['outcome']) == (200, 'unchanged')
+
+def test_reload_keeps_the_active_taxonomy_when_the_file_is_malformed(taxonomy_file):
+    active = app.keyword_taxonomy
+    taxonomy_file.write_text('{"technical_keywords": ', encoding='utf-8')
+    status, body = reload_taxonomy()
+    assert (status, body['outcome']) == (500, 'failed')
+    assert 'Taxonomy reload failed' in body['error']
+    assert app.keyword_taxonomy is active and body['version'] == active.version
+    assert app.app.test_client().get('/taxonomy').get_json()['last_error'] == app.taxonomy_state['last_error']
+
+def test_reload_reports_keyword_tables_built_from_another_taxonomy(taxonomy_file, monkeypatch, caplog):
+    monkeypatch.setattr(app, 'keyword_table_sources', {'idf': app.keyword_taxonomy.version,
+                                                       'neighbours': app.keyword_taxonomy.version})
+    assert app.check_keyword_table_versions(app.keyword_taxonomy) == []
+
+    add_keyword(taxonomy_file, 'zig')
+    with caplog.at_level('WARNING', logger='app'):
+        assert reload_taxonomy()[1]['outcome'] == 'reloaded'
+    assert 'Keyword idf table was built from taxonomy' in caplog.text
+    assert app.app.test_client().get('/taxonomy').get_json()['stale_tables'] == ['idf', 'neighbours']
+
+# Prometheus export: label values are escaped, histogram buckets are cumulative across workers,
+# and snapshots of exited workers are dropped
+def worker_snapshot(pid, requests=(), histograms=(), alive=True):
+    return {'version': app.METRICS_SNAPSHOT_VERSION, 'pid': pid, 'requests': list(requests),
+            'histograms': list(histograms), 'caches': [], 'rss_bytes': 0, 'ready': True, 'memory_peaks': [],
+            'active_requests': 0, 'circuit_breakers': {}, 'alive': alive}
+
+def metric_lines(text, prefix):
+    return [line for line in text.splitlines() if line.startswith(prefix)]
+
+def test_render_prometheus_escapes_label_values():
+    text = app.render_prometheus([worker_snapshot(1, requests=[['/a"b\\c\nd', 'GET', 200, 3]])])
+    assert metric_lines(text, 'resume_requests_total{') == [
+        'resume_requests_total{endpoint="/a\\"b\\\\c\\nd",method="GET",status="200"} 3']
+
+def test_render_prometheus_buckets_are_cumulative_across_workers():
+    bounds = app.LatencyHistogram.BUCKET_BOUNDS_MS
+    first = worker_snapshot(1, histograms=[['/score', 'total', {0: 1, 3: 2, 9: 4}, 120.0, 7]])
+    second = worker_snapshot(2, histograms=[['/score', 'total', {'3': 1, '40': 1}, 80.0, 2]], alive=False)  # From JSON
+    lines = metric_lines(app.render_prometheus([first, second]), 'resume_request_duration_seconds_bucket')
+    counts = [int(line.rsplit(' ', 1)[1]) for line in lines]
+    expected = [sum(count for index, count in ((0, 1), (3, 3), (9, 4), (40, 1)) if index <= bound)
+                for bound in app.METRICS_EXPORT_BUCKETS]
+    assert counts == expected + [9]
+    assert counts == sorted(counts)
+    assert lines[0].startswith(f'resume_request_duration_seconds_bucket{{endpoint="/score",le="{bounds[3] / 1000:.6g}"}}')
+    assert lines[-1] == 'resume_request_duration_seconds_bucket{endpoint="/score",le="+Inf"} 9'
+    text = app.render_prometheus([first, second])
+    assert 'resume_request_duration_seconds_sum{endpoint="/score"} 0.200000' in text
+    assert 'resume_request_duration_seconds_count{endpoint="/score"} 9' in text
+
+def test_stale_worker_snapshots_are_deleted(tmp_path, monkeypatch):
+    monkeypatch.setitem(app.app.config, 'METRICS_DIR', str(tmp_path))
+    monkeypatch.setitem(app.app.config, 'METRICS_FLUSH_INTERVAL', 1.0)
+    fresh = tmp_path / 'worker_101_1000.json'
+    stale = tmp_path / 'worker_101_500.json'  # The same PID, reused by an earlier worker
+    for path in (fresh, stale):
+        path.write_text(json.dumps(worker_snapshot(101, requests=[['/x', 'GET', 200, 1]])), encoding='utf-8')
+    old = time.time() - app.METRICS_STALE_INTERVALS - 1
+    os.utime(stale, (old, old))
+
+    snapshots = app.read_host_metrics()
+    assert [snapshot['pid'] for snapshot in snapshots] == [os.getpid(), 101]
+    assert fresh.exists() and not stale.exists()
+
+    app.write_worker_metrics()
+    assert (tmp_path / app.metrics_snapshot_name()).exists()
+    assert app.metrics_snapshot_name().startswith(f'worker_{os.getpid()}_')
+
+# Admission control: a request rejected at capacity never took a slot, so it must not give one back
+def test_rejected_request_does_not_release_a_slot(monkeypatch):
+    monkeypatch.setitem(app.app.config, 'MAX_CONCURRENT_REQUESTS', 1)
+    monkeypatch.setattr(app, 'active_requests', 1)  # One request already in flight
+    handler = app.timeout_handler(5)(lambda: ('done', 200))
+    with app.app.test_request_context():
+        for _ in range(3):
+            response, status = handler()
+            assert status == 503
+        assert app.active_requests == 1
+
+        app.active_requests = 0
+        assert handler() == ('done', 200)
+        assert app.active_requests == 0
+
+# The compiled taxonomy is plain JSON: it rebuilds the same taxonomy, and anything that does not
+# match the data file (stale, truncated, or not JSON at all) is ignored and recompiled
+def test_compiled_taxonomy_round_trips(tmp_path):
+    compiled_path = tmp_path / 'taxonomy.compiled.json'
+    built = app.load_keyword_taxonomy(app.app.config['TAXONOMY_PATH'], str(compiled_path))
+    loaded = app.load_keyword_taxonomy(app.app.config['TAXONOMY_PATH'], str(compiled_path))
+    assert json.loads(compiled_path.read_text(encoding='utf-8'))['stamp'][0] == built.version
+    assert loaded.compiled_form() == built.compiled_form()
+    assert loaded.canonical == built.canonical and loaded.version == built.version
+    assert loaded.fuzzy_index.lookup('kubernets') == 'kubernetes'
+
+@pytest.mark.parametrize('contents', [b'\x80\x04\x95not json', b'{"stamp": ["other", "code", [3, 0]]}', b'{"stamp": '])
+def test_unusable_compiled_taxonomy_is_recompiled(tmp_path, contents):
+    compiled_path = tmp_path / 'taxonomy.compiled.json'
+    compiled_path.write_bytes(contents)
+    taxonomy = app.load_keyword_taxonomy(app.app.config['TAXONOMY_PATH'], str(compiled_path))
+    assert taxonomy.compiled_form() == app.keyword_taxonomy.compiled_form()
+    assert json.loads(compiled_path.read_text(encoding='utf-8'))['stamp'] == app.compiled_taxonomy_stamp(taxonomy.version)
+
+# Failure classification: each kind maps to its status, and only transient failures are retried
+@pytest.mark.parametrize('error, kind', [
+    (app.BadInputError('not a docx'), 'bad_input'),
+    (app.DeadlineExceededError('too slow'), 'deadline'),
+    (app.TransientError('busy'), 'transient'),
+    (TimeoutError('read timed out'), 'transient'),
+    (ConnectionResetError('reset by peer'), 'transient'),
+    (BlockingIOError(errno.EAGAIN, 'try again'), 'transient'),
+    (OSError(errno.EMFILE, 'too many open files'), 'transient'),
+    (FileNotFoundError(errno.ENOENT, 'missing'), 'internal'),
+    (PermissionError(errno.EACCES, 'denied'), 'internal'),
+    (IsADirectoryError(errno.EISDIR, 'a directory'), 'internal'),
+    (OSError(errno.ENOSPC, 'disk full'), 'internal'),
+    (ValueError('bug'), 'internal'),
+])
+def test_error_kind(error, kind):
+    assert app.error_kind(error) == kind
+
+@pytest.mark.parametrize('error, status', [
+    (app.BadInputError('not a docx'), 400),
+    (app.DeadlineExceededError('too slow'), 408),
+    (app.TransientError('busy'), 503),
+    (app.ProcessingError('broken'), 500),
+    (FileNotFoundError(errno.ENOENT, 'missing'), 500),
+    (ValueError('bug'), 500),
+])
+def test_failure_status(error, status):
+    def handler():
+        raise error
+    with app.app.test_request_context():
+        response, response_status = app.timeout_handler(5)(handler)()
+    assert response_status == status
+
+def failing(error, failures):
+    calls = []
+    def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error
+        return 'done'
+    return func, calls
+
+@pytest.mark.parametrize('error', [ConnectionResetError('reset'), TimeoutError('timed out'),
+                                   BlockingIOError(errno.EAGAIN, 'try again'), app.TransientError('busy')])
+def test_transient_failures_are_retried(error):
+    func, calls = failing(error, 2)
+    assert app.retry_with_backoff(func, max_retries=3, base_delay=0) == 'done'
+    assert len(calls) == 3
+
+def test_transient_failures_give_up_as_transient():
+    func, calls = failing(ConnectionResetError('reset'), 5)
+    with pytest.raises(app.TransientError):
+        app.retry_with_backoff(func, max_retries=3, base_delay=0)
+    assert len(calls) == 3
+
+@pytest.mark.parametrize('error', [app.BadInputError('not a docx'), app.DeadlineExceededError('too slow'),
+                                   FileNotFoundError(errno.ENOENT, 'missing'), PermissionError(errno.EACCES, 'denied'),
+                                   IsADirectoryError(errno.EISDIR, 'a directory'), ValueError('bug')])
+def test_other_failures_are_not_retried(error):
+    func, calls = failing(error, 1)
+    with pytest.raises(type(error)):
+        app.retry_with_backoff(func, max_retries=3, base_delay=0)
+    assert len(calls) == 1
+
+# Circuit breakers, on a fake clock: the rolling window trips them, a trial after recovery_timeout
+# decides whether they close, and only internal failures count against a stage
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def breaker(clock):
+    return app.CircuitBreaker('test', failure_rate=0.5, min_calls=4, window_seconds=10, recovery_timeout=30,
+                              half_open_max_calls=2, clock=clock)
+
+def succeed(breaker):
+    breaker.call(lambda: None)
+
+def fail(breaker, error=None):
+    def func():
+        raise error or ValueError('bug')
+    with pytest.raises(Exception):
+        breaker.call(func)
+
+def trip(breaker):
+    for _ in range(breaker.min_calls):
+        fail(breaker)
+    assert breaker.state == 'OPEN'
+
+def test_breaker_opens_at_failure_rate():
+    breaker = app.CircuitBreaker('test', failure_rate=0.5, min_calls=4, clock=FakeClock())
+    succeed(breaker)
+    succeed(breaker)
+    fail(breaker)
+    assert breaker.state == 'CLOSED'  # 3 calls: below min_calls
+    fail(breaker)
+    assert breaker.state == 'OPEN'
+    with pytest.raises(app.CircuitOpenError):
+        succeed(breaker)
+    assert breaker.snapshot()['rejections'] == 1
+
+def test_breaker_stays_closed_below_failure_rate(breaker):
+    for _ in range(3):
+        succeed(breaker)
+    fail(breaker)
+    fail(breaker)
+    assert breaker.state == 'CLOSED'  # 2 of 5 failed
+
+def test_breaker_window_forgets_old_failures(breaker, clock):
+    fail(breaker)
+    fail(breaker)
+    clock.advance(10)
+    assert breaker.snapshot()['window_calls'] == 0
+    succeed(breaker)
+    succeed(breaker)
+    succeed(breaker)
+    fail(breaker)
+    assert breaker.state == 'CLOSED'  # 1 of 4 in the window; 3 of 6 counting the expired ones
+
+def test_breaker_half_opens_after_recovery_timeout(breaker, clock):
+    trip(breaker)
+    clock.advance(29)
+    assert not breaker.allows_requests()
+    with pytest.raises(app.CircuitOpenError):
+        succeed(breaker)
+    clock.advance(1)
+    assert breaker.allows_requests()
+    assert breaker.acquire() is True
+    assert breaker.state == 'HALF_OPEN'
+
+def test_breaker_limits_half_open_trials(breaker, clock):
+    trip(breaker)
+    clock.advance(30)
+    assert breaker.acquire() and breaker.acquire()
+    with pytest.raises(app.CircuitOpenError):
+        breaker.acquire()
+    breaker.record(None, True)
+    with pytest.raises(app.CircuitOpenError):
+        breaker.acquire()  # A success still counts towards the limit
+    breaker.record(None, True)
+    assert breaker.state == 'CLOSED'
+    assert breaker.snapshot()['window_calls'] == 0
+    assert breaker.transitions == {'OPEN': 1, 'HALF_OPEN': 1, 'CLOSED': 1}
+
+def test_breaker_reopens_on_failed_trial(breaker, clock):
+    trip(breaker)
+    clock.advance(30)
+    fail(breaker)
+    assert breaker.state == 'OPEN'
+    clock.advance(29)
+    with pytest.raises(app.CircuitOpenError):
+        succeed(breaker)  # The recovery timeout restarts from the failed trial
+    clock.advance(1)
+    succeed(breaker)
+    succeed(breaker)
+    assert breaker.state == 'CLOSED'
+
+@pytest.mark.parametrize('error', [app.BadInputError('not a docx'), app.DeadlineExceededError('too slow'),
+                                   app.TransientError('busy'), ConnectionResetError('reset')])
+def test_breaker_ignores_failures_that_are_not_internal(breaker, clock, error):
+    for _ in range(10):
+        fail(breaker, error)
+    assert breaker.state == 'CLOSED'
+    assert breaker.snapshot()['window_calls'] == 0
+    trip(breaker)
+    clock.advance(30)
+    fail(breaker, error)
+    assert breaker.state == 'HALF_OPEN'  # The trial proved nothing and gave its slot back
+    succeed(breaker)
+    succeed(breaker)
+    assert breaker.state == 'CLOSED'
+
+def test_guarded_stage_uses_the_stage_breaker(monkeypatch, breaker):
+    monkeypatch.setitem(app.stage_circuit_breakers, 'score', breaker)
+    trip(breaker)
+    with pytest.raises(app.CircuitOpenError):
+        with app.guarded_stage('rescore'):
+            pass
+    with app.guarded_stage('parse'):
+        pass
+    assert breaker.rejections == 1
+
+# Readiness: only the parse breaker takes the worker out of rotation; other open breakers degrade it
+@pytest.mark.parametrize('stage, status', [('parse', 503), ('score', 200), ('serialize', 200)])
+def test_ready_with_open_breaker(monkeypatch, breaker, stage, status):
+    ready_event = app.threading.Event()
+    ready_event.set()
+    monkeypatch.setattr(app, 'ready_event', ready_event)
+    monkeypatch.setitem(app.stage_circuit_breakers, stage, breaker)
+    trip(breaker)
+    response = app.app.test_client().get('/ready')
+    assert response.status_code == status
+    body = response.get_json()
+    assert body['checks']['circuit_breakers'] == (stage != 'parse')
+    assert body['degraded_stages'] == [stage]
+    assert body['circuit_breakers'][stage] == 'OPEN'